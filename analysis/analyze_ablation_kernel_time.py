@@ -15,9 +15,34 @@ import os
 import re
 import sys
 import csv
+import heapq
+from array import array
 from pathlib import Path
 import argparse
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+
+# Header, pytest id and Triton-Viz timing scans, merged by offset in parse_triton_sanitizer
+# Header lines written by the test runners, e.g. "Test Number: 01" / "Test: tritonbench/softmax_optimize"
+_RE_HEADER = re.compile(rb'Test(?: Number:[ \t]+(?P<number>\d+)|:[ \t]+(?P<name>[^\r\n]+))')
+# pytest node ids, e.g. test_fused_linear_jsd.py::test_correctness_functional[...]
+_RE_PYTEST = re.compile(rb'(?P<pytest>test_\w+\.py::\S+)')
+# Triton-Viz: execution time for _jsd_kernel: 3.326 ms
+_RE_TRITON_VIZ = re.compile(rb'Triton-Viz:\s+execution time for\s+(?P<kernel>\S+):\s+(?P<time>[\d.]+)\s+ms')
+
+# Numbered log file name from runner.py, e.g. 001_liger_kernel_test_rope.log
+_RE_LOG_FILE = re.compile(r'^(\d+)_(.+)\.log$')
+# First number in a log file name, e.g. "01_" in 01_test.log (not anchored)
+_RE_LEADING_NUM = re.compile(r'(\d+)_')
+# Number prefix of a test name, e.g. "01_" in 01_tritonbench/softmax_optimize
+_RE_NUM_PREFIX = re.compile(r'^\d+_')
+
+
+def _decode(raw):
+    """Decode a captured log field, dropping invalid UTF-8 like the old text-mode reads."""
+    return raw.decode('utf-8', errors='ignore')
 
 
 def parse_triton_sanitizer(log_file):
@@ -28,47 +53,59 @@ def parse_triton_sanitizer(log_file):
     Triton-Viz: execution time for _jsd_kernel: 3.326 ms
 
     Returns:
-        dict: {test_name: [list of execution_time values], ...}
+        dict: {test_name: {'times': array('d') of execution times in ms,
+                           'kernels': [kernel name per time]}, ...}
     """
-    pattern = r'Triton-Viz:\s+execution time for\s+(\S+):\s+([\d.]+)\s+ms'
-
-    results = defaultdict(list)
+    results = defaultdict(lambda: {'times': array('d'), 'kernels': []})
     test_name = None
     test_number = None
 
     try:
-        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                # Extract test number from header
-                # Example: Test Number: 01
-                number_match = re.search(r'Test Number:\s+(\d+)', line)
-                if number_match:
-                    test_number = number_match.group(1)
-
-                # Extract test name from header
-                # Example: Test: tritonbench/softmax_optimize
-                name_match = re.search(r'Test:\s+(.+)', line)
-                if name_match:
-                    test_name = name_match.group(1).strip()
-                    # If we have both number and name, create a combined key
-                    if test_number and test_name:
-                        test_name = f"{test_number}_{test_name}"
-
-                # Also support pytest format
-                # Example: test_fused_linear_jsd.py::test_correctness_functional[...]
-                pytest_match = re.search(r'(test_\w+\.py::\S+)', line)
-                if pytest_match:
-                    test_name = pytest_match.group(1)
-
-                # Extract execution time
-                match = re.search(pattern, line)
-                if match and test_name:
-                    kernel_name = match.group(1)
-                    exec_time = float(match.group(2))
-                    results[test_name].append({
-                        'kernel': kernel_name,
-                        'exec_time_ms': exec_time
-                    })
+        with open(log_file, 'rb') as f:
+            content = f.read()
+
+        # Nothing is recorded before the first timing line, so a log without
+        # one needs no scan and the timing scan can start there. Headers before
+        # it still have to be seen to know which test the timings belong to.
+        first_timing = content.find(b'Triton-Viz:')
+        if first_timing < 0:
+            return results
+
+        matches = heapq.merge(
+            _RE_HEADER.finditer(content),
+            _RE_PYTEST.finditer(content),
+            _RE_TRITON_VIZ.finditer(content, first_timing),
+            key=re.Match.start,
+        )
+        for match in matches:
+            kind = match.lastgroup
+
+            # Extract execution time
+            # Example: Triton-Viz: execution time for _jsd_kernel: 3.326 ms
+            if kind == 'time':
+                if not test_name:
+                    continue
+                entry = results[test_name]
+                entry['times'].append(float(match['time']))
+                entry['kernels'].append(_decode(match['kernel']))
+
+            # Also support pytest format
+            # Example: test_fused_linear_jsd.py::test_correctness_functional[...]
+            elif kind == 'pytest':
+                test_name = _decode(match['pytest'])
+
+            # Extract test number from header
+            # Example: Test Number: 01
+            elif kind == 'number':
+                test_number = match['number'].decode('ascii')
+
+            # Extract test name from header
+            # Example: Test: tritonbench/softmax_optimize
+            else:
+                test_name = _decode(match['name']).strip()
+                # If we have both number and name, create a combined key
+                if test_number and test_name:
+                    test_name = f"{test_number}_{test_name}"
     except FileNotFoundError:
         print(f"Warning: File not found: {log_file}")
         return {}
@@ -79,6 +116,22 @@ def parse_triton_sanitizer(log_file):
     return results
 
 
+def _sum_triton_sanitizer_times(log_file):
+    """
+    Sum the Triton-Viz execution times of a triton-sanitizer log file.
+
+    Returns:
+        tuple: (total_ms, count) over all tests in the file
+    """
+    total_ms = 0.0
+    count = 0
+    for entry in parse_triton_sanitizer(log_file).values():
+        for exec_time in entry['times']:
+            total_ms += exec_time
+        count += len(entry['times'])
+    return total_ms, count
+
+
 def find_log_files(output_dir, config_name):
     """
     Find all log files for a given configuration.
@@ -109,31 +162,48 @@ def find_log_files(output_dir, config_name):
     if config_path is None:
         return []
 
-    # Look for log files in the configuration directory
-    log_files = []
-
-    # Check for run.log
-    run_log = config_path / "run.log"
-    if run_log.exists():
-        log_files.append(run_log)
-
-    # Check for other log files (numbered logs from runner.py)
-    for pattern in ['*.log', '**/*.log']:
-        log_files.extend(config_path.glob(pattern))
-
-    # Remove duplicates
-    log_files = list(set(log_files))
-
     # Sort by file number (extract number from filename like "01_test.log")
     def extract_number(path):
-        match = re.search(r'(\d+)_', path.name)
+        match = _RE_LEADING_NUM.search(path.name)
         if match:
             return int(match.group(1))
         return float('inf')  # Put files without numbers at the end
 
-    log_files.sort(key=extract_number)
+    # Look for log files in the configuration directory. A single recursive
+    # glob covers run.log and the numbered logs from runner.py, with no duplicates.
+    # Ties are broken by name so the order does not depend on directory listing order.
+    return sorted(config_path.rglob('*.log'), key=lambda path: (extract_number(path), path.name))
+
 
-    return log_files
+def _parse_one_log(log_file):
+    """
+    Parse one numbered log file and sum its kernel execution times.
+
+    Top-level so it can be sent to ProcessPoolExecutor workers.
+
+    Args:
+        log_file: Path of a log file named like "001_test_name.log"
+
+    Returns:
+        tuple: (file_number, {'file_name': str, 'total_ms': float, 'count': int}),
+        or None if the file name has no number prefix
+    """
+    # Extract file number from filename
+    match = _RE_LOG_FILE.match(log_file.name)
+    if not match:
+        return None
+
+    file_number = int(match.group(1))
+    base_name = match.group(2)
+
+    # Sum all execution times from this file
+    total_ms, total_count = _sum_triton_sanitizer_times(log_file)
+
+    return file_number, {
+        'file_name': base_name,
+        'total_ms': total_ms,
+        'count': total_count
+    }
 
 
 def analyze_configuration(output_dir, config_name):
@@ -156,36 +226,20 @@ def analyze_configuration(output_dir, config_name):
 
     print(f"  Found {len(log_files)} log file(s)")
 
-    # Parse each log file and calculate total time per file
+    # Parse each log file and calculate total time per file. Files are
+    # independent, so they are parsed in a process pool; map() yields results
+    # in file order, so progress output matches the serial version.
     file_totals = {}
 
-    for log_file in log_files:
-        print(f"    Parsing: {log_file.name}")
-
-        # Extract file number from filename
-        match = re.search(r'^(\d+)_(.+)\.log$', log_file.name)
-        if not match:
-            continue
-
-        file_number = int(match.group(1))
-        base_name = match.group(2)
-
-        # Parse all execution times in this file
-        results = parse_triton_sanitizer(log_file)
+    max_workers = min(len(log_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for log_file, parsed in zip(log_files, executor.map(_parse_one_log, log_files)):
+            print(f"    Parsing: {log_file.name}")
+            if parsed is None:
+                continue
 
-        # Sum all execution times from this file
-        total_ms = 0.0
-        total_count = 0
-        for test_name, measurements in results.items():
-            for m in measurements:
-                total_ms += m['exec_time_ms']
-                total_count += 1
-
-        file_totals[file_number] = {
-            'file_name': base_name,
-            'total_ms': total_ms,
-            'count': total_count
-        }
+            file_number, data = parsed
+            file_totals[file_number] = data
 
     return file_totals
 
@@ -233,6 +287,7 @@ def print_results(config_name, file_totals):
     print(f"  Average per File: {grand_total / len(file_totals):.3f} ms" if file_totals else "")
 
 
+@lru_cache(maxsize=None)
 def normalize_test_name(test_name):
     """
     Normalize test name by removing parametrization details and file number prefix.
@@ -252,7 +307,7 @@ def normalize_test_name(test_name):
         test_name = test_name[:test_name.index('[')]
 
     # Remove number prefix: 01_test_name -> test_name
-    test_name = re.sub(r'^\d+_', '', test_name)
+    test_name = _RE_NUM_PREFIX.sub('', test_name)
 
     return test_name
 
@@ -284,6 +339,7 @@ def aggregate_by_function(totals_dict):
     return dict(aggregated)
 
 
+@lru_cache(maxsize=None)
 def format_test_name(file_name):
     """
     Convert file name to formatted test name with slashes.
@@ -326,13 +382,10 @@ def format_test_name(file_name):
     # For liger_kernel and flag_gems, split by test_ patterns
     # Find all positions where 'test_' starts
     test_positions = []
-    i = 0
-    while i < len(remainder):
-        if remainder[i:].startswith('test_'):
-            test_positions.append(i)
-            i += 5  # Skip past 'test_'
-        else:
-            i += 1
+    pos = remainder.find('test_')
+    while pos >= 0:
+        test_positions.append(pos)
+        pos = remainder.find('test_', pos + 5)  # Skip past 'test_'
 
     if len(test_positions) == 0:
         # No test_ found, just return repo/remainder
@@ -381,7 +434,7 @@ def export_to_csv(output_dir, config_results, csv_filename):
     # Sort by file number
     sorted_file_numbers = sorted(all_file_numbers)
 
-    # Prepare CSV data - one row per log file
+    # Prepare CSV data - one row tuple per log file, in fieldnames order
     csv_data = []
     for file_number in sorted_file_numbers:
         # Get the file name from the first available config
@@ -397,23 +450,23 @@ def export_to_csv(output_dir, config_results, csv_filename):
 
         # Format the test name with slashes
         formatted_name = format_test_name(file_name)
-        row = {'Test_Name': formatted_name}
 
         # Add timing data for each configuration
+        row = [formatted_name]
         for config_name in config_names:
             file_totals = config_results.get(config_name, {})
             time_ms = file_totals.get(file_number, {}).get('total_ms', 0.0)
-            row[f'ablation_kernel_time_{config_name}'] = f"{time_ms:.3f}"
+            row.append(f"{time_ms:.3f}")
 
-        csv_data.append(row)
+        csv_data.append(tuple(row))
 
     # Write CSV file
     csv_path = Path(output_dir) / csv_filename
     try:
         fieldnames = ['Test_Name'] + [f'ablation_kernel_time_{name}' for name in config_names]
         with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
             writer.writerows(csv_data)
 
         print(f"\n✓ CSV exported to: {csv_path}")
@@ -10,68 +10,92 @@ import os
 import re
 import sys
 import csv
+import hashlib
+import heapq
+import pickle
 from pathlib import Path
 import argparse
 from collections import defaultdict
-
-
-def parse_baseline_compute_sanitizer(log_file):
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
+
+
+# Each log is read once and scanned with re.finditer over the raw bytes. Every
+# pattern starts with a literal, so the engine can jump straight to candidate
+# offsets; the three scans are merged by match offset to replay the log in order.
+# (A single alternation of all patterns loses that prefix search and is slower.)
+# Header lines written by the test runners, e.g. "Test Number: 01" / "Test: tritonbench/softmax_optimize"
+_RE_HEADER = re.compile(rb'Test(?: Number:[ \t]+(?P<number>\d+)|:[ \t]+(?P<name>[^\r\n]+))')
+# pytest node ids, e.g. test_fused_linear_jsd.py::test_correctness_functional[...]
+_RE_PYTEST = re.compile(rb'(?P<pytest>test_\w+\.py::\S+)')
+# Numeric fields use \d+(?:\.\d+)? rather than [\d.]+ and kernel names stop at '['
+# (or ':') so a malformed or very long line cannot make the engine backtrack.
+# Both kernel trace formats, matched by a single alternation:
+#   [liger][triton] kernel=_jsd_kernel cpu_launch_ms=3.136 gpu_time_ms=119.417
+#   [triton-profiler] kernel=matmul_kernel [M=256, N=256, K=128] cpu_launch_ms=0.037 gpu_time_ms=0.029
+_RE_KERNEL_TRACE = re.compile(
+    rb'\[(?:liger\]\[triton|triton-profiler)\]\s+kernel=(?P<kernel>[^\s\[]+)(?:\s+\[[^\]]*\])?'
+    rb'\s+cpu_launch_ms=\d+(?:\.\d+)?\s+gpu_time_ms=(?P<time>\d+(?:\.\d+)?)'
+)
+# Triton-Viz: execution time for _jsd_kernel: 3.326 ms
+_RE_TRITON_VIZ = re.compile(
+    rb'Triton-Viz:\s+execution time for\s+(?P<kernel>[^\s:]+):\s+(?P<time>\d+(?:\.\d+)?)\s+ms'
+)
+
+# Numbered test prefix, e.g. "01_" in 01_tritonbench/softmax_optimize
+_RE_NUM_PREFIX = re.compile(r'^(\d+)_')
+# First number in a log file name, e.g. "01_" in 01_test.log; not anchored, so
+# names like run_01_test.log sort by their number too
+_RE_FILE_NUM = re.compile(r'(\d+)_')
+
+
+@lru_cache(maxsize=None)
+def _file_number(name):
+    """Number of a log file name (01_test.log -> 1), inf if there is none."""
+    match = _RE_FILE_NUM.search(name)
+    if match:
+        return int(match.group(1))
+    return float('inf')
+
+
+@lru_cache(maxsize=None)
+def _test_number(name):
+    """Leading number of a test name (01_tritonbench/softmax_optimize -> 1), inf if there is none."""
+    match = _RE_NUM_PREFIX.match(name)
+    if match:
+        return int(match.group(1))
+    return float('inf')
+
+
+def _decode(raw):
+    """Decode a captured log field, dropping invalid UTF-8 like the old text-mode reads."""
+    return raw.decode('utf-8', errors='ignore')
+
+
+def _scan_log(log_file, pattern, time_key, keep_measurements):
     """
-    Parse baseline or compute-sanitizer log file for gpu_time_ms.
+    Scan one log file for test headers and pattern matches, accumulating
+    per-test kernel times.
 
-    Supports two formats:
-    1. [liger][triton] kernel=_jsd_kernel cpu_launch_ms=3.136 gpu_time_ms=119.417
-    2. [triton-profiler] kernel=softmax_kernel_online_v2 cpu_launch_ms=0.037 gpu_time_ms=0.029
+    Args:
+        log_file: path to the log file
+        pattern: _RE_KERNEL_TRACE or _RE_TRITON_VIZ
+        time_key: key for the time value in kept measurements
+        keep_measurements: also keep the per-kernel records
 
     Returns:
-        dict: {test_name: [list of gpu_time_ms values], ...}
+        dict: {test_name: {'total_ms': float, 'count': int[, 'measurements': list]}, ...}
     """
-    # Support both [liger][triton] and [triton-profiler] formats
-    # Pattern1 handles [liger][triton] format
-    pattern1 = r'\[liger\]\[triton\]\s+kernel=(\S+)\s+cpu_launch_ms=[\d.]+\s+gpu_time_ms=([\d.]+)'
-    # Pattern2 handles [triton-profiler] format with optional kernel parameters like [M=256, N=256, K=128]
-    pattern2 = r'\[triton-profiler\]\s+kernel=(\S+)(?:\s+\[.*?\])?\s+cpu_launch_ms=[\d.]+\s+gpu_time_ms=([\d.]+)'
-
-    results = defaultdict(list)
+    measurements = defaultdict(list)
+    totals_ms = defaultdict(float)
+    counts = defaultdict(int)
     test_name = None
     test_number = None
 
     try:
-        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                # Extract test number from header
-                # Example: Test Number: 01
-                number_match = re.search(r'Test Number:\s+(\d+)', line)
-                if number_match:
-                    test_number = number_match.group(1)
-
-                # Extract test name from header
-                # Example: Test: tritonbench/softmax_optimize
-                name_match = re.search(r'Test:\s+(.+)', line)
-                if name_match:
-                    test_name = name_match.group(1).strip()
-                    # If we have both number and name, create a combined key
-                    if test_number and test_name:
-                        test_name = f"{test_number}_{test_name}"
-
-                # Also support pytest format
-                # Example: test_fused_linear_jsd.py::test_correctness_functional[...]
-                pytest_match = re.search(r'(test_\w+\.py::\S+)', line)
-                if pytest_match:
-                    test_name = pytest_match.group(1)
-
-                # Extract gpu_time_ms - try both patterns
-                match = re.search(pattern1, line)
-                if not match:
-                    match = re.search(pattern2, line)
-
-                if match and test_name:
-                    kernel_name = match.group(1)
-                    gpu_time = float(match.group(2))
-                    results[test_name].append({
-                        'kernel': kernel_name,
-                        'gpu_time_ms': gpu_time
-                    })
+        with open(log_file, 'rb') as f:
+            data = f.read()
     except FileNotFoundError:
         print(f"Warning: File not found: {log_file}")
         return {}
@@ -79,84 +103,152 @@ def parse_baseline_compute_sanitizer(log_file):
         print(f"Error parsing {log_file}: {e}")
         return {}
 
-    return results
+    matches = heapq.merge(
+        _RE_HEADER.finditer(data),
+        _RE_PYTEST.finditer(data),
+        pattern.finditer(data),
+        key=re.Match.start,
+    )
+    for match in matches:
+        kind = match.lastgroup
+
+        if kind == 'time':
+            if test_name:
+                value = float(match['time'])
+                totals_ms[test_name] += value
+                counts[test_name] += 1
+                if keep_measurements:
+                    measurements[test_name].append({
+                        'kernel': _decode(match['kernel']),
+                        time_key: value
+                    })
+        elif kind == 'pytest':
+            test_name = _decode(match['pytest'])
+        elif kind == 'number':
+            test_number = match['number'].decode('ascii')
+        else:
+            test_name = _decode(match['name']).strip()
+            # If we have both number and name, create a combined key
+            if test_number and test_name:
+                test_name = f"{test_number}_{test_name}"
+
+    totals = {}
+    for test_name, total in totals_ms.items():
+        totals[test_name] = {'total_ms': total, 'count': counts[test_name]}
+        if keep_measurements:
+            totals[test_name]['measurements'] = measurements[test_name]
+    return totals
 
 
-def parse_triton_sanitizer(log_file):
+# Parsed per-file results are pickled here, keyed on the file's path, size and
+# mtime, so re-running the analysis over unchanged logs skips parsing.
+# Bump _CACHE_VERSION whenever the parsers' output changes.
+_CACHE_DIR = Path.home() / ".cache" / "asplos_analyze"
+_CACHE_VERSION = 1
+
+
+def _parse_log_cached(log_file, parse_log, keep_measurements):
     """
-    Parse triton-sanitizer log file for execution time.
+    Run parse_log on log_file, reusing a cached result while the file is unchanged.
 
-    Example line:
-    Triton-Viz: execution time for _jsd_kernel: 3.326 ms
+    Args:
+        log_file: path to the log file
+        parse_log: parse_baseline_compute_sanitizer or parse_triton_sanitizer
+        keep_measurements: forwarded to parse_log (part of the cache key)
 
     Returns:
-        dict: {test_name: [list of execution_time values], ...}
+        dict: same as parse_log
     """
-    pattern = r'Triton-Viz:\s+execution time for\s+(\S+):\s+([\d.]+)\s+ms'
+    try:
+        stat = os.stat(log_file)
+    except OSError:
+        return parse_log(log_file, keep_measurements)
 
-    results = defaultdict(list)
-    test_name = None
-    test_number = None
+    key = (_CACHE_VERSION, parse_log.__name__, keep_measurements,
+           str(Path(log_file).resolve()), stat.st_size, stat.st_mtime_ns)
+    cache_file = _CACHE_DIR / f"{hashlib.sha256(repr(key).encode()).hexdigest()}.pkl"
 
     try:
-        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                # Extract test number from header
-                # Example: Test Number: 01
-                number_match = re.search(r'Test Number:\s+(\d+)', line)
-                if number_match:
-                    test_number = number_match.group(1)
-
-                # Extract test name from header
-                # Example: Test: tritonbench/softmax_optimize
-                name_match = re.search(r'Test:\s+(.+)', line)
-                if name_match:
-                    test_name = name_match.group(1).strip()
-                    # If we have both number and name, create a combined key
-                    if test_number and test_name:
-                        test_name = f"{test_number}_{test_name}"
-
-                # Also support pytest format
-                # Example: test_fused_linear_jsd.py::test_correctness_functional[...]
-                pytest_match = re.search(r'(test_\w+\.py::\S+)', line)
-                if pytest_match:
-                    test_name = pytest_match.group(1)
-
-                # Extract execution time
-                match = re.search(pattern, line)
-                if match and test_name:
-                    kernel_name = match.group(1)
-                    exec_time = float(match.group(2))
-                    results[test_name].append({
-                        'kernel': kernel_name,
-                        'exec_time_ms': exec_time
-                    })
-    except FileNotFoundError:
-        print(f"Warning: File not found: {log_file}")
-        return {}
-    except Exception as e:
-        print(f"Error parsing {log_file}: {e}")
-        return {}
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    results = parse_log(log_file, keep_measurements)
+
+    # Write via a temp file so concurrent workers never read a partial pickle
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
 
     return results
 
 
+def parse_baseline_compute_sanitizer(log_file, keep_measurements=True):
+    """
+    Parse baseline or compute-sanitizer log file for gpu_time_ms.
+
+    Supports two formats:
+    1. [liger][triton] kernel=_jsd_kernel cpu_launch_ms=3.136 gpu_time_ms=119.417
+    2. [triton-profiler] kernel=softmax_kernel_online_v2 cpu_launch_ms=0.037 gpu_time_ms=0.029
+
+    Totals are accumulated during a single finditer pass over the file, so no
+    second pass over the measurements is needed.
+
+    Args:
+        log_file: path to the log file
+        keep_measurements: also keep the per-kernel gpu_time_ms records
+
+    Returns:
+        dict: {test_name: {'total_ms': float, 'count': int[, 'measurements': list]}, ...}
+    """
+    return _scan_log(log_file, _RE_KERNEL_TRACE, 'gpu_time_ms', keep_measurements)
+
+
+def parse_triton_sanitizer(log_file, keep_measurements=True):
+    """
+    Parse triton-sanitizer log file for execution time.
+
+    Example line:
+    Triton-Viz: execution time for _jsd_kernel: 3.326 ms
+
+    Totals are accumulated during a single finditer pass over the file, so no
+    second pass over the measurements is needed.
+
+    Args:
+        log_file: path to the log file
+        keep_measurements: also keep the per-kernel execution_time records
+
+    Returns:
+        dict: {test_name: {'total_ms': float, 'count': int[, 'measurements': list]}, ...}
+    """
+    return _scan_log(log_file, _RE_TRITON_VIZ, 'exec_time_ms', keep_measurements)
+
+
 def calculate_totals(results, time_key='gpu_time_ms'):
     """
-    Calculate total time for each test.
+    Calculate total time for each test from per-kernel measurement lists.
+
+    The parse functions already return running totals; this is only needed
+    for {test_name: [measurement dicts]} mappings such as their 'measurements'.
 
     Args:
-        results: dict from parse functions
+        results: dict of {test_name: [measurement dicts]}
         time_key: key to sum ('gpu_time_ms' or 'exec_time_ms')
 
     Returns:
         dict: {test_name: total_time_ms, ...}
     """
+    get_time = itemgetter(time_key)
     totals = {}
     for test_name, measurements in results.items():
-        total = sum(m[time_key] for m in measurements)
         totals[test_name] = {
-            'total_ms': total,
+            'total_ms': sum(map(get_time, measurements)),
             'count': len(measurements)
         }
     return totals
@@ -194,34 +286,19 @@ def find_log_files(output_dir, config_name):
     if config_path is None:
         return []
 
-    # Look for log files in the configuration directory
-    log_files = []
-
-    # Check for run.log
-    run_log = config_path / "run.log"
-    if run_log.exists():
-        log_files.append(run_log)
-
-    # Check for other log files (numbered logs from runner.py)
-    for pattern in ['*.log', '**/*.log']:
-        log_files.extend(config_path.glob(pattern))
+    # Look for log files in the configuration directory (run.log and the
+    # numbered logs from runner.py); rglob already covers the top level.
+    log_files = list(config_path.rglob('*.log'))
 
-    # Remove duplicates
-    log_files = list(set(log_files))
-
-    # Sort by file number (extract number from filename like "01_test.log")
-    def extract_number(path):
-        match = re.search(r'(\d+)_', path.name)
-        if match:
-            return int(match.group(1))
-        return float('inf')  # Put files without numbers at the end
-
-    log_files.sort(key=extract_number)
+    # Sort by file number (extract number from filename like "01_test.log");
+    # files without numbers go at the end
+    log_files.sort(key=lambda path: _file_number(path.name))
 
     return log_files
 
 
-def analyze_configuration(output_dir, config_name, is_triton_sanitizer=False):
+def analyze_configuration(output_dir, config_name, is_triton_sanitizer=False, keep_measurements=True,
+                          use_cache=True):
     """
     Analyze all log files for a configuration.
 
@@ -229,6 +306,8 @@ def analyze_configuration(output_dir, config_name, is_triton_sanitizer=False):
         output_dir: base output directory
         config_name: configuration name
         is_triton_sanitizer: True if this is triton-sanitizer
+        keep_measurements: include per-kernel 'measurements' in the results
+        use_cache: reuse cached parse results for unchanged log files
 
     Returns:
         dict: analysis results
@@ -241,32 +320,31 @@ def analyze_configuration(output_dir, config_name, is_triton_sanitizer=False):
 
     print(f"  Found {len(log_files)} log file(s)")
 
-    # Parse all log files
-    all_results = defaultdict(list)
-
-    for log_file in log_files:
-        print(f"    Parsing: {log_file.name}")
+    parse_log = parse_triton_sanitizer if is_triton_sanitizer else parse_baseline_compute_sanitizer
 
-        if is_triton_sanitizer:
-            results = parse_triton_sanitizer(log_file)
-            time_key = 'exec_time_ms'
-        else:
-            results = parse_baseline_compute_sanitizer(log_file)
-            time_key = 'gpu_time_ms'
-
-        # Merge results
-        for test_name, measurements in results.items():
-            all_results[test_name].extend(measurements)
-
-    # Calculate totals
+    # Parse all log files. Files are independent, so they are parsed in a
+    # process pool; map() yields results in file order, keeping the merge stable.
+    if use_cache:
+        parse_log = partial(_parse_log_cached, parse_log=parse_log, keep_measurements=keep_measurements)
+    else:
+        parse_log = partial(parse_log, keep_measurements=keep_measurements)
     totals = {}
-    for test_name, measurements in all_results.items():
-        total = sum(m[time_key] for m in measurements)
-        totals[test_name] = {
-            'total_ms': total,
-            'count': len(measurements),
-            'measurements': measurements
-        }
+
+    max_workers = min(len(log_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for log_file, results in zip(log_files, executor.map(parse_log, log_files)):
+            print(f"    Parsing: {log_file.name}")
+
+            # Merge per-file totals
+            for test_name, data in results.items():
+                entry = totals.get(test_name)
+                if entry is None:
+                    totals[test_name] = data
+                    continue
+                entry['total_ms'] += data['total_ms']
+                entry['count'] += data['count']
+                if keep_measurements:
+                    entry['measurements'].extend(data['measurements'])
 
     return totals
 
@@ -324,40 +402,10 @@ def normalize_test_name(test_name):
         normalized test name without parameters and number prefix
     """
     # Remove parametrization: test_name[params] -> test_name
-    if '[' in test_name:
-        test_name = test_name[:test_name.index('[')]
+    test_name = test_name.partition('[')[0]
 
     # Remove number prefix: 01_test_name -> test_name
-    test_name = re.sub(r'^\d+_', '', test_name)
-
-    return test_name
-
-
-def aggregate_by_function(totals_dict):
-    """
-    Aggregate parametrized test results by function name.
-
-    Args:
-        totals_dict: dict of {test_name: {total_ms, count, measurements}}
-
-    Returns:
-        dict of aggregated results by function name
-    """
-    if not totals_dict:
-        return {}
-
-    aggregated = defaultdict(lambda: {'total_ms': 0.0, 'count': 0, 'test_variants': 0})
-
-    for test_name, data in totals_dict.items():
-        # Normalize the test name (remove parametrization)
-        normalized_name = normalize_test_name(test_name)
-
-        # Aggregate times
-        aggregated[normalized_name]['total_ms'] += data['total_ms']
-        aggregated[normalized_name]['count'] += data['count']
-        aggregated[normalized_name]['test_variants'] += 1
-
-    return dict(aggregated)
+    return _RE_NUM_PREFIX.sub('', test_name, count=1)
 
 
 def export_to_csv(output_dir, baseline_totals, compute_totals, triton_totals, csv_filename):
@@ -375,76 +423,53 @@ def export_to_csv(output_dir, baseline_totals, compute_totals, triton_totals, cs
         triton_totals: triton-sanitizer results dict
         csv_filename: output CSV filename
     """
-    # First, collect all original test names with their numbers
+    # Aggregate parametrized tests by function name in a single pass over all
+    # three configurations. all_original_tests doubles as the ordered set of
+    # unique test function names.
     all_original_tests = {}  # {normalized_name: original_name_with_number}
+    aggregated = []
 
-    for totals_dict in [baseline_totals, compute_totals, triton_totals]:
+    for totals_dict in (baseline_totals, compute_totals, triton_totals):
+        agg = defaultdict(float)
         if totals_dict:
-            for test_name in totals_dict.keys():
+            for test_name, data in totals_dict.items():
                 normalized = normalize_test_name(test_name)
                 # Keep the first occurrence (which should have the number)
                 if normalized not in all_original_tests:
                     all_original_tests[normalized] = test_name
+                agg[normalized] += data['total_ms']
+        aggregated.append(agg)
 
-    # Aggregate parametrized tests by function name
-    baseline_agg = aggregate_by_function(baseline_totals)
-    compute_agg = aggregate_by_function(compute_totals)
-    triton_agg = aggregate_by_function(triton_totals)
-
-    # Collect all unique test function names
-    all_tests = set()
-    if baseline_agg:
-        all_tests.update(baseline_agg.keys())
-    if compute_agg:
-        all_tests.update(compute_agg.keys())
-    if triton_agg:
-        all_tests.update(triton_agg.keys())
-
-    if not all_tests:
+    if not all_original_tests:
         print("No test results to export")
         return None
 
-    # Sort test names by file number
-    def extract_test_number(test_name):
-        # Try to get the original name with number
-        original = all_original_tests.get(test_name, test_name)
-        match = re.search(r'^(\d+)_', original)
-        if match:
-            return int(match.group(1))
-        return float('inf')
-
-    sorted_tests = sorted(all_tests, key=extract_test_number)
-
-    # Prepare CSV data
-    csv_data = []
-    for test_name in sorted_tests:
-        baseline_time = baseline_agg.get(test_name, {}).get('total_ms', 0.0)
-        compute_time = compute_agg.get(test_name, {}).get('total_ms', 0.0)
-        triton_time = triton_agg.get(test_name, {}).get('total_ms', 0.0)
-
-        csv_data.append({
-            'Test_Name': test_name,
-            'baseline_kernel_time': f"{baseline_time:.3f}",
-            'compute_sanitizer_kernel_time': f"{compute_time:.3f}",
-            'triton_sanitizer_kernel_time': f"{triton_time:.3f}"
-        })
+    # Sort test names by the file number of their original (numbered) name
+    sorted_tests = sorted(all_original_tests, key=lambda test_name: _test_number(all_original_tests[test_name]))
+
+    # Prepare CSV data column by column; rows are zipped together on write
+    fieldnames = ['Test_Name', 'baseline_kernel_time', 'compute_sanitizer_kernel_time', 'triton_sanitizer_kernel_time']
+    time_columns = [
+        [f"{agg.get(test_name, 0.0):.3f}" for test_name in sorted_tests]
+        for agg in aggregated
+    ]
 
     # Write CSV file
     csv_path = Path(output_dir) / csv_filename
     try:
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = ['Test_Name', 'baseline_kernel_time', 'compute_sanitizer_kernel_time', 'triton_sanitizer_kernel_time']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(csv_data)
+        # A 1 MiB buffer lets the whole table go out in one or a few writes
+        with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(zip(sorted_tests, *time_columns))
 
         print(f"\n✓ CSV exported to: {csv_path}")
-        print(f"  Total test functions: {len(csv_data)}")
+        print(f"  Total test functions: {len(sorted_tests)}")
 
         # Show aggregation info
-        if baseline_agg:
-            total_variants = sum(v['test_variants'] for v in baseline_agg.values())
-            print(f"  Aggregated {total_variants} parametrized test variants into {len(csv_data)} functions")
+        if baseline_totals:
+            total_variants = len(baseline_totals)
+            print(f"  Aggregated {total_variants} parametrized test variants into {len(sorted_tests)} functions")
 
         return csv_path
     except Exception as e:
@@ -470,6 +495,11 @@ def main():
         default="kernel_timing_results.csv",
         help="Export results to CSV file (default: kernel_timing_results.csv)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-parse every log instead of reusing cached results from {_CACHE_DIR}"
+    )
 
     args = parser.parse_args()
 
@@ -489,7 +519,10 @@ def main():
     print("━" * 80)
     print("BASELINE")
     print("━" * 80)
-    baseline_totals = analyze_configuration(output_dir, "baseline", is_triton_sanitizer=False)
+    baseline_totals = analyze_configuration(
+        output_dir, "baseline", is_triton_sanitizer=False, keep_measurements=args.detail,
+        use_cache=not args.no_cache
+    )
     if baseline_totals:
         print_results("baseline", baseline_totals)
     else:
@@ -501,7 +534,10 @@ def main():
     print("━" * 80)
     print("COMPUTE-SANITIZER")
     print("━" * 80)
-    compute_totals = analyze_configuration(output_dir, "compute-sanitizer", is_triton_sanitizer=False)
+    compute_totals = analyze_configuration(
+        output_dir, "compute-sanitizer", is_triton_sanitizer=False, keep_measurements=args.detail,
+        use_cache=not args.no_cache
+    )
     if compute_totals:
         print_results("compute-sanitizer", compute_totals)
     else:
@@ -513,7 +549,10 @@ def main():
     print("━" * 80)
     print("TRITON-SANITIZER")
     print("━" * 80)
-    triton_totals = analyze_configuration(output_dir, "triton-sanitizer", is_triton_sanitizer=True)
+    triton_totals = analyze_configuration(
+        output_dir, "triton-sanitizer", is_triton_sanitizer=True, keep_measurements=args.detail,
+        use_cache=not args.no_cache
+    )
     if triton_totals:
         print_results("triton-sanitizer", triton_totals)
     else:
@@ -6,16 +6,26 @@ Extracts and calculates average "Maximum resident set size (kbytes)" for each ca
 
 import os
 import re
+import mmap
 import sys
 import argparse
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+
+# GNU time epilogue line, e.g. "Maximum resident set size (kbytes): 123456"
+_MEM_LABEL = b'Maximum resident set size (kbytes):'
+_RE_MEM = re.compile(re.escape(_MEM_LABEL) + rb'\s*(\d+)')
 
 
 def extract_memory_usage(log_file_path):
     """
     Extract the maximum resident set size from a log file.
 
+    The log is memory-mapped and searched from the start with mm.find, which
+    only hands candidate offsets to the regex; the first value wins.
+
     Args:
         log_file_path: Path to the log file
 
@@ -23,11 +33,16 @@ def extract_memory_usage(log_file_path):
         Memory size in kbytes, or None if not found
     """
     try:
-        with open(log_file_path, 'r') as f:
-            content = f.read()
-            match = re.search(r'Maximum resident set size \(kbytes\):\s*(\d+)', content)
-            if match:
-                return int(match.group(1))
+        with open(log_file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = mm.find(_MEM_LABEL)
+                while pos >= 0:
+                    match = _RE_MEM.match(mm, pos)
+                    if match:
+                        return int(match.group(1))
+                    pos = mm.find(_MEM_LABEL, pos + len(_MEM_LABEL))
     except Exception as e:
         print(f"Error reading {log_file_path}: {e}")
     return None
@@ -55,7 +70,7 @@ def analyze_memory_usage(base_dir, subdir_name=None):
         # Look for common subdirectory names
         for possible_name in ['triton_sanitizer', 'baseline']:
             possible_dir = os.path.join(base_dir, possible_name)
-            if os.path.exists(possible_dir) and os.path.isdir(possible_dir):
+            if os.path.isdir(possible_dir):
                 subdir_name = possible_name
                 break
 
@@ -81,46 +96,57 @@ def analyze_memory_usage(base_dir, subdir_name=None):
     for category in categories:
         category_dir = os.path.join(logs_dir, category)
 
-        if not os.path.exists(category_dir):
+        # Get all .log files; a missing category shows up as FileNotFoundError
+        # here, which saves a separate stat() per category
+        try:
+            entries = os.scandir(category_dir)
+        except FileNotFoundError:
             print(f"Warning: Category directory not found: {category_dir}")
             continue
 
-        # Get all .log files
-        log_files = sorted([f for f in os.listdir(category_dir) if f.endswith('.log')])
-
-        memory_values = []
-
-        for log_file in log_files:
-            log_path = os.path.join(category_dir, log_file)
-            memory = extract_memory_usage(log_path)
-
-            if memory is not None:
-                memory_values.append(memory)
+        with entries:
+            log_paths = sorted(entry.path for entry in entries
+                               if entry.name.endswith('.log') and entry.is_file())
+
+        # Each log is read independently, so spread them over a process pool;
+        # map() keeps the results in file order. Statistics are accumulated in
+        # the same pass instead of collecting the values first.
+        count = total_memory = 0
+        min_memory = max_memory = None
+        max_workers = min(len(log_paths), os.cpu_count() or 1) or 1
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for memory in executor.map(extract_memory_usage, log_paths):
+                if memory is None:
+                    continue
+                count += 1
+                total_memory += memory
+                if min_memory is None or memory < min_memory:
+                    min_memory = memory
+                if max_memory is None or memory > max_memory:
+                    max_memory = memory
 
         # Calculate statistics
-        if memory_values:
-            avg_memory = sum(memory_values) / len(memory_values)
-            min_memory = min(memory_values)
-            max_memory = max(memory_values)
+        if count:
+            avg_memory = total_memory / count
 
             results[category] = {
-                'count': len(memory_values),
+                'count': count,
                 'average': avg_memory,
                 'min': min_memory,
                 'max': max_memory,
-                'total_files': len(log_files)
+                'total_files': len(log_paths)
             }
 
             print(f"Category: {category}")
-            print(f"  Total log files: {len(log_files)}")
-            print(f"  Files with memory data: {len(memory_values)}")
+            print(f"  Total log files: {len(log_paths)}")
+            print(f"  Files with memory data: {count}")
             print(f"  Average memory: {avg_memory:,.2f} kbytes ({avg_memory/1024:,.2f} MB)")
             print(f"  Min memory: {min_memory:,} kbytes ({min_memory/1024:.2f} MB)")
             print(f"  Max memory: {max_memory:,} kbytes ({max_memory/1024:.2f} MB)")
             print()
         else:
             print(f"Category: {category}")
-            print(f"  No memory data found in {len(log_files)} log files")
+            print(f"  No memory data found in {len(log_paths)} log files")
             print()
 
     # Summary comparison
@@ -8,6 +8,47 @@ Output: average, median, max, min for each speedup metric
 
 import pandas as pd
 import numpy as np
+from functools import lru_cache
+
+# Below this many valid rows the pandas reductions are already fast enough
+# that importing numba and JIT compilation would not pay off
+NUMBA_MIN_ROWS = 1_000_000
+
+STAT_NAMES = ['mean', 'median', 'max', 'min', 'count']
+
+@lru_cache(maxsize=None)
+def _speedup_stats_kernel():
+    """
+    Compile the numba kernel for very large inputs, or return None when the
+    optional numba dependency (the `analysis` extra) is not installed.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:  # pandas handles every input size
+        return None
+
+    @njit(parallel=True, cache=True)
+    def _speedup_stats(times):
+        """
+        Speedups of column 0 over every other column of times, plus
+        mean/median/max/min/count per speedup column, in one compiled pass.
+        """
+        n, m = times.shape
+        speedups = np.empty((n, m - 1))
+        stats = np.empty((m - 1, 5))
+        for j in prange(m - 1):
+            col = np.empty(n)
+            for i in range(n):
+                col[i] = times[i, 0] / times[i, j + 1]
+            speedups[:, j] = col
+            stats[j, 0] = col.mean()
+            stats[j, 1] = np.median(col)
+            stats[j, 2] = col.max()
+            stats[j, 3] = col.min()
+            stats[j, 4] = n
+        return speedups, stats
+
+    return _speedup_stats
 
 def calculate_speedup_stats(csv_file='test_results.csv'):
     """
@@ -20,67 +61,57 @@ def calculate_speedup_stats(csv_file='test_results.csv'):
     - speedup4: ablation_kernel_time_no_cache / ablation_kernel_time_all_cache
     """
 
-    # Read CSV file
-    df = pd.read_csv(csv_file)
-
-    # Get relevant columns
-    no_cache = df['ablation_kernel_time_no_cache']
-    symbol_only = df['ablation_kernel_time_symbol_only']
-    symbol_loop = df['ablation_kernel_time_symbol_loop']
-    symbol_loop_grid = df['ablation_kernel_time_symbol_loop_grid']
-    all_cache = df['ablation_kernel_time_all_cache']
+    # Relevant columns; the first one is the baseline every speedup is relative to
+    time_cols = [
+        'ablation_kernel_time_no_cache',
+        'ablation_kernel_time_symbol_only',
+        'ablation_kernel_time_symbol_loop',
+        'ablation_kernel_time_symbol_loop_grid',
+        'ablation_kernel_time_all_cache',
+    ]
+    baseline_col, cached_cols = time_cols[0], time_cols[1:]
+
+    # Read CSV file; only the needed columns, with dtypes given up front so the
+    # C parser skips type inference
+    df = pd.read_csv(
+        csv_file,
+        engine='c',
+        usecols=['Test_Name'] + time_cols,
+        dtype={'Test_Name': str, **{col: 'float64' for col in time_cols}},
+    )
 
     # Calculate speedup (avoid division by zero)
     # Filter out rows where no_cache is 0 or any value is 0
-    valid_mask = (no_cache > 0) & (symbol_only > 0) & (symbol_loop > 0) & (symbol_loop_grid > 0) & (all_cache > 0)
+    valid_mask = (df[time_cols] > 0).all(axis=1)
+    valid = df.loc[valid_mask, time_cols]
+
+    speedup_stats = _speedup_stats_kernel() if len(valid) >= NUMBA_MIN_ROWS else None
+    if speedup_stats is not None:
+        # Very large sweeps: speedups and statistics from one numba kernel
+        speedup_arr, stats_arr = speedup_stats(valid.to_numpy())
+        speedups = pd.DataFrame(speedup_arr, index=valid.index, columns=cached_cols)
+        stats = pd.DataFrame(stats_arr, index=cached_cols, columns=STAT_NAMES)
+    else:
+        # One column per speedup metric, computed in a single vectorized division
+        speedups = valid[cached_cols].rdiv(valid[baseline_col], axis=0)
+
+        # All statistics in one aggregation pass per column
+        stats = speedups.agg(STAT_NAMES).T
 
-    speedup1 = no_cache[valid_mask] / symbol_only[valid_mask]
-    speedup2 = no_cache[valid_mask] / symbol_loop[valid_mask]
-    speedup3 = no_cache[valid_mask] / symbol_loop_grid[valid_mask]
-    speedup4 = no_cache[valid_mask] / all_cache[valid_mask]
-
-    # Create results dictionary
-    results = {
+    # Create results DataFrame
+    results_df = pd.DataFrame({
         'Speedup Metric': [
             'no_cache/symbol_only',
             'no_cache/symbol_loop',
             'no_cache/symbol_loop_grid',
             'no_cache/all_cache'
         ],
-        'Average': [
-            speedup1.mean(),
-            speedup2.mean(),
-            speedup3.mean(),
-            speedup4.mean()
-        ],
-        'Median': [
-            speedup1.median(),
-            speedup2.median(),
-            speedup3.median(),
-            speedup4.median()
-        ],
-        'Max': [
-            speedup1.max(),
-            speedup2.max(),
-            speedup3.max(),
-            speedup4.max()
-        ],
-        'Min': [
-            speedup1.min(),
-            speedup2.min(),
-            speedup3.min(),
-            speedup4.min()
-        ],
-        'Valid Samples': [
-            len(speedup1),
-            len(speedup2),
-            len(speedup3),
-            len(speedup4)
-        ]
-    }
-
-    # Create results DataFrame
-    results_df = pd.DataFrame(results)
+        'Average': stats['mean'].values,
+        'Median': stats['median'].values,
+        'Max': stats['max'].values,
+        'Min': stats['min'].values,
+        'Valid Samples': stats['count'].values.astype(int),
+    })
 
     # Print results
     print("=" * 80)
@@ -96,18 +127,23 @@ def calculate_speedup_stats(csv_file='test_results.csv'):
     print("\n" + "=" * 80)
 
     # Save detailed speedup data to CSV
-    speedup_details = pd.DataFrame({
-        'Test_Name': df['Test_Name'][valid_mask].values,
-        'speedup_symbol_only': speedup1.values,
-        'speedup_symbol_loop': speedup2.values,
-        'speedup_symbol_loop_grid': speedup3.values,
-        'speedup_all_cache': speedup4.values,
-        'baseline_time_no_cache': no_cache[valid_mask].values,
-        'time_symbol_only': symbol_only[valid_mask].values,
-        'time_symbol_loop': symbol_loop[valid_mask].values,
-        'time_symbol_loop_grid': symbol_loop_grid[valid_mask].values,
-        'time_all_cache': all_cache[valid_mask].values
-    })
+    # Reuse the already-aligned valid rows instead of copying each column out
+    speedup_details = pd.concat([
+        df.loc[valid_mask, ['Test_Name']],
+        speedups.set_axis([
+            'speedup_symbol_only',
+            'speedup_symbol_loop',
+            'speedup_symbol_loop_grid',
+            'speedup_all_cache'
+        ], axis=1),
+        valid.set_axis([
+            'baseline_time_no_cache',
+            'time_symbol_only',
+            'time_symbol_loop',
+            'time_symbol_loop_grid',
+            'time_all_cache'
+        ], axis=1),
+    ], axis=1)
 
     output_file = 'ablation_speedup_details.csv'
     speedup_details.to_csv(output_file, index=False)
@@ -1,40 +1,49 @@
 import csv
-import statistics
-
-# Read the CSV file
-data = []
-with open('test_results.csv', 'r') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        data.append(row)
+import sys
+
+import numpy as np
+
+# Cell values that never hold a measurement
+_INVALID = frozenset({'', 'FAILED'})
+
+# Parse one cell into a float, NaN for FAILED, empty, or otherwise invalid values
+def _safe_float(value):
+    # float() ignores surrounding whitespace itself, so only strip padded cells
+    if value[:1].isspace() or value[-1:].isspace():
+        value = value.strip()
+    if value in _INVALID or value.startswith('Block Tensor'):
+        return np.nan
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+# Function to convert CSV columns into float arrays
+def load_columns(rows, cols):
+    """
+    Parse the given columns in a single pass over the rows; rows may be a
+    streaming reader, so they are never held in memory all at once.
+    Returns {col: float64 array}, with NaN for FAILED/invalid entries
+    """
+    values = {col: [] for col in cols}
+    for row in rows:
+        for col, col_values in values.items():
+            col_values.append(_safe_float(row[col]))
+    return {col: np.array(col_values, dtype=np.float64) for col, col_values in values.items()}
 
 # Function to calculate overhead ratios
-def calculate_overhead(data, sanitizer_col, baseline_col):
+def calculate_overhead(columns, sanitizer_col, baseline_col):
     """
     Calculate overhead as sanitizer/baseline ratio
-    Returns list of valid ratios (excluding FAILED, NaN, and invalid values)
+    Returns array of valid ratios (excluding FAILED, NaN, and invalid values)
     """
-    ratios = []
-    for row in data:
-        sanitizer_val = row[sanitizer_col].strip()
-        baseline_val = row[baseline_col].strip()
-
-        # Skip if either value is FAILED, empty, or invalid
-        if (not sanitizer_val or not baseline_val or
-            sanitizer_val == 'FAILED' or baseline_val == 'FAILED' or
-            'Block Tensor Not Supported' in sanitizer_val or 'Block Tensor Not Supported' in baseline_val):
-            continue
-
-        try:
-            sanitizer_val = float(sanitizer_val)
-            baseline_val = float(baseline_val)
-            if baseline_val > 0:  # Avoid division by zero
-                ratio = sanitizer_val / baseline_val
-                ratios.append(ratio)
-        except (ValueError, TypeError):
-            continue
-
-    return ratios
+    sanitizer = columns[sanitizer_col]
+    baseline = columns[baseline_col]
+
+    # Avoid division by zero; NaN baselines fail the > 0 test as well
+    valid = baseline > 0
+    ratios = sanitizer[valid] / baseline[valid]
+    return ratios[np.isfinite(ratios)]
 
 # Function to compute statistics
 def compute_stats(ratios):
@@ -44,11 +53,16 @@ def compute_stats(ratios):
     if len(ratios) == 0:
         return {'avg': 'N/A', 'median': 'N/A', 'lower': 'N/A', 'upper': 'N/A'}
 
+    # One sort gives min, max and median; the mean is a single reduction
+    ordered = np.sort(np.asarray(ratios, dtype=np.float64))
+    mid = len(ordered) // 2
+    median = ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
     return {
-        'avg': statistics.mean(ratios),
-        'median': statistics.median(ratios),
-        'lower': min(ratios),
-        'upper': max(ratios)
+        'avg': float(ordered.mean()),
+        'median': float(median),
+        'lower': float(ordered[0]),
+        'upper': float(ordered[-1])
     }
 
 # Define the configurations
@@ -79,29 +93,39 @@ configs = [
     }
 ]
 
+# Stream the CSV file once, parsing every column used below instead of
+# keeping each row's dict around
+with open('test_results.csv', 'r') as f:
+    columns = load_columns(csv.DictReader(f), dict.fromkeys(
+        config[key] for config in configs for key in ('baseline', 'compute_sanitizer', 'triton_sanitizer')))
+
+# Format one statistic for the per-configuration report
+def _fmt(value):
+    return f"{value:.4f}x" if isinstance(value, float) else str(value)
+
 # Calculate overheads for each configuration
 results = []
 for config in configs:
-    print(f"\n{config['name']}")
-    print("=" * 80)
-
     # Compute-Sanitizer overhead
-    cs_ratios = calculate_overhead(data, config['compute_sanitizer'], config['baseline'])
+    cs_ratios = calculate_overhead(columns, config['compute_sanitizer'], config['baseline'])
     cs_stats = compute_stats(cs_ratios)
-    print(f"\nCompute-Sanitizer (n={len(cs_ratios)} valid samples):")
-    print(f"  avg:    {cs_stats['avg']:.4f}x" if isinstance(cs_stats['avg'], float) else f"  avg:    {cs_stats['avg']}")
-    print(f"  median: {cs_stats['median']:.4f}x" if isinstance(cs_stats['median'], float) else f"  median: {cs_stats['median']}")
-    print(f"  lower:  {cs_stats['lower']:.4f}x" if isinstance(cs_stats['lower'], float) else f"  lower:  {cs_stats['lower']}")
-    print(f"  upper:  {cs_stats['upper']:.4f}x" if isinstance(cs_stats['upper'], float) else f"  upper:  {cs_stats['upper']}")
 
     # Triton-Sanitizer overhead
-    ts_ratios = calculate_overhead(data, config['triton_sanitizer'], config['baseline'])
+    ts_ratios = calculate_overhead(columns, config['triton_sanitizer'], config['baseline'])
     ts_stats = compute_stats(ts_ratios)
-    print(f"\nTriton-Sanitizer (n={len(ts_ratios)} valid samples):")
-    print(f"  avg:    {ts_stats['avg']:.4f}x" if isinstance(ts_stats['avg'], float) else f"  avg:    {ts_stats['avg']}")
-    print(f"  median: {ts_stats['median']:.4f}x" if isinstance(ts_stats['median'], float) else f"  median: {ts_stats['median']}")
-    print(f"  lower:  {ts_stats['lower']:.4f}x" if isinstance(ts_stats['lower'], float) else f"  lower:  {ts_stats['lower']}")
-    print(f"  upper:  {ts_stats['upper']:.4f}x" if isinstance(ts_stats['upper'], float) else f"  upper:  {ts_stats['upper']}")
+
+    # Write the whole block at once
+    lines = [f"\n{config['name']}", "=" * 80]
+    for label, ratios, stats in (('Compute-Sanitizer', cs_ratios, cs_stats),
+                                 ('Triton-Sanitizer', ts_ratios, ts_stats)):
+        lines += [
+            f"\n{label} (n={len(ratios)} valid samples):",
+            f"  avg:    {_fmt(stats['avg'])}",
+            f"  median: {_fmt(stats['median'])}",
+            f"  lower:  {_fmt(stats['lower'])}",
+            f"  upper:  {_fmt(stats['upper'])}",
+        ]
+    sys.stdout.write('\n'.join(lines) + '\n')
 
     results.append({
         'config': config['name'],
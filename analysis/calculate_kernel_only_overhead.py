@@ -1,40 +1,36 @@
-import csv
-import statistics
-
-# Read the CSV file
-data = []
-with open('test_results.csv', 'r') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        data.append(row)
+import numpy as np
+import pandas as pd
+
+BASELINE_COL = 'kernel_time_baseline (ms)'
+CS_COL = 'kernel_time_compute_sanitizer (ms)'
+TS_COL = 'kernel_time_triton_sanitizer (ms)'
+STAT_NAMES = ['mean', 'median', 'min', 'max', 'count']
+SANITIZERS = ((CS_COL, 'Compute-Sanitizer'), (TS_COL, 'Triton-Sanitizer'))
+
+# Read the CSV file in one columnar pass. Cells stay strings here so that
+# FAILED / Block Tensor Not Supported markers are not guessed at by the parser;
+# they become NaN when the columns are converted below.
+data = pd.read_csv('test_results.csv', usecols=['Test_Name', BASELINE_COL, CS_COL, TS_COL],
+                   dtype=str, keep_default_na=False, engine='c')
+times = data[[BASELINE_COL, CS_COL, TS_COL]].apply(lambda col: pd.to_numeric(col.str.strip(), errors='coerce'))
+suites = data['Test_Name'].str.partition('/')[0]  # Extract suite name (e.g., 'liger_kernel', 'tritonbench')
 
 # Function to calculate kernel-only overhead ratios
-def calculate_kernel_overhead(data, sanitizer_col, baseline_col):
+def calculate_kernel_overhead(times, sanitizer_cols, baseline_col):
     """
     Calculate kernel-only overhead as sanitizer_kernel_time/baseline_kernel_time ratio
-    Returns list of valid ratios (excluding FAILED, NaN, and invalid values)
+    for all sanitizer columns at once
+    Returns DataFrame of ratios, NaN where either value is FAILED, NaN, or invalid
     """
-    ratios = []
-    for row in data:
-        sanitizer_val = row[sanitizer_col].strip()
-        baseline_val = row[baseline_col].strip()
-
-        # Skip if either value is FAILED, empty, or invalid
-        if (not sanitizer_val or not baseline_val or
-            sanitizer_val == 'FAILED' or baseline_val == 'FAILED' or
-            'Block Tensor Not Supported' in sanitizer_val or 'Block Tensor Not Supported' in baseline_val):
-            continue
-
-        try:
-            sanitizer_val = float(sanitizer_val)
-            baseline_val = float(baseline_val)
-            if baseline_val > 0:  # Avoid division by zero
-                ratio = sanitizer_val / baseline_val
-                ratios.append(ratio)
-        except (ValueError, TypeError):
-            continue
-
-    return ratios
+    sanitizer = times[sanitizer_cols].to_numpy(dtype=np.float64)
+    baseline = times[baseline_col].to_numpy(dtype=np.float64)[:, None]
+
+    # Divide on the raw arrays; NaN inputs propagate, and zero or negative
+    # baselines are masked out along with any non-finite result
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = sanitizer / baseline
+    ratios[~((baseline > 0) & np.isfinite(ratios))] = np.nan
+    return pd.DataFrame(ratios, index=times.index, columns=sanitizer_cols)
 
 # Function to compute statistics
 def compute_stats(ratios):
@@ -44,42 +40,40 @@ def compute_stats(ratios):
     if len(ratios) == 0:
         return {'avg': 'N/A', 'median': 'N/A', 'lower': 'N/A', 'upper': 'N/A'}
 
+    # One sort gives min, max and median; the mean is a single reduction
+    ordered = np.sort(np.asarray(ratios, dtype=np.float64))
+    mid = len(ordered) // 2
+    median = ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
     return {
-        'avg': statistics.mean(ratios),
-        'median': statistics.median(ratios),
-        'lower': min(ratios),
-        'upper': max(ratios)
+        'avg': float(ordered.mean()),
+        'median': float(median),
+        'lower': float(ordered[0]),
+        'upper': float(ordered[-1])
     }
 
+# One pass computes every ratio; the global stats and the per-suite
+# breakdown below are both derived from it
+ratios = calculate_kernel_overhead(times, [CS_COL, TS_COL], BASELINE_COL)
+
 print("=" * 100)
 print("KERNEL-ONLY OVERHEAD ANALYSIS")
 print("=" * 100)
 
-# Calculate Compute-Sanitizer kernel-only overhead
-print("\nCompute-Sanitizer Kernel-Only Overhead")
-print("-" * 80)
-cs_ratios = calculate_kernel_overhead(data,
-                                       'kernel_time_compute_sanitizer (ms)',
-                                       'kernel_time_baseline (ms)')
-cs_stats = compute_stats(cs_ratios)
-print(f"Valid samples: {len(cs_ratios)}")
-print(f"  avg:    {cs_stats['avg']:.4f}x" if isinstance(cs_stats['avg'], float) else f"  avg:    {cs_stats['avg']}")
-print(f"  median: {cs_stats['median']:.4f}x" if isinstance(cs_stats['median'], float) else f"  median: {cs_stats['median']}")
-print(f"  lower:  {cs_stats['lower']:.4f}x" if isinstance(cs_stats['lower'], float) else f"  lower:  {cs_stats['lower']}")
-print(f"  upper:  {cs_stats['upper']:.4f}x" if isinstance(cs_stats['upper'], float) else f"  upper:  {cs_stats['upper']}")
-
-# Calculate Triton-Sanitizer kernel-only overhead
-print("\nTriton-Sanitizer Kernel-Only Overhead")
-print("-" * 80)
-ts_ratios = calculate_kernel_overhead(data,
-                                       'kernel_time_triton_sanitizer (ms)',
-                                       'kernel_time_baseline (ms)')
-ts_stats = compute_stats(ts_ratios)
-print(f"Valid samples: {len(ts_ratios)}")
-print(f"  avg:    {ts_stats['avg']:.4f}x" if isinstance(ts_stats['avg'], float) else f"  avg:    {ts_stats['avg']}")
-print(f"  median: {ts_stats['median']:.4f}x" if isinstance(ts_stats['median'], float) else f"  median: {ts_stats['median']}")
-print(f"  lower:  {ts_stats['lower']:.4f}x" if isinstance(ts_stats['lower'], float) else f"  lower:  {ts_stats['lower']}")
-print(f"  upper:  {ts_stats['upper']:.4f}x" if isinstance(ts_stats['upper'], float) else f"  upper:  {ts_stats['upper']}")
+# Global kernel-only overhead per sanitizer; the same ratio columns feed the
+# summary table and the per-suite breakdown
+overall = {}
+for col, label in SANITIZERS:
+    print(f"\n{label} Kernel-Only Overhead")
+    print("-" * 80)
+    valid = ratios[col].dropna()
+    stats = compute_stats(valid)
+    overall[col] = (stats, len(valid))
+    print(f"Valid samples: {len(valid)}")
+    print(f"  avg:    {stats['avg']:.4f}x" if isinstance(stats['avg'], float) else f"  avg:    {stats['avg']}")
+    print(f"  median: {stats['median']:.4f}x" if isinstance(stats['median'], float) else f"  median: {stats['median']}")
+    print(f"  lower:  {stats['lower']:.4f}x" if isinstance(stats['lower'], float) else f"  lower:  {stats['lower']}")
+    print(f"  upper:  {stats['upper']:.4f}x" if isinstance(stats['upper'], float) else f"  upper:  {stats['upper']}")
 
 # Print summary table
 print("\n" + "=" * 100)
@@ -89,15 +83,12 @@ print()
 print("| Sanitizer         | avg     | median  | lower   | upper   | samples |")
 print("|-------------------|---------|---------|---------|---------|---------|")
 
-if isinstance(cs_stats['avg'], float):
-    print(f"| Compute-Sanitizer | {cs_stats['avg']:7.2f} | {cs_stats['median']:7.2f} | {cs_stats['lower']:7.2f} | {cs_stats['upper']:7.2f} | {len(cs_ratios):7} |")
-else:
-    print(f"| Compute-Sanitizer | {'N/A':>7} | {'N/A':>7} | {'N/A':>7} | {'N/A':>7} | {len(cs_ratios):7} |")
-
-if isinstance(ts_stats['avg'], float):
-    print(f"| Triton-Sanitizer  | {ts_stats['avg']:7.2f} | {ts_stats['median']:7.2f} | {ts_stats['lower']:7.2f} | {ts_stats['upper']:7.2f} | {len(ts_ratios):7} |")
-else:
-    print(f"| Triton-Sanitizer  | {'N/A':>7} | {'N/A':>7} | {'N/A':>7} | {'N/A':>7} | {len(ts_ratios):7} |")
+for col, label in SANITIZERS:
+    stats, samples = overall[col]
+    if isinstance(stats['avg'], float):
+        print(f"| {label:17} | {stats['avg']:7.2f} | {stats['median']:7.2f} | {stats['lower']:7.2f} | {stats['upper']:7.2f} | {samples:7} |")
+    else:
+        print(f"| {label:17} | {'N/A':>7} | {'N/A':>7} | {'N/A':>7} | {'N/A':>7} | {samples:7} |")
 
 print()
 
@@ -106,59 +97,23 @@ print("=" * 100)
 print("BREAKDOWN BY TEST SUITE")
 print("=" * 100)
 
-test_suites = {}
-for row in data:
-    test_name = row['Test_Name']
-    suite = test_name.split('/')[0]  # Extract suite name (e.g., 'liger_kernel', 'tritonbench')
-
-    if suite not in test_suites:
-        test_suites[suite] = {'cs_ratios': [], 'ts_ratios': []}
-
-    # Compute-Sanitizer
-    cs_val = row['kernel_time_compute_sanitizer (ms)'].strip()
-    baseline_val = row['kernel_time_baseline (ms)'].strip()
-    if (cs_val and baseline_val and cs_val != 'FAILED' and baseline_val != 'FAILED'
-        and 'Block Tensor Not Supported' not in cs_val and 'Block Tensor Not Supported' not in baseline_val):
-        try:
-            cs_f = float(cs_val)
-            bl_f = float(baseline_val)
-            if bl_f > 0:
-                test_suites[suite]['cs_ratios'].append(cs_f / bl_f)
-        except (ValueError, TypeError):
-            pass
-
-    # Triton-Sanitizer
-    ts_val = row['kernel_time_triton_sanitizer (ms)'].strip()
-    if (ts_val and baseline_val and ts_val != 'FAILED' and baseline_val != 'FAILED'
-        and 'Block Tensor Not Supported' not in ts_val and 'Block Tensor Not Supported' not in baseline_val):
-        try:
-            ts_f = float(ts_val)
-            bl_f = float(baseline_val)
-            if bl_f > 0:
-                test_suites[suite]['ts_ratios'].append(ts_f / bl_f)
-        except (ValueError, TypeError):
-            pass
-
-for suite in sorted(test_suites.keys()):
+# Per-suite stats for both sanitizers from a single groupby over the ratios.
+# Every suite is listed (sorted), including those without any valid sample.
+# The reductions all run inside the groupby; the report below only reads
+# plain floats back out of {suite: {(column, stat): value}}.
+suite_stats = ratios.groupby(suites).agg(STAT_NAMES).to_dict('index')
+
+for suite, stats in suite_stats.items():
     print(f"\n{suite}")
     print("-" * 80)
 
-    cs_ratios = test_suites[suite]['cs_ratios']
-    ts_ratios = test_suites[suite]['ts_ratios']
-
-    cs_stats = compute_stats(cs_ratios)
-    ts_stats = compute_stats(ts_ratios)
+    for col, label in SANITIZERS:
+        count = int(stats[col, 'count'])
 
-    print(f"  Compute-Sanitizer ({len(cs_ratios)} samples):")
-    if isinstance(cs_stats['avg'], float):
-        print(f"    avg: {cs_stats['avg']:.2f}x, median: {cs_stats['median']:.2f}x, range: [{cs_stats['lower']:.2f}, {cs_stats['upper']:.2f}]")
-    else:
-        print(f"    No valid data")
-
-    print(f"  Triton-Sanitizer ({len(ts_ratios)} samples):")
-    if isinstance(ts_stats['avg'], float):
-        print(f"    avg: {ts_stats['avg']:.2f}x, median: {ts_stats['median']:.2f}x, range: [{ts_stats['lower']:.2f}, {ts_stats['upper']:.2f}]")
-    else:
-        print(f"    No valid data")
+        print(f"  {label} ({count} samples):")
+        if count:
+            print(f"    avg: {stats[col, 'mean']:.2f}x, median: {stats[col, 'median']:.2f}x, range: [{stats[col, 'min']:.2f}, {stats[col, 'max']:.2f}]")
+        else:
+            print(f"    No valid data")
 
 print()
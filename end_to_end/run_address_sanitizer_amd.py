@@ -19,7 +19,10 @@ import atexit
 import shutil
 from pathlib import Path
 from datetime import datetime
-from collections import OrderedDict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 
 # Add project root to path for imports
 SCRIPT_DIR = Path(__file__).parent.absolute()
@@ -28,7 +31,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from utils.test_registry import REPO_CONFIGS, get_configs_by_group
 from utils.test_id_registry import get_test_id, get_max_test_id
-from utils.misc import EASTERN_TZ
+from utils.misc import eastern_tz
 
 # Get baseline configurations from registry
 ENV_CONFIGS = get_configs_by_group("baseline")
@@ -36,6 +39,30 @@ ENV_CONFIGS = get_configs_by_group("baseline")
 # Memory profiling prefix
 MEMORY_PROFILE_PREFIX = "/usr/bin/time -v"
 
+# Log header written before each test's output
+LOG_HEADER_TEMPLATE = (
+    "Test Number: {test_number}\n"
+    "Test: {test_name}\n"
+    "Environment: {env_config_key}\n"
+    "TRITON_ENABLE_ASAN: 1\n"
+    "HSA_XNACK: 1\n"
+    "Command: {command}\n"
+    "Start Time: {start_time}\n"
+    + "=" * 80 + "\n"
+)
+
+# Log footer written after each test's output
+LOG_FOOTER_TEMPLATE = (
+    "\n" + "=" * 80 + "\n"
+    "End Time: {end_time}\n"
+    "Elapsed Time: {elapsed_time:.4f} seconds\n"
+    "Status: {status}\n"
+)
+
+# AST nodes whose bodies may hold test functions (classes, blocks, except clauses)
+_AST_BLOCK_NODES = (ast.ClassDef, ast.If, ast.Try, ast.TryStar, ast.With, ast.AsyncWith,
+                    ast.For, ast.AsyncFor, ast.While, ast.ExceptHandler)
+
 # Global variable for cleanup
 _TORCH_PATH = None
 _LIBAMDHIP_MOVED = False
@@ -80,6 +107,71 @@ def _find_type_d_wholename(base_dir, pattern):
         return None
 
 
+@lru_cache(maxsize=None)
+def _parse_test_functions(test_file, mtime_ns):
+    """Parse a pytest file for test functions; cached per path and modification time.
+
+    Reports the test_* functions ast.walk would find, in the same
+    breadth-first order, including those under module-level if/try blocks
+    and in classes; function bodies are never traversed.
+    """
+    test_functions = []
+
+    try:
+        with open(test_file, 'r') as f:
+            tree = ast.parse(f.read(), filename=test_file)
+
+        # Breadth-first like ast.walk, but only statements are queued and
+        # functions are not descended into
+        pending = deque([tree])
+        while pending:
+            for node in ast.iter_child_nodes(pending.popleft()):
+                if isinstance(node, ast.FunctionDef):
+                    if node.name.startswith('test_'):
+                        test_functions.append(node.name)
+                elif isinstance(node, _AST_BLOCK_NODES):
+                    pending.append(node)
+    except Exception as e:
+        print(f"Warning: Could not parse {test_file} to find test functions: {e}")
+        return None
+
+    return test_functions if test_functions else None
+
+
+@lru_cache(maxsize=None)
+def _load_whitelist(whitelist_path, repo_name):
+    """Parse a test whitelist file; cached per path and repository.
+
+    Maps each test file stem to a tuple of whitelisted test functions
+    (empty for tritonbench, which whitelists whole files).
+    """
+    if not os.path.exists(whitelist_path):
+        return None
+
+    whitelist = {}
+
+    with open(whitelist_path, "r") as f:
+        lines = f.readlines()
+
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            if repo_name == "tritonbench":
+                file_name = Path(line).stem
+                whitelist[file_name] = []
+            elif "::" in line:
+                test_file, test_function = line.split("::")
+                test_file = Path(test_file).stem
+                if test_file not in whitelist:
+                    whitelist[test_file] = []
+                whitelist[test_file].append(test_function)
+
+    if not whitelist:
+        return None
+
+    return {test_file: tuple(test_functions) for test_file, test_functions in whitelist.items()}
+
+
 def _cleanup_asan():
     """Restore libamdhip64.so on exit."""
     global _TORCH_PATH, _LIBAMDHIP_MOVED
@@ -167,61 +259,121 @@ def setup_asan_environment():
     print(f"  ASAN_LD_PRELOAD: {os.environ.get('ASAN_LD_PRELOAD', '')}")
 
 
+def run_single_test(test_info, env_config_key, env, max_test_id, output_base_dir):
+    """Run a single test with specific environment configuration.
+
+    A module-level function, so worker processes only receive its arguments
+    rather than the whole runner. env is the subprocess environment, built
+    once per configuration by the caller.
+    """
+    env_config = ENV_CONFIGS[env_config_key]
+    repo_name = test_info["repository"]
+
+    # Use global test ID from registry
+    global_id = get_test_id(test_info["test_name"])
+    test_number = str(global_id).zfill(len(str(max_test_id)))
+
+    output_dir = output_base_dir / env_config["name"]
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    output_file = output_dir / f"{test_number}_{test_info['log_suffix']}"
+
+    test_dir = test_info["test_dir"]
+    cmd = test_info["cmd"]
+
+    print(f"  [ID:{global_id}/{max_test_id}] [{repo_name}] Running: {test_info['test_display']}")
+
+    start_time = time.time()
+
+    # Header, test output and footer all go through one file handle; the
+    # child inherits the descriptor and shares its offset, so the footer
+    # lands after the test output without reopening the log.
+    with open(output_file, "w") as log_file:
+        log_file.write(LOG_HEADER_TEMPLATE.format(
+            test_number=test_number,
+            test_name=test_info['test_name'],
+            env_config_key=env_config_key,
+            command=' '.join(cmd),
+            start_time=datetime.now(eastern_tz()).isoformat()
+        ))
+        log_file.flush()
+
+        try:
+            result = subprocess.run(
+                cmd,
+                env=env,
+                cwd=test_dir,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                timeout=600,
+                text=True
+            )
+
+            elapsed_time = time.time() - start_time
+            success = result.returncode == 0
+            status = "PASSED" if success else "FAILED"
+            error_msg = "" if success else f"Return code: {result.returncode}"
+
+        except subprocess.TimeoutExpired:
+            elapsed_time = time.time() - start_time
+            status = "TIMEOUT"
+            error_msg = "Test exceeded 10 minute timeout"
+
+        except Exception as e:
+            elapsed_time = time.time() - start_time
+            status = "ERROR"
+            error_msg = str(e)
+
+        footer = LOG_FOOTER_TEMPLATE.format(
+            end_time=datetime.now(eastern_tz()).isoformat(),
+            elapsed_time=elapsed_time,
+            status=status
+        )
+        if error_msg:
+            footer += f"Error: {error_msg}\n"
+        log_file.write(footer)
+
+    print(f"    Status: {status} ({elapsed_time:.2f}s)")
+    if error_msg:
+        print(f"    Error: {error_msg}")
+
+    return {
+        "test_number": test_number,
+        "status": status,
+        "elapsed_time": elapsed_time,
+        "error_message": error_msg,
+        "output_file": str(output_file)
+    }
+
+
 class AddressSanitizerRunner:
     def __init__(self, enable_memory=False):
         self.script_dir = Path(__file__).parent.absolute()
         self.project_root = self.script_dir.parent
         self.output_base_dir = self.script_dir / "results" / "address_sanitizer"
         self.output_base_dir.mkdir(parents=True, exist_ok=True)
-        self.timestamp = datetime.now(EASTERN_TZ).strftime("%Y%m%d_%H%M%S")
+        self.timestamp = datetime.now(eastern_tz()).strftime("%Y%m%d_%H%M%S")
         self.max_test_id = get_max_test_id()
         self.total_tests = 0
-        self.test_results = OrderedDict()
+        self.test_results = {}
         self.test_list = []
         self.enable_memory = enable_memory
+        self._skip_tests = {repo: frozenset(config.get("skip_tests", ()))
+                            for repo, config in REPO_CONFIGS.items()}
+        self._test_cmd_tokens = {repo: config["test_command"].split()
+                                 for repo, config in REPO_CONFIGS.items() if "test_command" in config}
 
     def load_whitelist(self, whitelist_file, repo_name):
         """Load test whitelist from file."""
-        whitelist = {}
-        whitelist_path = self.project_root / whitelist_file
-
-        if not whitelist_path.exists():
-            return None
-
-        with open(whitelist_path, "r") as f:
-            lines = f.readlines()
-
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                if repo_name == "tritonbench":
-                    file_name = Path(line).stem
-                    whitelist[file_name] = []
-                elif "::" in line:
-                    test_file, test_function = line.split("::")
-                    test_file = Path(test_file).stem
-                    if test_file not in whitelist:
-                        whitelist[test_file] = []
-                    whitelist[test_file].append(test_function)
-
-        return whitelist if whitelist else None
+        return _load_whitelist(str(self.project_root / whitelist_file), repo_name)
 
     def discover_test_functions(self, test_file):
         """Discover individual test functions in a pytest file."""
-        test_functions = []
-
         try:
-            with open(test_file, 'r') as f:
-                tree = ast.parse(f.read())
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                    test_functions.append(node.name)
-        except Exception as e:
-            print(f"Warning: Could not parse {test_file} to find test functions: {e}")
-            return None
-
-        return test_functions if test_functions else None
+            mtime_ns = os.stat(test_file).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        return _parse_test_functions(str(test_file), mtime_ns)
 
     def discover_tests(self, repo_name):
         """Discover test files in a repository."""
@@ -242,18 +394,62 @@ class AddressSanitizerRunner:
             ]
 
             for bench_dir in benchmark_dirs:
-                if bench_dir.exists():
-                    for py_file in bench_dir.glob("**/*.py"):
-                        if "__pycache__" not in str(py_file) and not py_file.name.startswith("__"):
-                            test_files.append(py_file)
+                # os.walk yields nothing for a missing directory; __pycache__
+                # directories are pruned instead of walked and filtered out
+                for root, dirs, files in os.walk(bench_dir):
+                    dirs[:] = [d for d in dirs if d != "__pycache__"]
+                    root_path = Path(root)
+                    for file_name in files:
+                        if file_name.endswith(".py") and not file_name.startswith("__"):
+                            test_files.append(root_path / file_name)
         else:
             pattern = config["test_pattern"]
             test_files = list(test_dir.glob(pattern))
 
-        test_files = [f for f in test_files if f.name not in config.get("skip_tests", [])]
+        skip_tests = self._skip_tests[repo_name]
+        test_files = [f for f in test_files if f.name not in skip_tests]
 
         return test_files
 
+    def _build_test_info(self, repo_name, test_file, test_function):
+        """Build a test entry, precomputing everything that does not depend on the env config."""
+        config = REPO_CONFIGS[repo_name]
+        test_file_stem = test_file.stem
+        test_dir = self.project_root / config["test_dir"]
+
+        if test_function:
+            test_name = f"{repo_name}/{test_file_stem}/{test_function}"
+            log_suffix = f"{repo_name}_{test_file_stem}_{test_function}.log"
+            test_display = f"{test_file.name}::{test_function}"
+        else:
+            test_name = f"{repo_name}/{test_file_stem}"
+            log_suffix = f"{repo_name}_{test_file_stem}.log"
+            test_display = test_file.name
+
+        if repo_name == "tritonbench" and config.get("special_handling"):
+            relative_path = test_file.relative_to(test_dir)
+            cmd = ["python", str(relative_path)]
+        else:
+            if test_function:
+                cmd = ["pytest", "-s", "--assert=plain", test_display]
+            else:
+                cmd = self._test_cmd_tokens[repo_name] + [test_file.name]
+
+        # Only use memory profiling prefix if --memory flag is set
+        if self.enable_memory:
+            cmd = MEMORY_PROFILE_PREFIX.split() + cmd
+
+        return {
+            "repository": repo_name,
+            "test_file": test_file,
+            "test_function": test_function,
+            "test_name": test_name,
+            "test_dir": test_dir,
+            "cmd": cmd,
+            "log_suffix": log_suffix,
+            "test_display": test_display
+        }
+
     def prepare_test_list(self, repositories, whitelists=None):
         """Prepare a complete list of all tests to run."""
         self.test_list = []
@@ -270,20 +466,10 @@ class AddressSanitizerRunner:
 
                 if whitelist and test_file_stem in whitelist:
                     if repo == "tritonbench":
-                        self.test_list.append({
-                            "repository": repo,
-                            "test_file": test_file,
-                            "test_function": None,
-                            "test_name": f"{repo}/{test_file_stem}"
-                        })
+                        self.test_list.append(self._build_test_info(repo, test_file, None))
                     else:
                         for test_function in whitelist[test_file_stem]:
-                            self.test_list.append({
-                                "repository": repo,
-                                "test_file": test_file,
-                                "test_function": test_function,
-                                "test_name": f"{repo}/{test_file_stem}/{test_function}"
-                            })
+                            self.test_list.append(self._build_test_info(repo, test_file, test_function))
                 elif whitelist and repo == "tritonbench":
                     continue
                 elif not whitelist and repo in ["liger_kernel", "flag_gems"]:
@@ -291,53 +477,18 @@ class AddressSanitizerRunner:
 
                     if test_functions:
                         for test_function in test_functions:
-                            self.test_list.append({
-                                "repository": repo,
-                                "test_file": test_file,
-                                "test_function": test_function,
-                                "test_name": f"{repo}/{test_file_stem}/{test_function}"
-                            })
+                            self.test_list.append(self._build_test_info(repo, test_file, test_function))
                     else:
-                        self.test_list.append({
-                            "repository": repo,
-                            "test_file": test_file,
-                            "test_function": None,
-                            "test_name": f"{repo}/{test_file_stem}"
-                        })
+                        self.test_list.append(self._build_test_info(repo, test_file, None))
                 elif not whitelist:
-                    self.test_list.append({
-                        "repository": repo,
-                        "test_file": test_file,
-                        "test_function": None,
-                        "test_name": f"{repo}/{test_file_stem}"
-                    })
+                    self.test_list.append(self._build_test_info(repo, test_file, None))
 
         self.total_tests = len(self.test_list)
         print(f"Discovered {self.total_tests} tests across {len(repositories)} repositories")
         return self.test_list
 
-    def run_single_test(self, test_info, env_config_key):
-        """Run a single test with specific environment configuration."""
-        env_config = ENV_CONFIGS[env_config_key]
-        repo_name = test_info["repository"]
-        test_file = test_info["test_file"]
-        test_function = test_info["test_function"]
-        config = REPO_CONFIGS[repo_name]
-
-        # Use global test ID from registry
-        global_id = get_test_id(test_info["test_name"])
-        test_number = str(global_id).zfill(len(str(self.max_test_id)))
-
-        output_dir = self.output_base_dir / env_config["name"]
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        if test_function:
-            output_filename = f"{test_number}_{repo_name}_{test_file.stem}_{test_function}.log"
-        else:
-            output_filename = f"{test_number}_{repo_name}_{test_file.stem}.log"
-
-        output_file = output_dir / output_filename
-
+    def _build_env(self, env_config):
+        """Build the subprocess environment for an env configuration."""
         env = os.environ.copy()
         env.update(env_config["env"])
 
@@ -363,94 +514,16 @@ class AddressSanitizerRunner:
         else:
             env["PYTHONPATH"] = str(self.project_root)
 
-        test_dir = self.project_root / config["test_dir"]
-
-        if repo_name == "tritonbench" and config.get("special_handling"):
-            relative_path = test_file.relative_to(self.project_root / config["test_dir"])
-            cmd = ["python", str(relative_path)]
-        else:
-            if test_function:
-                cmd = ["pytest", "-s", "--assert=plain", f"{test_file.name}::{test_function}"]
-            else:
-                cmd = config["test_command"].split() + [test_file.name]
-
-        # Only use memory profiling prefix if --memory flag is set
-        if self.enable_memory:
-            cmd = MEMORY_PROFILE_PREFIX.split() + cmd
-
-        if test_function:
-            test_display = f"{test_file.name}::{test_function}"
-        else:
-            test_display = test_file.name
-
-        print(f"  [ID:{global_id}/{self.max_test_id}] [{repo_name}] Running: {test_display}")
-
-        start_time = time.time()
-
-        try:
-            with open(output_file, "w") as log_file:
-                log_file.write(f"Test Number: {test_number}\n")
-                log_file.write(f"Test: {test_info['test_name']}\n")
-                log_file.write(f"Environment: {env_config_key}\n")
-                log_file.write(f"TRITON_ENABLE_ASAN: 1\n")
-                log_file.write(f"HSA_XNACK: 1\n")
-                log_file.write(f"Command: {' '.join(cmd)}\n")
-                log_file.write(f"Start Time: {datetime.now(EASTERN_TZ).isoformat()}\n")
-                log_file.write("=" * 80 + "\n")
-                log_file.flush()
-
-                result = subprocess.run(
-                    cmd,
-                    env=env,
-                    cwd=test_dir,
-                    stdout=log_file,
-                    stderr=subprocess.STDOUT,
-                    timeout=600,
-                    text=True
-                )
-
-            elapsed_time = time.time() - start_time
-            success = result.returncode == 0
-            status = "PASSED" if success else "FAILED"
-            error_msg = "" if success else f"Return code: {result.returncode}"
-
-        except subprocess.TimeoutExpired:
-            elapsed_time = time.time() - start_time
-            status = "TIMEOUT"
-            error_msg = "Test exceeded 10 minute timeout"
-
-        except Exception as e:
-            elapsed_time = time.time() - start_time
-            status = "ERROR"
-            error_msg = str(e)
-
-        with open(output_file, "a") as log_file:
-            log_file.write("\n" + "=" * 80 + "\n")
-            log_file.write(f"End Time: {datetime.now(EASTERN_TZ).isoformat()}\n")
-            log_file.write(f"Elapsed Time: {elapsed_time:.4f} seconds\n")
-            log_file.write(f"Status: {status}\n")
-            if error_msg:
-                log_file.write(f"Error: {error_msg}\n")
-
-        print(f"    Status: {status} ({elapsed_time:.2f}s)")
-        if error_msg:
-            print(f"    Error: {error_msg}")
+        return env
 
-        return {
-            "test_number": test_number,
-            "status": status,
-            "elapsed_time": elapsed_time,
-            "error_message": error_msg,
-            "output_file": str(output_file)
-        }
-
-    def run_all_tests(self, repositories, whitelists=None, test_ids=None):
+    def run_all_tests(self, repositories, whitelists=None, test_ids=None, jobs=1):
         """Run all tests with address sanitizer configurations.
 
         Args:
             repositories: List of repository names to test
             whitelists: Optional dict of whitelists per repository
             test_ids: Optional set of test IDs to run (filters test list)
+            jobs: Number of tests to run concurrently (1 keeps the GPU exclusive)
         """
         self.prepare_test_list(repositories, whitelists)
 
@@ -473,55 +546,75 @@ class AddressSanitizerRunner:
             return
 
         for test_info in self.test_list:
-            self.test_results[test_info["test_name"]] = {
+            # Keep a direct reference to the result row so recording a result
+            # does not need to look the test up by name again
+            test_info["result_row"] = self.test_results.setdefault(test_info["test_name"], {
                 "test_number": None,
                 "repository": test_info["repository"],
                 "test_file": str(test_info["test_file"]),
                 "test_function": test_info["test_function"] or ""
-            }
+            })
 
         print(f"\nRunning tests with {len(ENV_CONFIGS)} configurations (TRITON_ENABLE_ASAN=1)")
         print("=" * 60)
 
-        for env_key, env_config in ENV_CONFIGS.items():
-            print(f"\nConfiguration: [{env_key}] {env_config['description']}")
-            print("-" * 50)
-
-            for test_info in self.test_list:
-                result = self.run_single_test(test_info, env_key)
+        # With jobs > 1, tests of a configuration run in worker processes. map()
+        # yields results in test order, so test_results is only updated here.
+        executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+        try:
+            for env_key, env_config in ENV_CONFIGS.items():
+                print(f"\nConfiguration: [{env_key}] {env_config['description']}")
+                print("-" * 50)
 
-                test_name = test_info["test_name"]
-                if self.test_results[test_name]["test_number"] is None:
-                    self.test_results[test_name]["test_number"] = result["test_number"]
+                # The environment only depends on the configuration, so it is
+                # built once here and passed to every test
+                env = self._build_env(env_config)
 
-                if result["status"] == "PASSED":
-                    self.test_results[test_name][env_key] = result["elapsed_time"]
+                if executor:
+                    results = executor.map(run_single_test, self.test_list, repeat(env_key), repeat(env),
+                                           repeat(self.max_test_id), repeat(self.output_base_dir))
                 else:
-                    self.test_results[test_name][env_key] = result["status"]
+                    results = (run_single_test(test_info, env_key, env, self.max_test_id, self.output_base_dir)
+                               for test_info in self.test_list)
+
+                for test_info, result in zip(self.test_list, results):
+                    self._record_result(test_info, env_key, result)
+        finally:
+            if executor:
+                executor.shutdown()
+
+    def _record_result(self, test_info, env_key, result):
+        """Store the outcome of one test run in test_results."""
+        row = test_info["result_row"]
+        if row["test_number"] is None:
+            row["test_number"] = result["test_number"]
+
+        if result["status"] == "PASSED":
+            row[env_key] = result["elapsed_time"]
+        else:
+            row[env_key] = result["status"]
 
     def save_results_csv(self):
         """Save test results to CSV file."""
         csv_file = self.output_base_dir / f"results_{self.timestamp}.csv"
 
-        with open(csv_file, "w", newline="") as f:
-            header = ["Test_Number", "Test_Name"]
-            for env_key in ENV_CONFIGS.keys():
-                header.append(env_key)
+        env_keys = list(ENV_CONFIGS.keys())
+        header = ["Test_Number", "Test_Name", *env_keys]
+
+        # Timings are floats; anything else (status strings, "N/A") is
+        # written as-is
+        fmt = "{:.4f}".format
+        rows = [
+            [data.get("test_number", ""), test_name,
+             *(fmt(value) if type(value) is float else value
+               for value in (data.get(env_key, "N/A") for env_key in env_keys))]
+            for test_name, data in self.test_results.items()
+        ]
 
+        with open(csv_file, "w", newline="") as f:
             writer = csv.writer(f)
             writer.writerow(header)
-
-            for test_name, data in self.test_results.items():
-                row = [data.get("test_number", ""), test_name]
-
-                for env_key in ENV_CONFIGS.keys():
-                    value = data.get(env_key, "N/A")
-                    if isinstance(value, float):
-                        row.append(f"{value:.4f}")
-                    else:
-                        row.append(value)
-
-                writer.writerow(row)
+            writer.writerows(rows)
 
         print(f"\nResults saved to: {csv_file}")
         return csv_file
@@ -610,6 +703,12 @@ def main():
         default=None,
         help="Run only specific test IDs (e.g., '1,2,3' or '1-10'). Overrides --repo."
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of tests to run in parallel (default: 1, which keeps the GPU exclusive to one test)"
+    )
     args = parser.parse_args()
 
     # --test-ids overrides --repo
@@ -660,7 +759,7 @@ def main():
         print(f"Running only test IDs: {sorted(test_ids)}")
     print()
 
-    runner.run_all_tests(repos, whitelists, test_ids=test_ids)
+    runner.run_all_tests(repos, whitelists, test_ids=test_ids, jobs=args.jobs)
     runner.save_results_csv()
     runner.print_summary()
 
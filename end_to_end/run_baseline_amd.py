@@ -24,7 +24,7 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from utils.test_registry import REPO_CONFIGS, get_configs_by_group
-from utils.misc import EASTERN_TZ
+from utils.misc import eastern_tz
 
 # Get baseline configurations from registry
 ENV_CONFIGS = get_configs_by_group("baseline")
@@ -39,7 +39,7 @@ class BaselineAMDRunner:
         self.project_root = self.script_dir.parent
         self.output_base_dir = self.script_dir / "results" / "baseline_amd"
         self.output_base_dir.mkdir(parents=True, exist_ok=True)
-        self.timestamp = datetime.now(EASTERN_TZ).strftime("%Y%m%d_%H%M%S")
+        self.timestamp = datetime.now(eastern_tz()).strftime("%Y%m%d_%H%M%S")
         self.global_test_counter = 0
         self.total_tests = 0
         self.test_results = OrderedDict()
@@ -246,7 +246,7 @@ class BaselineAMDRunner:
                 log_file.write(f"Test: {test_info['test_name']}\n")
                 log_file.write(f"Environment: {env_config_key}\n")
                 log_file.write(f"Command: {' '.join(cmd)}\n")
-                log_file.write(f"Start Time: {datetime.now(EASTERN_TZ).isoformat()}\n")
+                log_file.write(f"Start Time: {datetime.now(eastern_tz()).isoformat()}\n")
                 log_file.write("=" * 80 + "\n")
                 log_file.flush()
 
@@ -277,7 +277,7 @@ class BaselineAMDRunner:
 
         with open(output_file, "a") as log_file:
             log_file.write("\n" + "=" * 80 + "\n")
-            log_file.write(f"End Time: {datetime.now(EASTERN_TZ).isoformat()}\n")
+            log_file.write(f"End Time: {datetime.now(eastern_tz()).isoformat()}\n")
             log_file.write(f"Elapsed Time: {elapsed_time:.4f} seconds\n")
             log_file.write(f"Status: {status}\n")
             if error_msg:
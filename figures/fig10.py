@@ -1,11 +1,54 @@
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patheffects as path_effects
 from matplotlib.patches import FancyBboxPatch
 from pathlib import Path
+import mmap
+import os
+import pickle
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import re
 
 
+# pytest node id with its parameter id, e.g. test/test_geglu.py::test_correctness[32-128-float32]
+_RE_TEST_NAME = re.compile(r'(.+?)\[(.*?)\]')
+# Timing values only match well-formed numbers (e.g. 0.25, 1e-2), so every
+# captured string can be handed to float() in one batch without a try/except
+# Compilation stage timing, e.g. "ttgir compilation took 0.02 seconds"
+_RE_COMPILE_TIMING = re.compile(
+    r'(?P<phase>AST parsing|ttir compilation|ttgir compilation|llir compilation|ptx compilation|cubin compilation)'
+    r' took\s+(?P<time>\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)\s+seconds'
+)
+# Compilation phase as logged -> stage name used in the breakdown
+_PHASE_MAP = {
+    'AST parsing': 'AST parsing',
+    'ttir compilation': 'TTIR',
+    'ttgir compilation': 'TTGIR',
+    'llir compilation': 'LLIR',
+    'ptx compilation': 'PTX',
+    'cubin compilation': 'CUBIN',
+}
+# Kernel execution timing, e.g. "Forward kernel elapsed time: 1.5 ms" / "kernel elapsed time: 0.5 seconds".
+# Used with match: only a line whose first ':' ends "elapsed time:" counts, so
+# "[kernel] foo: elapsed time: 3 ms" is not a timing line
+_RE_ELAPSED = re.compile(
+    r'[^:]*elapsed time:\s*(?P<time>[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)\s*(?P<unit>ms|second)'
+)
+# Kernel timing on raw z3.txt bytes; [^\S\n] keeps each match on one line.
+# Only a line whose first ':' ends "kernel elapsed time:" and whose value runs
+# up to the next ':' or the line end counts, e.g. "kernel elapsed time: 2 ms"
+# but not "a.py::t[1] kernel elapsed time: 3 ms" or "... 0.5 seconds, grid: 2"
+_RE_KERNEL_ELAPSED_BYTES = re.compile(
+    rb'^[^:\n]*kernel elapsed time:[^\S\n]*(?P<time>[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)'
+    rb'[^\S\n]*(?P<unit>ms|seconds?)[^\S\n]*(?::|$)',
+    re.M
+)
+
+# Per-subdirectory cache of parsed breakdown totals
+BREAKDOWN_CACHE_NAME = '.breakdown_cache.pkl'
+
+
 # --- Global look & feel (one-time) ---
 def set_global_style():
     plt.rcParams.update({
@@ -18,169 +61,139 @@ def set_global_style():
         "figure.facecolor": "white",
     })
 
+# White outline behind bar labels, shared by every label
+_STROKE = [path_effects.withStroke(linewidth=2, foreground='white')]
+
 def _outlined_text(ax, x, y, text, **kw):
     t = ax.text(x, y, text, **kw)
-    t.set_path_effects([path_effects.withStroke(linewidth=3, foreground='white')])
+    t.set_path_effects(_STROKE)
     return t
 
 def parse_test_name(test_name):
     """Parse test name to extract kernel name and data shape."""
-    match = re.match(r'(.+?)\[(.*?)\]', test_name)
+    match = _RE_TEST_NAME.match(test_name)
     if match:
-        kernel_name = match.group(1).split('::')[-1]
+        kernel_name = match.group(1).rpartition('::')[2]
         data_shape = match.group(2)
         return kernel_name, data_shape
     return None, None
 
 def parse_compile_file(filepath):
-    """Parse compile.txt file to extract and sum compilation stage timings."""
-    data = defaultdict(lambda: defaultdict(float))
-
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
+    """Parse compile.txt file and return the total time of each compilation stage."""
+    # Raw timing strings per stage, converted in one pass once the file is read
+    stage_times = {stage: [] for stage in _PHASE_MAP.values()}
 
     current_test = None
-    for line in lines:
-        line = line.strip()
-
-        # Check for test name lines
-        if '::' in line and '[' in line and ']' in line:
-            test_name = line.split()[0]
-            kernel, shape = parse_test_name(test_name)
-            if kernel and shape:
-                current_test = (kernel, shape)
-
-                # Parse the rest of the line for timing info
-                rest_of_line = ' '.join(line.split()[1:])
-                if 'AST parsing took' in rest_of_line:
-                    time_val = float(rest_of_line.split('took')[1].split('seconds')[0].strip())
-                    data[current_test]['AST parsing'] += time_val
-
-        # Check for test case lines (for different format like tritonbench)
-        elif 'test case' in line:
-            # Handle both "test case 1: torch.Size([2, 3, 4, 5])" and "test case 1"
-            if ':' in line and 'torch.Size' in line:
-                shape_part = line.split(':')[1].strip()
-                shape = shape_part.replace('torch.Size([', '').replace('])', '').replace(', ', '-')
-                current_test = ('test_case', shape)
-            else:
-                # Simple test case format like "test case 1"
-                test_num = line.replace('test case', '').strip()
-                current_test = ('test_case', test_num)
-
-        # Parse compilation timing lines
-        elif 'took' in line and 'seconds' in line:
-            if current_test:
-                if 'AST parsing' in line:
-                    time_val = float(line.split('took')[1].split('seconds')[0].strip())
-                    data[current_test]['AST parsing'] += time_val
-                elif 'ttir compilation' in line:
-                    time_val = float(line.split('took')[1].split('seconds')[0].strip())
-                    data[current_test]['TTIR'] += time_val
-                elif 'ttgir compilation' in line:
-                    time_val = float(line.split('took')[1].split('seconds')[0].strip())
-                    data[current_test]['TTGIR'] += time_val
-                elif 'llir compilation' in line:
-                    time_val = float(line.split('took')[1].split('seconds')[0].strip())
-                    data[current_test]['LLIR'] += time_val
-                elif 'ptx compilation' in line:
-                    time_val = float(line.split('took')[1].split('seconds')[0].strip())
-                    data[current_test]['PTX'] += time_val
-                elif 'cubin compilation' in line:
-                    time_val = float(line.split('took')[1].split('seconds')[0].strip())
-                    data[current_test]['CUBIN'] += time_val
-
-    return data
+    with open(filepath, 'r') as f:
+        for line in f:
+            # Most lines are neither a test header nor a timing line
+            if 'took' not in line and '::' not in line and 'test case' not in line:
+                continue
+            line = line.strip()
+
+            # Check for test name lines
+            if '::' in line and '[' in line and ']' in line:
+                kernel, shape = parse_test_name(line.partition(' ')[0])
+                if kernel and shape:
+                    current_test = (kernel, shape)
+
+                    # Only AST parsing is printed on the test name line itself
+                    timing = _RE_COMPILE_TIMING.search(line)
+                    if timing and timing.group('phase') == 'AST parsing':
+                        stage_times['AST parsing'].append(timing.group('time'))
+
+            # Check for test case lines (for different format like tritonbench)
+            elif 'test case' in line:
+                # Handle both "test case 1: torch.Size([2, 3, 4, 5])" and "test case 1"
+                if ':' in line and 'torch.Size' in line:
+                    shape_part = line.partition(':')[2].strip()
+                    shape = shape_part.replace('torch.Size([', '').replace('])', '').replace(', ', '-')
+                    current_test = ('test_case', shape)
+                else:
+                    # Simple test case format like "test case 1"
+                    test_num = line.replace('test case', '').strip()
+                    current_test = ('test_case', test_num)
+
+            # Parse compilation timing lines
+            elif current_test and 'took' in line and 'seconds' in line:
+                timing = _RE_COMPILE_TIMING.search(line)
+                if timing:
+                    stage_times[_PHASE_MAP[timing.group('phase')]].append(timing.group('time'))
+
+    return {stage: sum(map(float, values)) for stage, values in stage_times.items()}
 
 def parse_z3_file(filepath):
     """Parse z3.txt file to extract and sum all kernel elapsed times."""
-    total_time_ms = 0
-
-    if not filepath.exists():
+    try:
+        f = open(filepath, 'rb')
+    except FileNotFoundError:
         return 0
 
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
-
-    for line in lines:
-        line = line.strip()
-        if 'kernel elapsed time:' in line:
-            # Parse the time value - can be in ms or seconds
-            time_part = line.split(':')[1].strip()
-
-            if 'ms' in time_part:
-                # Time in milliseconds
-                time_str = time_part.replace('ms', '').strip()
-                if time_str:
-                    try:
-                        time_val = float(time_str)
-                        total_time_ms += time_val
-                    except ValueError:
-                        continue
-            elif 'second' in time_part:
-                # Time in seconds - convert to milliseconds
-                time_str = time_part.replace('seconds', '').replace('second', '').strip()
-                if time_str:
-                    try:
-                        time_val = float(time_str) * 1000  # Convert to ms
-                        total_time_ms += time_val
-                    except ValueError:
-                        continue
-
-    return total_time_ms
+    # Raw timing strings by unit, converted in one pass once the file is read
+    ms_times, second_times = [], []
+
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0  # mmap cannot map an empty file
+        # z3 logs carry one timing line per kernel launch, so the whole file
+        # is scanned as bytes instead of being decoded and split into lines
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for timing in _RE_KERNEL_ELAPSED_BYTES.finditer(mm):
+                # The time value can be in ms or seconds
+                if timing.group('unit') == b'ms':
+                    ms_times.append(timing.group('time'))
+                else:
+                    second_times.append(timing.group('time'))
+
+    return sum(map(float, ms_times)) + sum(map(float, second_times)) * 1000  # Convert seconds to ms
 
 def parse_execution_file(filepath):
     """Parse execution.txt file to extract and sum all execution timings."""
     data = defaultdict(float)
 
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
-
     current_test = None
-    for line in lines:
-        line = line.strip()
-
-        # Check for test name lines
-        if '::' in line and '[' in line and ']' in line:
-            test_name = line.split()[0]
-            kernel, shape = parse_test_name(test_name)
-            if kernel and shape:
-                current_test = (kernel, shape)
-
-                # Parse the rest of the line for timing info
-                rest_of_line = ' '.join(line.split()[1:])
-                if 'Forward kernel elapsed time:' in rest_of_line:
-                    time_val = float(rest_of_line.split(':')[1].split('ms')[0].strip())
-                    data[current_test] += time_val
-                elif 'Backward kernel elapsed time:' in rest_of_line:
-                    time_val = float(rest_of_line.split(':')[1].split('ms')[0].strip())
-                    data[current_test] += time_val
-
-        # Check for test case lines (for different format like tritonbench)
-        elif 'test case' in line:
-            # Handle both "test case 1: torch.Size([2, 3, 4, 5])" and "test case 1"
-            if ':' in line and 'torch.Size' in line:
-                shape_part = line.split(':')[1].strip()
-                shape = shape_part.replace('torch.Size([', '').replace('])', '').replace(', ', '-')
-                current_test = ('test_case', shape)
-            else:
-                # Simple test case format like "test case 1"
-                test_num = line.replace('test case', '').strip()
-                current_test = ('test_case', test_num)
-
-        # Parse execution timing lines
-        elif 'elapsed time:' in line:
-            if current_test:
-                # Parse the time value and unit
-                time_part = line.split(':')[1].strip()
-                if 'ms' in time_part:
-                    # Time in milliseconds
-                    time_val = float(time_part.split('ms')[0].strip())
-                    data[current_test] += time_val
-                elif 'seconds' in time_part or 'second' in time_part:
-                    # Time in seconds - convert to milliseconds
-                    time_val = float(time_part.split('second')[0].strip())
-                    data[current_test] += time_val * 1000  # Convert to ms
+    with open(filepath, 'r') as f:
+        for line in f:
+            # Most lines are neither a test header nor a timing line
+            if 'elapsed time:' not in line and '::' not in line and 'test case' not in line:
+                continue
+            line = line.strip()
+
+            # Check for test name lines
+            if '::' in line and '[' in line and ']' in line:
+                test_name, _, rest_of_line = line.partition(' ')
+                kernel, shape = parse_test_name(test_name)
+                if kernel and shape:
+                    current_test = (kernel, shape)
+
+                    # Parse the rest of the line for timing info
+                    if 'Forward kernel elapsed time:' in rest_of_line or 'Backward kernel elapsed time:' in rest_of_line:
+                        timing = _RE_ELAPSED.match(rest_of_line)
+                        if timing and timing.group('unit') == 'ms':
+                            data[current_test] += float(timing.group('time'))
+
+            # Check for test case lines (for different format like tritonbench)
+            elif 'test case' in line:
+                # Handle both "test case 1: torch.Size([2, 3, 4, 5])" and "test case 1"
+                if ':' in line and 'torch.Size' in line:
+                    shape_part = line.partition(':')[2].strip()
+                    shape = shape_part.replace('torch.Size([', '').replace('])', '').replace(', ', '-')
+                    current_test = ('test_case', shape)
+                else:
+                    # Simple test case format like "test case 1"
+                    test_num = line.replace('test case', '').strip()
+                    current_test = ('test_case', test_num)
+
+            # Parse execution timing lines
+            elif 'elapsed time:' in line:
+                timing = _RE_ELAPSED.match(line) if current_test else None
+                if timing:
+                    time_val = float(timing.group('time'))
+                    if timing.group('unit') == 'ms':
+                        data[current_test] += time_val
+                    else:
+                        # Time in seconds - convert to milliseconds
+                        data[current_test] += time_val * 1000  # Convert to ms
 
     return data
 
@@ -188,33 +201,117 @@ def parse_end_to_end_file(filepath):
     """Parse end_to_end.txt file to extract compute-sanitizer and z3 total times."""
     times = {'compute-sanitizer': 0, 'z3': 0}
 
-    if not filepath.exists():
+    try:
+        f = open(filepath, 'r')
+    except FileNotFoundError:
         return times
 
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
-
-    for line in lines:
-        line = line.strip()
-        if 'compute-sanitizer:' in line:
-            # Parse time, handling both "seconds" and "s" formats
-            time_part = line.split(':')[1].strip()
-            if 'second' in time_part:
-                time_str = time_part.replace('seconds', '').replace('second', '').strip()
-            else:
-                time_str = time_part.replace('s', '').strip()
-            times['compute-sanitizer'] = float(time_str)
-        elif 'z3:' in line:
-            # Parse time, handling both "seconds" and "s" formats
-            time_part = line.split(':')[1].strip()
-            if 'second' in time_part:
-                time_str = time_part.replace('seconds', '').replace('second', '').strip()
-            else:
-                time_str = time_part.replace('s', '').strip()
-            times['z3'] = float(time_str)
+    with f:
+        for line in f:
+            line = line.strip()
+            if 'compute-sanitizer:' in line:
+                # Parse time, handling both "seconds" and "s" formats
+                time_part = line.partition(':')[2].strip()
+                if 'second' in time_part:
+                    time_str = time_part.replace('seconds', '').replace('second', '').strip()
+                else:
+                    time_str = time_part.replace('s', '').strip()
+                times['compute-sanitizer'] = float(time_str)
+            elif 'z3:' in line:
+                # Parse time, handling both "seconds" and "s" formats
+                time_part = line.partition(':')[2].strip()
+                if 'second' in time_part:
+                    time_str = time_part.replace('seconds', '').replace('second', '').strip()
+                else:
+                    time_str = time_part.replace('s', '').strip()
+                times['z3'] = float(time_str)
 
     return times
 
+def _mtime_ns(path):
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def parse_breakdown_subdir(subdir):
+    """Parse one breakdown subdirectory into a row of per-stage totals (seconds).
+
+    Returns None when the compile or execution log is missing. The row is
+    cached in the subdirectory and reused until one of its logs changes.
+    """
+    compile_file = subdir / 'compile.txt'
+    execution_file = subdir / 'execution.txt'
+    z3_file = subdir / 'z3.txt'
+    end_to_end_file = subdir / 'end_to_end.txt'
+
+    key = tuple(_mtime_ns(f) for f in (compile_file, execution_file, z3_file, end_to_end_file))
+    if key[0] is None or key[1] is None:
+        return None
+
+    cache_file = subdir / BREAKDOWN_CACHE_NAME
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, row = pickle.load(f)
+        if cached_key == key:
+            return row
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+        pass
+
+    compile_totals = parse_compile_file(compile_file)
+    execution_data = parse_execution_file(execution_file)
+    z3_time_ms = parse_z3_file(z3_file)
+    end_to_end_times = parse_end_to_end_file(end_to_end_file)
+
+    folder_totals = {**compile_totals, 'Execution': 0}
+
+    for tk in execution_data:
+        folder_totals['Execution'] += execution_data[tk] / 1000.0  # ms -> s
+
+    row = {
+        'source': subdir.name,
+        'z3_time': z3_time_ms / 1000.0,
+        'end_to_end_compute_sanitizer': end_to_end_times['compute-sanitizer'],
+        'end_to_end_z3': end_to_end_times['z3'],
+        **folder_totals
+    }
+
+    try:
+        with open(cache_file, 'wb') as f:
+            pickle.dump((key, row), f)
+    except OSError:
+        pass  # read-only data directory; parse again next time
+
+    return row
+
+def load_breakdown_data(breakdown_dir):
+    """Parse every breakdown subdirectory into one row of per-stage totals (seconds)."""
+    subdirs = [subdir for subdir in Path(breakdown_dir).iterdir() if subdir.is_dir()]
+
+    # Subdirectories are independent, so they are parsed in parallel; map
+    # keeps the results in directory order
+    with ProcessPoolExecutor() as executor:
+        rows = list(executor.map(parse_breakdown_subdir, subdirs))
+
+    all_data = []
+    for row in rows:
+        if row is not None:
+            print(f"\nProcessing {row['source']}...")
+            all_data.append(row)
+
+    return all_data
+
+# Per-stage totals (seconds) behind the published figure, in the row format
+# returned by load_breakdown_data
+CACHED_BREAKDOWN_DATA = [
+    {"source": "ligerkernel_fuse_linear_jsd", "z3_time": 0.45166999999999996, "end_to_end_compute_sanitizer": 33.33, "end_to_end_z3": 4.45, "AST parsing": 0.05, "TTIR": 0.0, "TTGIR": 0.05, "LLIR": 1.53, "PTX": 0.86, "CUBIN": 9.6, "Execution": 16.193939999999998},
+    {"source": "tritonbench_chunk_delta_fwd", "z3_time": 0.11, "end_to_end_compute_sanitizer": 25.252, "end_to_end_z3": 4.335, "AST parsing": 0.33, "TTIR": 0.09, "TTGIR": 0.29000000000000004, "LLIR": 6.72, "PTX": 2.24, "CUBIN": 9.280000000000001, "Execution": 1.8900000000000001},
+    {"source": "ligerkernel_geglu", "z3_time": 0.020309999999999998, "end_to_end_compute_sanitizer": 23.56, "end_to_end_z3": 9.22, "AST parsing": 0.15000000000000002, "TTIR": 0.0, "TTGIR": 0.01, "LLIR": 0.33, "PTX": 0.08, "CUBIN": 0.16, "Execution": 0.0142},
+    {"source": "tritonbench_reversed_cumsum", "z3_time": 0.10462, "end_to_end_compute_sanitizer": 8.66, "end_to_end_z3": 4.364, "AST parsing": 0.3899999999999999, "TTIR": 0.0, "TTGIR": 0.32999999999999996, "LLIR": 3.03, "PTX": 0.8400000000000001, "CUBIN": 1.6600000000000001, "Execution": 0},
+    {"source": "ligerkernel_kldiv", "z3_time": 0.05204, "end_to_end_compute_sanitizer": 7.75, "end_to_end_z3": 3.92, "AST parsing": 0.19999999999999998, "TTIR": 0.0, "TTGIR": 0.0, "LLIR": 0.43000000000000005, "PTX": 0.12000000000000001, "CUBIN": 0.23000000000000004, "Execution": 0.47458},
+    {"source": "tritonbench_rotary_emb_nopad", "z3_time": 0.05256, "end_to_end_compute_sanitizer": 5.541, "end_to_end_z3": 4.396, "AST parsing": 0, "TTIR": 0, "TTGIR": 0, "LLIR": 0, "PTX": 0, "CUBIN": 0, "Execution": 1.87},
+]
+
 def create_breakdown_plots(breakdown_dir='breakdown_data_'):
     set_global_style()
 
@@ -225,51 +322,16 @@ def create_breakdown_plots(breakdown_dir='breakdown_data_'):
     ANNOT_FS  = 26   # numbers on bars / “CS: …s”
     LEGEND_FS = 24
 
-    breakdown_path = Path(breakdown_dir)
-    all_data = []
+    # Shared styling for every bar segment and every in-plot label
+    BAR_KW = dict(edgecolor='#2c3e50', linewidth=1.2)
+    LBL_KW = dict(ha='center', va='center', fontsize=ANNOT_FS, fontweight='bold')
 
-    for subdir in breakdown_path.iterdir():
-        if not subdir.is_dir():
-            continue
-
-        compile_file = subdir / 'compile.txt'
-        execution_file = subdir / 'execution.txt'
-        z3_file = subdir / 'z3.txt'
-        if not (compile_file.exists() and execution_file.exists()):
-            continue
-
-        print(f"\nProcessing {subdir.name}...")
-
-        compile_data = parse_compile_file(compile_file)
-        execution_data = parse_execution_file(execution_file)
-        z3_time_ms = parse_z3_file(z3_file)
-
-        end_to_end_file = subdir / 'end_to_end.txt'
-        end_to_end_times = parse_end_to_end_file(end_to_end_file)
-
-        folder_totals = {
-            'AST parsing': 0, 'TTIR': 0, 'TTGIR': 0,
-            'LLIR': 0, 'PTX': 0, 'CUBIN': 0, 'Execution': 0
-        }
-
-        for tk in compile_data:
-            folder_totals['AST parsing'] += compile_data[tk].get('AST parsing', 0)
-            folder_totals['TTIR']        += compile_data[tk].get('TTIR', 0)
-            folder_totals['TTGIR']       += compile_data[tk].get('TTGIR', 0)
-            folder_totals['LLIR']        += compile_data[tk].get('LLIR', 0)
-            folder_totals['PTX']         += compile_data[tk].get('PTX', 0)
-            folder_totals['CUBIN']       += compile_data[tk].get('CUBIN', 0)
-
-        for tk in execution_data:
-            folder_totals['Execution'] += execution_data[tk] / 1000.0  # ms -> s
-
-        all_data.append({
-            'source': subdir.name,
-            'z3_time': z3_time_ms / 1000.0,
-            'end_to_end_compute_sanitizer': end_to_end_times['compute-sanitizer'],
-            'end_to_end_z3': end_to_end_times['z3'],
-            **folder_totals
-        })
+    if os.environ.get('USE_CACHED_DATA', '1') != '0':
+        # The figure is drawn from the cached totals; the logs under
+        # breakdown_dir are only parsed when USE_CACHED_DATA=0
+        all_data = CACHED_BREAKDOWN_DATA
+    else:
+        all_data = load_breakdown_data(breakdown_dir)
 
     if not all_data:
         print("No valid data found!")
@@ -299,58 +361,62 @@ def create_breakdown_plots(breakdown_dir='breakdown_data_'):
     row_gap = 0.80
     pair_gap = 0.18
 
-    folder_names, y_main, y_z3 = [], [], []
+    folder_names = []
 
     x_right = 102.8
     xlim_max = 103.0
 
-    all_data = [{"source": "ligerkernel_fuse_linear_jsd", "z3_time": 0.45166999999999996, "end_to_end_compute_sanitizer": 33.33, "end_to_end_z3": 4.45, "AST parsing": 0.05, "TTIR": 0.0, "TTGIR": 0.05, "LLIR": 1.53, "PTX": 0.86, "CUBIN": 9.6, "Execution": 16.193939999999998}, {"source": "tritonbench_chunk_delta_fwd", "z3_time": 0.11, "end_to_end_compute_sanitizer": 25.252, "end_to_end_z3": 4.335, "AST parsing": 0.33, "TTIR": 0.09, "TTGIR": 0.29000000000000004, "LLIR": 6.72, "PTX": 2.24, "CUBIN": 9.280000000000001, "Execution": 1.8900000000000001}, {"source": "ligerkernel_geglu", "z3_time": 0.020309999999999998, "end_to_end_compute_sanitizer": 23.56, "end_to_end_z3": 9.22, "AST parsing": 0.15000000000000002, "TTIR": 0.0, "TTGIR": 0.01, "LLIR": 0.33, "PTX": 0.08, "CUBIN": 0.16, "Execution": 0.0142}, {"source": "tritonbench_reversed_cumsum", "z3_time": 0.10462, "end_to_end_compute_sanitizer": 8.66, "end_to_end_z3": 4.364, "AST parsing": 0.3899999999999999, "TTIR": 0.0, "TTGIR": 0.32999999999999996, "LLIR": 3.03, "PTX": 0.8400000000000001, "CUBIN": 1.6600000000000001, "Execution": 0}, {"source": "ligerkernel_kldiv", "z3_time": 0.05204, "end_to_end_compute_sanitizer": 7.75, "end_to_end_z3": 3.92, "AST parsing": 0.19999999999999998, "TTIR": 0.0, "TTGIR": 0.0, "LLIR": 0.43000000000000005, "PTX": 0.12000000000000001, "CUBIN": 0.23000000000000004, "Execution": 0.47458}, {"source": "tritonbench_rotary_emb_nopad", "z3_time": 0.05256, "end_to_end_compute_sanitizer": 5.541, "end_to_end_z3": 4.396, "AST parsing": 0, "TTIR": 0, "TTGIR": 0, "LLIR": 0, "PTX": 0, "CUBIN": 0, "Execution": 1.87}]
-
-
-    for idx, dp in enumerate(reversed(all_data)):
+    names_cs = stages + ['Others']
+
+    # Rows are stacked bottom-up, so the first entry of all_data is drawn on top
+    y_main = np.arange(len(all_data))[::-1] * row_gap * 2
+    y_z3 = y_main - bar_h - pair_gap
+
+    # CS stacked-bar segments for every row at once: stage values plus the
+    # unmeasured remainder, as percentages of each row's end-to-end time
+    stage_vals = np.array([[dp[s] for s in stages] for dp in all_data], dtype=np.float64)
+    measured_cs = stage_vals.sum(axis=1)
+    cs_totals = np.array([dp.get('end_to_end_compute_sanitizer', measured)
+                          for dp, measured in zip(all_data, measured_cs)], dtype=np.float64)
+    vals_cs = np.column_stack([stage_vals, np.maximum(0.0, cs_totals - measured_cs)])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pct_cs = np.where(cs_totals[:, None] > 0, vals_cs / cs_totals[:, None] * 100.0, 0.0)
+    # Each segment starts where the previous ones end
+    left_cs = np.zeros_like(pct_cs)
+    np.cumsum(pct_cs[:, :-1], axis=1, out=left_cs[:, 1:])
+
+    # Triton-Sanitizer bar segments, collected per row and drawn together below
+    ts_y, ts_exec_w = [], []
+    ts_other_y, ts_other_w, ts_other_left = [], [], []
+
+    for idx, dp in enumerate(all_data):
         # --- name cleanup ---
         fname = dp['source']
         if '_' in fname:
-            fname = fname.split('_', 1)[1]
+            fname = fname.partition('_')[2]
         folder_names.append(fname)
 
-        y_cs = idx * row_gap * 2
-        y_ts = y_cs - bar_h - pair_gap
-        y_main.append(y_cs); y_z3.append(y_ts)
+        y_cs = y_main[idx]
+        y_ts = y_z3[idx]
 
         # --- CS stacked bar ---
-        values = [dp[s] for s in stages]
-        measured_cs = sum(values)
-        e2e_cs = dp.get('end_to_end_compute_sanitizer', measured_cs)
-        others_cs = max(0.0, e2e_cs - measured_cs)
-        vals_cs = values + [others_cs]
-        names_cs = stages + ['Others']
+        e2e_cs = cs_totals[idx]
 
-        pct_cs = [(v / e2e_cs) * 100.0 if e2e_cs > 0 else 0.0 for v in vals_cs]
-
-        left = 0.0
         for i, stage in enumerate(names_cs):
-            width = pct_cs[i]
-            ax.barh(
-                y_cs, width, left=left, height=bar_h,
-                color=colors.get(stage, '#bdbdbd'),
-                edgecolor='#2c3e50', linewidth=1.2,
-                label=stage if idx == 0 else None
-            )
+            width = pct_cs[idx, i]
+            left = left_cs[idx, i]
             if width > 5:
                 _outlined_text(
                     ax, left + width/2, y_cs, f'{width:.1f}%',
-                    ha='center', va='center',
-                    fontsize=ANNOT_FS, color='#2c3e50', fontweight='bold',
-                ).set_path_effects([path_effects.withStroke(linewidth=2, foreground='white')])
-            left += width
+                    color='#2c3e50', **LBL_KW
+                )
 
         # --- Compact CS total text (no background patch) ---
         cs_w = 2.6
         cs_x = x_right - cs_w
         ax.text(
             cs_x + cs_w/2 + 4.1, y_cs, f'CS: {e2e_cs:.1f}s',
-            ha='center', va='center', fontsize=ANNOT_FS, color='#7a5b14', fontweight='bold'
+            color='#7a5b14', **LBL_KW
         )
 
         # --- Triton-Sanitizer (Z3) bar ---
@@ -361,47 +427,62 @@ def create_breakdown_plots(breakdown_dir='breakdown_data_'):
             exec_w  = (z3_meas / e2e_z3) * total_w if e2e_z3 > 0 else 0.0
             other_w = max(0.0, total_w - exec_w)
 
-            ax.barh(
-                y_ts, exec_w, height=bar_h, color=z3_color,
-                edgecolor='#2c3e50', linewidth=1.2,
-                label='Triton-Sanitizer' if idx == 0 else None
-            )
+            ts_y.append(y_ts); ts_exec_w.append(exec_w)
             if exec_w > 5:
                 _outlined_text(
                     ax, exec_w/2, y_ts,
                     f'{(z3_meas/e2e_z3)*100:.1f}%',
-                    ha='center', va='center', fontsize=ANNOT_FS, color='#0e3b66', fontweight='bold'
-                ).set_path_effects([path_effects.withStroke(linewidth=2, foreground='white')])
+                    color='#0e3b66', **LBL_KW
+                )
 
             if other_w > 0:
-                ax.barh(
-                    y_ts, other_w, left=exec_w, height=bar_h,
-                    color=colors['Others'], edgecolor='#2c3e50', linewidth=1.2
-                )
+                ts_other_y.append(y_ts); ts_other_w.append(other_w); ts_other_left.append(exec_w)
                 if other_w > 5:
                     _outlined_text(
                         ax, exec_w + other_w/2, y_ts,
                         f'{(1 - z3_meas/e2e_z3)*100:.1f}%',
-                        ha='center', va='center', fontsize=ANNOT_FS, color='#2c3e50', fontweight='bold'
-                    ).set_path_effects([path_effects.withStroke(linewidth=2, foreground='white')])
+                        color='#2c3e50', **LBL_KW
+                    )
 
             # small Z3 text (no background patch)
             z3_w = 2.6
             z3_x = x_right - z3_w
             ax.text(
                 z3_x + z3_w/2 + 4, y_ts, f'TS: {e2e_z3:.1f}s',
-                ha='center', va='center', fontsize=ANNOT_FS, color='#0e3b66', fontweight='bold'
+                color='#0e3b66', **LBL_KW
             )
 
+    # One barh call per segment color across all rows instead of one per bar.
+    # Zero-width segments draw nothing, so no patch is created for them; a stage
+    # that is zero everywhere still gets its bars so its legend entry remains.
+    for i, stage in enumerate(names_cs):
+        drawn = pct_cs[:, i] > 0
+        if not drawn.any():
+            drawn[:] = True
+        ax.barh(
+            y_main[drawn], pct_cs[drawn, i], left=left_cs[drawn, i], height=bar_h,
+            color=colors.get(stage, '#bdbdbd'), label=stage, **BAR_KW
+        )
+    if ts_y:
+        ax.barh(
+            ts_y, ts_exec_w, height=bar_h, color=z3_color,
+            label='Triton-Sanitizer', **BAR_KW
+        )
+    if ts_other_y:
+        ax.barh(
+            ts_other_y, ts_other_w, left=ts_other_left, height=bar_h,
+            color=colors['Others'], **BAR_KW
+        )
+
     # y-tick labels centered between the row pair
-    y_mid = [(a + b) / 2 for a, b in zip(y_main, y_z3)]
+    y_mid = (y_main + y_z3) / 2
     ax.set_yticks(y_mid)
     ax.set_yticklabels(folder_names, fontsize=YTICK_FS, rotation=0, ha='right', color='#2c3e50')
 
     # axes labels/limits
     ax.set_xlabel('Percentage of End-to-End Time (%)', fontsize=LABEL_FS, fontweight='bold', color='#2c3e50')
     ax.set_xlim(0, xlim_max)
-    ax.set_ylim(min(y_z3) - 0.5, max(y_main) + 0.5)
+    ax.set_ylim(y_z3.min() - 0.5, y_main.max() + 0.5)
 
     # spines & ticks
     for s in ['top', 'right']:
@@ -436,5 +517,5 @@ def create_breakdown_plots(breakdown_dir='breakdown_data_'):
     plt.show()
 
 
-create_breakdown_plots()
-
+if __name__ == '__main__':
+    create_breakdown_plots()
@@ -1,7 +1,6 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import os
 from pathlib import Path
 
 # Set font to Times New Roman (install ttf-mscorefonts-installer if not available)
@@ -10,46 +9,42 @@ plt.rcParams['font.serif'] = ['Times New Roman', 'Liberation Serif', 'DejaVu Ser
 plt.rcParams['mathtext.fontset'] = 'custom'
 plt.rcParams['mathtext.rm'] = 'Times New Roman'
 
-def load_and_clean_data(filepath, source_name):
-    data = []
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
-        
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        parts = line.split('\t')
-        
-        if len(parts) == 3:
-            baseline_str = parts[0]
-            cs_str = parts[1]
-            z3_str = parts[2]
-            
-            try:
-                baseline = float(baseline_str)
-            except:
-                continue
-                
-            if cs_str.lower() in ['oom', 'failed'] or z3_str.lower() in ['oom', 'failed']:
-                continue
-                
-            try:
-                cs = float(cs_str)
-                z3 = float(z3_str)
-                
-                if cs > 0 and z3 > 0 and baseline > 0:
-                    data.append({
-                        'baseline_time': baseline * 1000,  # Convert to ms
-                        'cs_time': cs * 1000,  # Convert to ms
-                        'z3_time': z3 * 1000,  # Convert to ms
-                        'source': source_name
-                    })
-            except:
-                continue
-                
-    return pd.DataFrame(data)
+# Cells recorded instead of a time when a run did not finish
+_MISSING = ('oom', 'failed')
+
+def _parse_time(value):
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+def _to_times(cells):
+    """Convert a column of strings to float64, NaN for OOM/failed or otherwise invalid cells."""
+    cells = np.char.strip(cells)
+    cells[np.isin(np.char.lower(cells), _MISSING)] = 'nan'
+    try:
+        return cells.astype(np.float64)
+    except ValueError:
+        # Stray non-numeric cells (e.g. a header line): convert one by one
+        return np.array([_parse_time(c) for c in cells], dtype=np.float64)
+
+def load_and_clean_data(lines, source_name):
+    # Keep the tab-separated "baseline, cs, z3" rows and convert each column
+    # in one NumPy pass instead of calling float() per cell
+    rows = [parts for parts in (line.strip().split('\t') for line in lines) if len(parts) == 3]
+
+    cells = np.array(rows, dtype=str).reshape(-1, 3)
+    times = np.column_stack([_to_times(cells[:, i]) for i in range(3)])
+
+    # Drop rows with a missing, invalid or non-positive time
+    times = times[(times > 0).all(axis=1)] * 1000  # Convert to ms
+
+    return pd.DataFrame({
+        'baseline_time': times[:, 0],
+        'cs_time': times[:, 1],
+        'z3_time': times[:, 2],
+        'source': source_name
+    })
 
 data_dir = Path('/home/hwu27/workspace/triton-viz-figures/overhead_data')
 all_data = []
@@ -58,29 +53,26 @@ for file in data_dir.glob('*.txt'):
     source_name = file.stem
     print(f"Processing {file.name}...")
     
-    if file.name == 'flaggems.txt':
-        df_temp = load_and_clean_data(file, source_name)
-    else:
-        with open(file, 'r') as f:
-            lines = f.readlines()
-            
-        if lines and ('baseline' in lines[0].lower() or '_4090' in lines[0]):
-            lines = lines[1:]
-            
-        temp_file = '/tmp/temp_data.txt'
-        with open(temp_file, 'w') as f:
-            f.writelines(lines)
-            
-        df_temp = load_and_clean_data(temp_file, source_name)
-        os.remove(temp_file)
-    
+    with open(file, 'r') as f:
+        lines = f.readlines()
+
+    # Drop the header line; flaggems.txt is read as-is
+    if file.name != 'flaggems.txt' and lines and ('baseline' in lines[0].lower() or '_4090' in lines[0]):
+        lines = lines[1:]
+
+    df_temp = load_and_clean_data(lines, source_name)
+
     print(f"  Loaded {len(df_temp)} valid data points from {source_name}")
     all_data.append(df_temp)
 
 df = pd.concat(all_data, ignore_index=True)
 print(f"\nTotal data points after cleaning: {len(df)}")
 
-df['speedup'] = df['cs_time'] / df['z3_time']
+# Plain NumPy columns for the speedup and the plot below
+baseline_time = df['baseline_time'].to_numpy()
+cs_time = df['cs_time'].to_numpy()
+speedup = cs_time / df['z3_time'].to_numpy()
+df['speedup'] = speedup
 
 # Save cleaned data to TSV file
 output_file = 'cleaned_data.tsv'
@@ -98,17 +90,24 @@ fig, ax = plt.subplots(figsize=(10, 6))
 # Use a single color for all points
 point_color = '#4A90E2'  # Nice blue color
 
+# Above this many points the scatter is rasterized rather than drawn as vector markers
+RASTERIZE_MIN_POINTS = 10_000
+
 # Calculate point sizes proportional to baseline_time
 # Normalize sizes between 20 and 300 for better visualization
-min_baseline = df['baseline_time'].min()
-max_baseline = df['baseline_time'].max()
+min_baseline = baseline_time.min()
+max_baseline = baseline_time.max()
 
 # Plot all points with the same color
 # Scale point sizes based on baseline_time
-sizes = 20 + 280 * (df['baseline_time'] - min_baseline) / (max_baseline - min_baseline)
-ax.scatter(df['cs_time'], df['speedup'], 
+with np.errstate(divide='ignore', invalid='ignore'):
+    sizes = 20 + 280 * (baseline_time - min_baseline) / (max_baseline - min_baseline)
+# Large point clouds are stamped into the PDF as one 600 dpi raster layer;
+# axes, labels and smaller plots stay vector
+ax.scatter(cs_time, speedup, 
           alpha=0.6, s=sizes, 
-          color=point_color)
+          color=point_color,
+          rasterized=len(cs_time) > RASTERIZE_MIN_POINTS)
 
 ax.set_xscale('log')
 
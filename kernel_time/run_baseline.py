@@ -22,7 +22,7 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from utils.test_registry import REPO_CONFIGS, get_configs_by_group
-from utils.misc import EASTERN_TZ
+from utils.misc import eastern_tz
 
 # Get kernel_time baseline configuration from registry
 ENV_CONFIGS = OrderedDict([
@@ -37,7 +37,7 @@ class KernelTimeBaselineRunner:
         self.project_root = self.script_dir.parent
         self.output_base_dir = self.script_dir / "results"
         self.output_base_dir.mkdir(parents=True, exist_ok=True)
-        self.timestamp = datetime.now(EASTERN_TZ).strftime("%Y%m%d_%H%M%S")
+        self.timestamp = datetime.now(eastern_tz()).strftime("%Y%m%d_%H%M%S")
         self.global_test_counter = 0
         self.total_tests = 0
         self.test_results = OrderedDict()
@@ -273,7 +273,7 @@ class KernelTimeBaselineRunner:
                 log_file.write(f"Test: {test_info['test_name']}\n")
                 log_file.write(f"Environment: {env_config_key}\n")
                 log_file.write(f"Command: {' '.join(cmd)}\n")
-                log_file.write(f"Start Time: {datetime.now(EASTERN_TZ).isoformat()}\n")
+                log_file.write(f"Start Time: {datetime.now(eastern_tz()).isoformat()}\n")
                 log_file.write("=" * 80 + "\n")
                 log_file.flush()
 
@@ -307,7 +307,7 @@ class KernelTimeBaselineRunner:
 
         with open(output_file, "a") as log_file:
             log_file.write("\n" + "=" * 80 + "\n")
-            log_file.write(f"End Time: {datetime.now(EASTERN_TZ).isoformat()}\n")
+            log_file.write(f"End Time: {datetime.now(eastern_tz()).isoformat()}\n")
             log_file.write(f"Elapsed Time: {elapsed_time:.4f} seconds\n")
             log_file.write(f"Kernel Time: {kernel_time_ms:.4f} ms ({kernel_count} kernels)\n")
             log_file.write(f"Status: {status}\n")
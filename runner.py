@@ -4,9 +4,11 @@ Test runner for Liger-Kernel, FlagGems, and TritonBench repositories.
 Version 3: Added whitelist support for selective test execution.
 """
 
+import asyncio
 import os
 import subprocess
 import json
+import mmap
 import time
 from pathlib import Path
 from datetime import datetime
@@ -14,62 +16,419 @@ import sys
 import argparse
 import csv
 import ast
-from collections import OrderedDict
+import re
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import repeat
 
 from utils.test_registry import ENV_CONFIGS, REPO_CONFIGS, get_configs_by_group
 
+# Directory of this script; prepended to PYTHONPATH so pytest can load the profiler plugin
+BASE_DIR = str(Path(__file__).parent.absolute())
+
+# Test discovery results kept across runs in the output directory; bump
+# DISCOVER_CACHE_VERSION whenever the discoverers' output changes
+DISCOVER_CACHE_NAME = ".discover_cache.json"
+DISCOVER_CACHE_VERSION = 1
+
+# Driver that runs a batch of TritonBench scripts in one Python process
+TRITONBENCH_BATCH_RUNNER = os.path.join(BASE_DIR, "utils", "tritonbench_batch_runner.py")
+
+# Triple-quoted strings, skipped whole so their lines are never read as code,
+# column-0 statements and indented defs, e.g. "class TestNorm:", "if HAS_FP8:",
+# "def test_correctness(", "    def test_backward(", "CASES = [".
+# For a class or block header, body captures the indentation of the first
+# non-blank, non-comment line after the header's last line (the first one
+# ending in ':', as a header may span lines), i.e. of its body.
+_RE_TEST_DEF = re.compile(
+    rb'(?P<string>"""(?:[^"\\]|\\[\s\S]|"(?!""))*"""|\'\'\'(?:[^\'\\]|\\[\s\S]|\'(?!\'\'))*\'\'\')'
+    rb'|^(?:(?P<block>class|if|elif|else|try|except|finally|for|while|with)\b'
+    rb'(?=(?:[^\n]*\n)*?[^\n]*:[ \t]*(?:#[^\n]*)?\n(?:[ \t]*(?:#[^\n]*)?\n)*(?P<body>[ \t]*))'
+    rb'|def[ \t]+(?P<func>\w+)|(?P<indent>[ \t]+)def[ \t]+(?P<method>\w+)[ \t]*\(|(?P<stmt>[^\s#]))',
+    re.M
+)
+
+# Section marker printed by utils/pytest_test_sections.py before each test
+# item, e.g. "[runner-test-section] test_correctness"
+_RE_TEST_SECTION = re.compile(rb'^\[runner-test-section\] (?P<function>\w+)\r?\n', re.M)
+
+# AST nodes whose bodies may hold test functions: classes, if/try/with/loop
+# blocks and except clauses. Async functions are statements too, but their
+# bodies are skipped like those of plain functions
+_AST_BLOCK_NODES = (ast.ClassDef, ast.If, ast.Try, ast.TryStar, ast.With, ast.AsyncWith,
+                    ast.For, ast.AsyncFor, ast.While, ast.ExceptHandler)
+
+# Below this many pytest files, discovery runs inline: starting the worker
+# pool costs more than scanning the files
+PARALLEL_DISCOVERY_MIN_FILES = 64
+
+
+@lru_cache(maxsize=None)
+def _resolve_executable(name, path):
+    """Resolve a bare command name against a search path once per process.
+
+    path is the PATH of the environment the command runs in, so configs that
+    set their own PATH resolve against it as the child would. Names that
+    already contain a directory, and names that are not found, are returned
+    unchanged so subprocess reports them as before.
+    """
+    if os.path.dirname(name):
+        return name
+    return shutil.which(name, path=path) or name
+
+
+@lru_cache(maxsize=None)
+def _parse_test_functions(test_file, mtime_ns):
+    """Parse a pytest file for test functions; cached per path and modification time.
+
+    Reports the test_* functions ast.walk would find, in the same
+    breadth-first order, including those under module-level if/try blocks
+    (version guards, importorskip fallbacks) and in classes. Function bodies
+    are never traversed, so helpers nested in a function are not reported.
+    """
+    test_functions = []
+
+    try:
+        with open(test_file, 'r') as f:
+            tree = ast.parse(f.read(), filename=test_file)
+
+        # Breadth-first like ast.walk, but only statements are queued and
+        # functions are not descended into
+        pending = deque([tree])
+        while pending:
+            for node in ast.iter_child_nodes(pending.popleft()):
+                if isinstance(node, ast.FunctionDef):
+                    if node.name.startswith('test_'):
+                        test_functions.append(node.name)
+                elif isinstance(node, _AST_BLOCK_NODES):
+                    pending.append(node)
+    except Exception as e:
+        print(f"Warning: Could not parse {test_file} to find test functions: {e}")
+        return None
+
+    return test_functions if test_functions else None
+
+
+@lru_cache(maxsize=None)
+def _scan_test_functions(test_file, mtime_ns):
+    """Find test functions in a pytest file by scanning its bytes; cached like _parse_test_functions.
+
+    Collects the same names in the same order as the AST parser for
+    module-level test_* functions, test_* methods of module-level classes
+    and test_* functions directly under module-level if/try/with/loop
+    blocks. Classes nested in a class or block, triple quotes inside other
+    strings or comments and tests defined dynamically are misread, so the
+    scan is only used with --fast-discovery.
+    """
+    try:
+        with open(test_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None  # mmap cannot map an empty file
+            # Scan the mapped pages in place rather than copying the file into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _collect_test_functions(data)
+    except OSError as e:
+        print(f"Warning: Could not read {test_file} to find test functions: {e}")
+        return None
+
+
+def _collect_test_functions(data):
+    """Collect the test function names matched by _RE_TEST_DEF in a bytes-like buffer.
+
+    Each name is found with the depth its def would have in the AST, and
+    names are returned ordered by depth, then position, which is the order
+    ast.walk visits them in.
+    """
+    found = []  # (depth, offset, name)
+    body_indent = None  # indentation of the current class or block body; None outside one
+    body_depth = 2  # AST depth of the statements in that body
+    chain = None  # compound statement an elif/else/except continues: "if", "try" or "loop"
+    if_depth = 2  # body depth of the latest if/elif of the current chain
+    header_end = 0  # end of the latest block header, which may span several lines
+
+    for match in _RE_TEST_DEF.finditer(data):
+        if match.group('string'):
+            continue
+        if match.group('block'):
+            # None for a header without an indented body, e.g. "class A: pass"
+            body_indent = match.group('body') or None
+            header_end = match.start('body')
+            keyword = match.group('block')
+            body_depth = 2
+            if keyword == b'class':
+                chain = None
+            elif keyword == b'if':
+                chain, if_depth = "if", 2
+            elif keyword == b'elif' and chain == "if":
+                # Each elif is an If node in the orelse of the one before it
+                if_depth += 1
+                body_depth = if_depth
+            elif keyword == b'else' and chain == "if":
+                body_depth = if_depth
+            elif keyword == b'try':
+                chain = "try"
+            elif keyword == b'except':
+                # Handler bodies sit one level below their ExceptHandler node
+                body_depth = 3
+            elif keyword in (b'for', b'while', b'with'):
+                chain = "loop"
+        elif match.group('func') is not None:
+            body_indent = chain = None
+            if match.group('func').startswith(b'test_'):
+                found.append((1, match.start(), match.group('func')))
+        elif match.group('stmt') is not None:
+            # Any other column-0 statement ends the class or block, except the
+            # closing line of a multi-line header such as "class A(\n    B,\n):"
+            if match.start() >= header_end:
+                body_indent = chain = None
+        elif body_indent is not None:
+            # Only defs directly in the body count; defs nested deeper (e.g.
+            # in a method, or a class under an if) are skipped
+            if match.group('indent') == body_indent and match.group('method').startswith(b'test_'):
+                found.append((body_depth, match.start(), match.group('method')))
+
+    found.sort()
+    return [name.decode() for _, _, name in found] or None
+
+
+def _discover(test_file, fast=False):
+    """Discover test functions in test_file; top-level so worker processes can run it."""
+    try:
+        mtime_ns = os.stat(test_file).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if fast:
+        return _scan_test_functions(str(test_file), mtime_ns)
+    return _parse_test_functions(str(test_file), mtime_ns)
+
+
+def _file_stem(file_name):
+    """Path(file_name).stem without building a Path."""
+    name = file_name.rpartition("/")[2]
+    stem, _, suffix = name.rpartition(".")
+    return stem if stem and suffix else name
+
+
+@lru_cache(maxsize=None)
+def _load_whitelist(whitelist_file, repo_name, mtime_ns):
+    """Parse a test whitelist file; cached per path, repository and modification time.
+
+    Maps each test file stem to a tuple of whitelisted test functions (empty
+    for tritonbench, which whitelists whole files). The file is read as bytes
+    in one go and only the kept lines are decoded.
+    """
+    whitelist = {}
+
+    try:
+        with open(whitelist_file, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+
+    for line in data.splitlines():
+        line = line.strip()
+        if line and not line.startswith(b"#"):
+            line = line.decode()
+            if repo_name == "tritonbench":
+                # TritonBench whitelist is just file names
+                file_name = _file_stem(line)  # Remove .py extension
+                whitelist[file_name] = []  # Empty list means run the whole file
+            elif "::" in line:
+                test_file, _, test_function = line.partition("::")
+                test_file = _file_stem(test_file)  # Remove .py extension
+                whitelist.setdefault(test_file, []).append(test_function)
+
+    if not whitelist:
+        return None
+
+    return {test_file: tuple(test_functions) for test_file, test_functions in whitelist.items()}
+
+
+def _iter_py_files(directory):
+    """Yield the paths of benchmark .py files under directory, in glob("**/*.py") order.
+
+    __pycache__ directories and dunder files are skipped while walking, and
+    entries are only turned into strings, not Path objects.
+    """
+    subdirs = []
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(".py") and not entry.name.startswith("__"):
+                yield entry.path
+
+    for subdir in subdirs:
+        yield from _iter_py_files(subdir)
+
+
+def _find_directories(paths):
+    """Map each of paths that is a directory to whether it is a symlink, keeping paths' order.
+
+    Paths are checked with one os.scandir per parent directory instead of a
+    stat per path; DirEntry.is_dir() usually answers from the directory
+    listing itself.
+    """
+    dir_entries = {}
+    found = {}
+    for path in paths:
+        parent, name = os.path.split(path.rstrip(os.sep))
+        if parent not in dir_entries:
+            try:
+                with os.scandir(parent or ".") as entries:
+                    dir_entries[parent] = {entry.name: entry.is_symlink() for entry in entries if entry.is_dir()}
+            except OSError:
+                dir_entries[parent] = {}
+        if name in dir_entries[parent]:
+            found[path] = dir_entries[parent][name]
+    return found
+
+
+async def _run_logged_command(cmd, env, cwd, log_file, timeout):
+    """Run a test command with its output sent to log_file and return its exit code.
+
+    The event loop reaps the child, so many commands can be in flight without
+    a thread or worker process each. On timeout the child is killed and
+    subprocess.TimeoutExpired is raised, as with subprocess.run.
+    """
+    # Launch the resolved executable directly instead of having the child
+    # search PATH on every test; argv[0] is left as written. Without a PATH
+    # in env the child would search os.defpath, so resolve against that
+    search_path = (os.environ if env is None else env).get("PATH", os.defpath)
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        executable=_resolve_executable(cmd[0], search_path),
+        env=env,
+        cwd=cwd,
+        stdout=log_file,
+        stderr=asyncio.subprocess.STDOUT
+    )
+    try:
+        return await asyncio.wait_for(proc.wait(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+
+def _read_junit_outcomes(junit_file):
+    """Map each test function in a JUnit XML report to (failed, total time).
+
+    Parametrized cases (test_x[...]) are folded into their function. Returns
+    an empty dict if the report is missing or cannot be parsed.
+    """
+    try:
+        root = ET.parse(junit_file).getroot()
+    except (OSError, ET.ParseError):
+        return {}
+
+    outcomes = {}
+    for case in root.iter("testcase"):
+        test_function = case.get("name", "").partition("[")[0]
+        failed, total_time = outcomes.get(test_function, (False, 0.0))
+        if case.find("failure") is not None or case.find("error") is not None:
+            failed = True
+        outcomes[test_function] = (failed, total_time + float(case.get("time", 0)))
+    return outcomes
+
+
 class TestRunner:
-    def __init__(self, output_base_dir="test_outputs"):
+    def __init__(self, output_base_dir="test_outputs", group_pytest=False, fast_discovery=False,
+                 batch_tritonbench=False):
         self.output_base_dir = Path(output_base_dir)
         self.output_base_dir.mkdir(exist_ok=True)
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.global_test_counter = 0
         self.total_tests = 0
-        self.test_results = OrderedDict()
+        self.test_results = {}
         self.test_list = []
+        self.group_pytest = group_pytest
+        self.fast_discovery = fast_discovery
+        self.batch_tritonbench = batch_tritonbench
+        self._env_cache = {}
+        self._cmd_templates = {}
+        self._progress_file = None
+        self._progress_writer = None
 
     def load_whitelist(self, whitelist_file, repo_name):
         """Load test whitelist from file."""
-        whitelist = {}
-
-        if not Path(whitelist_file).exists():
+        try:
+            mtime_ns = os.stat(whitelist_file).st_mtime_ns
+        except FileNotFoundError:
             return None
-
-        with open(whitelist_file, "r") as f:
-            lines = f.readlines()
-
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                if repo_name == "tritonbench":
-                    # TritonBench whitelist is just file names
-                    file_name = Path(line).stem  # Remove .py extension
-                    whitelist[file_name] = []  # Empty list means run the whole file
-                elif "::" in line:
-                    test_file, test_function = line.split("::")
-                    test_file = Path(test_file).stem  # Remove .py extension
-                    if test_file not in whitelist:
-                        whitelist[test_file] = []
-                    whitelist[test_file].append(test_function)
-
-        return whitelist if whitelist else None
+        return _load_whitelist(str(whitelist_file), repo_name, mtime_ns)
 
     def discover_test_functions(self, test_file):
         """Discover individual test functions in a pytest file."""
-        test_functions = []
+        return _discover(test_file, self.fast_discovery)
 
+    def discover_all_test_functions(self, test_files):
+        """Map each pytest file to its discovered test functions.
+
+        Results are kept across runs in DISCOVER_CACHE_NAME under the output
+        directory, keyed on each file's path and modification time, so only
+        new or changed files are parsed. Large lists of those are spread over
+        a process pool; results keep the order of test_files.
+        """
+        cache_file = self.output_base_dir / DISCOVER_CACHE_NAME
         try:
-            with open(test_file, 'r') as f:
-                tree = ast.parse(f.read())
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                    test_functions.append(node.name)
-        except Exception as e:
-            print(f"Warning: Could not parse {test_file} to find test functions: {e}")
-            return None
+            with open(cache_file) as f:
+                cache = json.load(f)
+            if cache.get("version") != DISCOVER_CACHE_VERSION:
+                cache = {}
+        except (OSError, ValueError):
+            cache = {}
+        cache["version"] = DISCOVER_CACHE_VERSION
+        # The two discoverers can disagree, so each has its own entries
+        entries = cache.setdefault("scan" if self.fast_discovery else "ast", {})
+
+        discovered = {}
+        stale = {}
+        for test_file in test_files:
+            try:
+                mtime_ns = os.stat(test_file).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            entry = entries.get(str(test_file))
+            if entry is not None and mtime_ns is not None and entry[0] == mtime_ns:
+                discovered[test_file] = entry[1]
+            else:
+                stale[test_file] = mtime_ns
+
+        if not stale:
+            return {f: discovered[f] for f in test_files}
+
+        if len(stale) < PARALLEL_DISCOVERY_MIN_FILES:
+            results = map(self.discover_test_functions, stale)
+            discovered.update(zip(stale, results))
+        else:
+            with ProcessPoolExecutor() as executor:
+                results = executor.map(_discover, stale, repeat(self.fast_discovery), chunksize=16)
+                discovered.update(zip(stale, results))
 
-        return test_functions if test_functions else None
+        for test_file, mtime_ns in stale.items():
+            if mtime_ns is not None:
+                entries[str(test_file)] = [mtime_ns, discovered[test_file]]
+
+        # Write via a temp file so a concurrent run never reads a partial cache
+        try:
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Warning: Could not save discovery cache {cache_file}: {e}")
+
+        return {f: discovered[f] for f in test_files}
 
     def discover_tests(self, repo_name):
         """Discover test files in a repository."""
@@ -90,10 +449,8 @@ class TestRunner:
             ]
 
             for bench_dir in benchmark_dirs:
-                if bench_dir.exists():
-                    for py_file in bench_dir.glob("**/*.py"):
-                        if "__pycache__" not in str(py_file) and not py_file.name.startswith("__"):
-                            test_files.append(py_file)
+                # Missing benchmark directories yield nothing
+                test_files.extend(map(Path, _iter_py_files(bench_dir)))
         else:
             pattern = config["test_pattern"]
             test_files = list(test_dir.glob(pattern))
@@ -102,16 +459,43 @@ class TestRunner:
 
         return test_files
 
+    def whitelisted_test_files(self, repo_name, whitelist):
+        """Resolve the files of a pytest repository's whitelist without globbing its test directory.
+
+        Files are returned in whitelist order; stems with no file are skipped.
+        """
+        config = REPO_CONFIGS[repo_name]
+        test_dir = Path(config["test_dir"])
+
+        if not test_dir.exists():
+            print(f"Warning: Test directory {test_dir} does not exist for {repo_name}")
+            return []
+
+        skip_tests = config.get("skip_tests", [])
+        test_files = []
+        for stem in whitelist:
+            test_file = test_dir / f"{stem}.py"
+            if test_file.name not in skip_tests and test_file.is_file():
+                test_files.append(test_file)
+        return test_files
+
     def prepare_test_list(self, repositories, whitelists=None):
         """Prepare a complete list of all tests to run."""
         self.test_list = []
 
         for repo in repositories:
-            test_files = self.discover_tests(repo)
             whitelist = whitelists.get(repo) if whitelists else None
+            if whitelist and repo != "tritonbench":
+                # The whitelist already names every file, so there is nothing to glob
+                test_files = self.whitelisted_test_files(repo, whitelist)
+            else:
+                test_files = self.discover_tests(repo)
 
             if whitelist:
                 print(f"Using whitelist for {repo}: {len(whitelist)} files with specific tests")
+            elif repo in ["liger_kernel", "flag_gems"]:
+                # No whitelist, discover all functions up front
+                discovered = self.discover_all_test_functions(test_files)
 
             for test_file in test_files:
                 test_file_stem = test_file.stem
@@ -139,8 +523,7 @@ class TestRunner:
                     # Skip files not in whitelist for TritonBench
                     continue
                 elif not whitelist and repo in ["liger_kernel", "flag_gems"]:
-                    # No whitelist, discover all functions
-                    test_functions = self.discover_test_functions(test_file)
+                    test_functions = discovered[test_file]
 
                     if test_functions:
                         for test_function in test_functions:
@@ -170,16 +553,80 @@ class TestRunner:
         print(f"Discovered {self.total_tests} tests across {len(repositories)} repositories")
         return self.test_list
 
-    def run_single_test(self, test_info, env_config_key):
-        """Run a single test with specific environment configuration."""
-        env_config = ENV_CONFIGS[env_config_key]
+    def _build_env(self, env_config):
+        """Build the subprocess environment for an env configuration."""
+        env = os.environ | env_config["env"]
+
+        # Add base directory to PYTHONPATH for pytest plugin
+        if "PYTHONPATH" in env:
+            env["PYTHONPATH"] = BASE_DIR + os.pathsep + env["PYTHONPATH"]
+        else:
+            env["PYTHONPATH"] = BASE_DIR
+
+        return env
+
+    def _get_env(self, env_config_key):
+        """Return the subprocess environment for an env configuration, building it once."""
+        env = self._env_cache.get(env_config_key)
+        if env is None:
+            env = self._env_cache[env_config_key] = self._build_env(ENV_CONFIGS[env_config_key])
+        return env
+
+    def _command_template(self, repo_name, env_config_key, with_function):
+        """Return the command tokens that precede a test's target, built once per combination.
+
+        They only depend on the repository, the env configuration and whether
+        a single test function is selected; the test file (or file::function)
+        is appended per test.
+        """
+        key = (repo_name, env_config_key, with_function)
+        template = self._cmd_templates.get(key)
+        if template is not None:
+            return template
+
+        config = REPO_CONFIGS[repo_name]
+        # Check if profiler should be enabled based on environment variable
+        enable_profiler = self._get_env(env_config_key).get("ENABLE_TRITON_PROFILER") == "1"
+
+        if repo_name == "tritonbench" and config.get("special_handling"):
+            if enable_profiler:
+                # Use wrapper script to enable profiling
+                wrapper_script = Path(__file__).parent / "utils" / "tritonbench_profiler_wrapper.py"
+                cmd = ["python", str(wrapper_script)]
+            else:
+                cmd = ["python"]
+        else:
+            # For pytest-based tests (Liger-Kernel, FlagGems)
+            if with_function:
+                cmd = ["pytest", "-s", "--assert=plain"]
+            else:
+                cmd = list(config["test_command_argv"])
+
+            # Add pytest plugin for Triton profiling if enabled
+            if enable_profiler and "pytest" in cmd[0]:
+                # Insert the plugin option after pytest command
+                cmd[1:1] = ["-p", "utils.pytest_triton_profiler"]
+
+        template = self._cmd_templates[key] = (*ENV_CONFIGS[env_config_key]["command_prefix_argv"], *cmd)
+        return template
+
+    async def run_single_test(self, test_info, env_config_key, test_index, env_config=None, config=None):
+        """Run a single test with specific environment configuration.
+
+        test_index is the 1-based position of the test in test_list. The
+        runner is not modified, so several tests can be awaited at once.
+        env_config and config may be passed in by callers that already hold
+        the ENV_CONFIGS and REPO_CONFIGS entries.
+        """
+        if env_config is None:
+            env_config = ENV_CONFIGS[env_config_key]
         repo_name = test_info["repository"]
         test_file = test_info["test_file"]
         test_function = test_info["test_function"]
-        config = REPO_CONFIGS[repo_name]
+        if config is None:
+            config = REPO_CONFIGS[repo_name]
 
-        self.global_test_counter += 1
-        test_number = str(self.global_test_counter).zfill(len(str(self.total_tests)))
+        test_number = str(test_index).zfill(len(str(self.total_tests)))
 
         output_dir = self.output_base_dir / env_config["group"] / env_config["name"]
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -191,99 +638,86 @@ class TestRunner:
 
         output_file = output_dir / output_filename
 
-        env = os.environ.copy()
-        env.update(env_config["env"])
-
-        # Add base directory to PYTHONPATH for pytest plugin
-        base_dir = str(Path(__file__).parent.absolute())
-        if "PYTHONPATH" in env:
-            env["PYTHONPATH"] = f"{base_dir}:{env['PYTHONPATH']}"
-        else:
-            env["PYTHONPATH"] = base_dir
+        env = self._get_env(env_config_key)
 
         if repo_name == "tritonbench" and config.get("special_handling"):
             # Use relative path from test_dir for tritonbench
-            relative_path = test_file.relative_to(Path(config["test_dir"]))
-            # Check if profiler should be enabled based on environment variable
-            if env.get("ENABLE_TRITON_PROFILER") == "1":
-                # Use wrapper script to enable profiling
-                wrapper_script = Path(__file__).parent / "utils" / "tritonbench_profiler_wrapper.py"
-                cmd = ["python", str(wrapper_script), str(relative_path)]
-            else:
-                cmd = ["python", str(relative_path)]
+            target = str(test_file.relative_to(Path(config["test_dir"])))
+        elif test_function:
+            target = f"{test_file.name}::{test_function}"
         else:
-            # For pytest-based tests (Liger-Kernel, FlagGems)
-            if test_function:
-                cmd = ["pytest", "-s", "--assert=plain", f"{test_file.name}::{test_function}"]
-            else:
-                cmd = config["test_command"].split() + [test_file.name]
-
-            # Add pytest plugin for Triton profiling if enabled
-            if env.get("ENABLE_TRITON_PROFILER") == "1" and "pytest" in cmd[0]:
-                # Insert the plugin option after pytest command
-                plugin_path = Path(__file__).parent / "utils" / "pytest_triton_profiler.py"
-                cmd.insert(1, "-p")
-                cmd.insert(2, "utils.pytest_triton_profiler")
+            target = test_file.name
 
-        command_prefix = env_config.get("command_prefix", "")
-        if command_prefix:
-            cmd = command_prefix.split() + cmd
+        cmd = [*self._command_template(repo_name, env_config_key, bool(test_function)), target]
+        command_prefix = env_config["command_prefix"]
 
         if test_function:
             test_display = f"{test_file.name}::{test_function}"
         else:
             test_display = test_file.name
 
-        print(f"  [{self.global_test_counter}/{self.total_tests}] [{repo_name}] Running: {test_display}")
+        print(f"  [{test_index}/{self.total_tests}] [{repo_name}] Running: {test_display}")
         if command_prefix:
             print(f"    Prefix: {command_prefix}")
 
-        start_time = time.time()
+        # Elapsed time comes from the monotonic clock; the wall clock is read
+        # once and only used for the Start/End timestamps in the log
+        start_wall = time.time()
+        start_time = time.monotonic()
 
+        # Header, test output and footer all go through one file handle; the
+        # child inherits the descriptor and shares its offset, so the footer
+        # lands after the test output without reopening the log. The log is
+        # binary: the child's bytes go straight to the descriptor and only the
+        # header and footer are encoded here.
         try:
-            with open(output_file, "w") as log_file:
-                log_file.write(f"Test Number: {test_number}\n")
-                log_file.write(f"Test: {test_info['test_name']}\n")
-                log_file.write(f"Environment: {env_config_key}\n")
-                log_file.write(f"Command: {' '.join(cmd)}\n")
-                log_file.write(f"Start Time: {datetime.now().isoformat()}\n")
-                log_file.write("=" * 80 + "\n")
-                log_file.flush()
-
-                result = subprocess.run(
-                    cmd,
-                    env=env,
-                    cwd=config["test_dir"],
-                    stdout=log_file,
-                    stderr=subprocess.STDOUT,
-                    timeout=300,
-                    text=True
-                )
-
-            elapsed_time = time.time() - start_time
-            success = result.returncode == 0
-            status = "PASSED" if success else "FAILED"
-            error_msg = "" if success else f"Return code: {result.returncode}"
-
-        except subprocess.TimeoutExpired:
-            elapsed_time = time.time() - start_time
-            status = "TIMEOUT"
-            error_msg = "Test exceeded 5 minute timeout"
-            success = False
-
-        except Exception as e:
-            elapsed_time = time.time() - start_time
+            log_file = open(output_file, "wb")
+        except OSError as e:
+            # Without a log there is nothing to run the test into; report it
+            # like any other error so the rest of the config still runs
             status = "ERROR"
-            error_msg = str(e)
-            success = False
-
-        with open(output_file, "a") as log_file:
-            log_file.write("\n" + "=" * 80 + "\n")
-            log_file.write(f"End Time: {datetime.now().isoformat()}\n")
-            log_file.write(f"Elapsed Time: {elapsed_time:.4f} seconds\n")
-            log_file.write(f"Status: {status}\n")
-            if error_msg:
-                log_file.write(f"Error: {error_msg}\n")
+            error_msg = f"Could not open log file: {e}"
+            elapsed_time = time.monotonic() - start_time
+        else:
+            with log_file:
+                try:
+                    log_file.write((
+                        f"Test Number: {test_number}\n"
+                        f"Test: {test_info['test_name']}\n"
+                        f"Environment: {env_config_key}\n"
+                        f"Command: {' '.join(cmd)}\n"
+                        f"Start Time: {datetime.fromtimestamp(start_wall).isoformat()}\n"
+                        + "=" * 80 + "\n"
+                    ).encode())
+                    log_file.flush()
+
+                    returncode = await _run_logged_command(cmd, env, config["test_dir"], log_file, timeout=300)
+
+                    success = returncode == 0
+                    status = "PASSED" if success else "FAILED"
+                    error_msg = "" if success else f"Return code: {returncode}"
+
+                except subprocess.TimeoutExpired:
+                    status = "TIMEOUT"
+                    error_msg = "Test exceeded 5 minute timeout"
+                    success = False
+
+                except Exception as e:
+                    status = "ERROR"
+                    error_msg = str(e)
+                    success = False
+
+                elapsed_time = time.monotonic() - start_time
+
+                footer = (
+                    "\n" + "=" * 80 + "\n"
+                    f"End Time: {datetime.fromtimestamp(start_wall + elapsed_time).isoformat()}\n"
+                    f"Elapsed Time: {elapsed_time:.4f} seconds\n"
+                    f"Status: {status}\n"
+                )
+                if error_msg:
+                    footer += f"Error: {error_msg}\n"
+                log_file.write(footer.encode())
 
         print(f"    Status: {status} ({elapsed_time:.2f}s)")
         if error_msg:
@@ -297,8 +731,359 @@ class TestRunner:
             "output_file": str(output_file)
         }
 
-    def run_all_tests(self, repositories, config_groups, whitelists=None):
-        """Run all tests with selected environment configurations."""
+    async def run_grouped_pytest(self, batch, env_config_key, env_config=None, config=None):
+        """Run several functions of one pytest file in a single pytest process.
+
+        batch is a list of (test_index, test_info) pairs that share a
+        repository and test file. Per-function status and time are read back
+        from a JUnit XML report, so the time is pytest's own time for the
+        function and excludes interpreter and import startup. The
+        utils.pytest_test_sections plugin marks where each function's output
+        starts, and the output is split at those markers into one log per
+        test in the run_single_test format. A batch may hold a single
+        function, e.g. under a command prefix, which must not wrap several
+        tests. env_config and config are optional as in run_single_test.
+        """
+        if env_config is None:
+            env_config = ENV_CONFIGS[env_config_key]
+        first_index, first_info = batch[0]
+        repo_name = first_info["repository"]
+        test_file = first_info["test_file"]
+        if config is None:
+            config = REPO_CONFIGS[repo_name]
+
+        width = len(str(self.total_tests))
+        test_numbers = [str(test_index).zfill(width) for test_index, _ in batch]
+
+        output_dir = self.output_base_dir / env_config["group"] / env_config["name"]
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        output_files = [output_dir / f"{test_number}_{repo_name}_{test_file.stem}_{test_info['test_function']}.log"
+                        for test_number, (_, test_info) in zip(test_numbers, batch)]
+
+        env = self._get_env(env_config_key)
+
+        command_prefix = env_config["command_prefix"]
+
+        if len(batch) == 1:
+            print(f"  [{first_index}/{self.total_tests}] [{repo_name}] "
+                  f"Running: {test_file.name}::{first_info['test_function']}")
+        else:
+            print(f"  [{first_index}-{batch[-1][0]}/{self.total_tests}] [{repo_name}] "
+                  f"Running {len(batch)} tests in one pytest process: {test_file.name}")
+        if command_prefix:
+            print(f"    Prefix: {command_prefix}")
+
+        returncode = None
+        batch_status = None
+        error_msg = ""
+
+        # The pytest output and JUnit report are only read back here, so they
+        # never sit next to the test logs the analyzers collect
+        with tempfile.TemporaryDirectory(prefix="grouped_pytest_") as batch_dir:
+            capture_file = Path(batch_dir) / "pytest.out"
+            junit_file = Path(batch_dir) / "junit.xml"
+
+            options = [*self._command_template(repo_name, env_config_key, True),
+                       "-p", "utils.pytest_test_sections", f"--junitxml={junit_file}"]
+            targets = [f"{test_file.name}::{test_info['test_function']}" for _, test_info in batch]
+            cmd = [*options, *targets]
+
+            start_wall = time.time()
+            start_time = time.monotonic()
+
+            with open(capture_file, "wb") as capture:
+                try:
+                    returncode = await _run_logged_command(cmd, env, config["test_dir"], capture, timeout=300)
+
+                except subprocess.TimeoutExpired:
+                    batch_status = "TIMEOUT"
+                    error_msg = "Test exceeded 5 minute timeout"
+
+                except Exception as e:
+                    batch_status = "ERROR"
+                    error_msg = str(e)
+
+            elapsed_time = time.monotonic() - start_time
+            outcomes = {} if batch_status else _read_junit_outcomes(junit_file)
+
+            with open(capture_file, "rb") as capture:
+                output = capture.read()
+
+        # Output before the first marker (collection, plugin banners) goes to
+        # the first test; each marker starts a section of the named function
+        sections = {test_info["test_function"]: [] for _, test_info in batch}
+        current = sections[first_info["test_function"]]
+        position = 0
+        for marker in _RE_TEST_SECTION.finditer(output):
+            current.append(output[position:marker.start()])
+            current = sections.get(marker.group("function").decode(), current)
+            position = marker.end()
+        current.append(output[position:])
+
+        # Each log's command names only its own target: the analyzers take the
+        # last pytest node id before a kernel timing as the test it belongs to
+        shared = f" (in one pytest process with tests {', '.join(test_numbers)})" if len(batch) > 1 else ""
+
+        results = []
+        for test_number, (_, test_info), output_file, target in zip(test_numbers, batch, output_files, targets):
+            outcome = outcomes.get(test_info["test_function"])
+            if batch_status:
+                status, test_time, test_error = batch_status, elapsed_time, error_msg
+            elif outcome is None:
+                status, test_time = "FAILED", elapsed_time
+                test_error = f"Not in pytest report (return code: {returncode})"
+            else:
+                failed, test_time = outcome
+                status = "FAILED" if failed else "PASSED"
+                test_error = "Failed in pytest report" if failed else ""
+
+            # As in run_single_test, the log is written through one file handle
+            with open(output_file, "wb") as log_file:
+                log_file.write((
+                    f"Test Number: {test_number}\n"
+                    f"Test: {test_info['test_name']}\n"
+                    f"Environment: {env_config_key}\n"
+                    f"Command: {' '.join(options)} {target}{shared}\n"
+                    f"Start Time: {datetime.fromtimestamp(start_wall).isoformat()}\n"
+                    + "=" * 80 + "\n"
+                ).encode())
+                log_file.writelines(sections[test_info["test_function"]])
+
+                footer = (
+                    "\n" + "=" * 80 + "\n"
+                    f"End Time: {datetime.fromtimestamp(start_wall + elapsed_time).isoformat()}\n"
+                    f"Elapsed Time: {test_time:.4f} seconds\n"
+                    f"Status: {status}\n"
+                )
+                if test_error:
+                    footer += f"Error: {test_error}\n"
+                log_file.write(footer.encode())
+
+            results.append({
+                "test_number": test_number,
+                "status": status,
+                "elapsed_time": test_time,
+                "error_message": test_error,
+                "output_file": str(output_file)
+            })
+
+        for (_, test_info), result_row in zip(batch, results):
+            print(f"    {test_info['test_function']}: {result_row['status']} ({result_row['elapsed_time']:.2f}s)")
+            if result_row["error_message"]:
+                print(f"    Error: {result_row['error_message']}")
+
+        return results
+
+    async def run_tritonbench_batch(self, batch, env_config_key, env_config=None, config=None):
+        """Run several TritonBench scripts in a single Python process.
+
+        batch is a list of (test_index, test_info) pairs. The scripts are run
+        one after another by utils/tritonbench_batch_runner.py, which reports
+        each script's status and time in a JSON results file, so torch and
+        triton are imported once for the whole batch. Each test still gets its
+        own log in the run_single_test format. The driver's manifest, results
+        and own output live in a temporary directory, never next to the test
+        logs the analyzers collect, and are deleted once the logs are written.
+        Scripts the driver did not finish are rerun one by one with
+        run_single_test. env_config and config are optional as in
+        run_single_test.
+        """
+        if env_config is None:
+            env_config = ENV_CONFIGS[env_config_key]
+        first_index = batch[0][0]
+        if config is None:
+            config = REPO_CONFIGS["tritonbench"]
+        test_dir = Path(config["test_dir"])
+
+        width = len(str(self.total_tests))
+        test_numbers = [str(test_index).zfill(width) for test_index, _ in batch]
+
+        output_dir = self.output_base_dir / env_config["group"] / env_config["name"]
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        output_files = [output_dir / f"{test_number}_tritonbench_{test_info['test_file'].stem}.log"
+                        for test_number, (_, test_info) in zip(test_numbers, batch)]
+
+        with tempfile.TemporaryDirectory(prefix="tritonbench_batch_") as batch_dir:
+            batch_dir = Path(batch_dir)
+            driver_log = batch_dir / "driver.out"
+            manifest_file = batch_dir / "manifest.json"
+            results_file = batch_dir / "results.json"
+            # The driver writes each script's output here; it is moved into the
+            # test's log between the header and footer afterwards
+            capture_files = [batch_dir / f"{i}.out" for i in range(len(batch))]
+
+            with open(manifest_file, "w") as f:
+                json.dump({
+                    "results": str(results_file),
+                    "timeout": 300,
+                    "tests": [
+                        # Use relative path from test_dir for tritonbench
+                        {"script": str(test_info["test_file"].relative_to(test_dir)), "output": str(capture_file)}
+                        for (_, test_info), capture_file in zip(batch, capture_files)
+                    ]
+                }, f)
+
+            env = self._get_env(env_config_key)
+
+            cmd = [*env_config["command_prefix_argv"], "python", TRITONBENCH_BATCH_RUNNER, str(manifest_file)]
+            command_prefix = env_config["command_prefix"]
+
+            print(f"  [{first_index}-{batch[-1][0]}/{self.total_tests}] [tritonbench] "
+                  f"Running {len(batch)} tests in one Python process")
+            if command_prefix:
+                print(f"    Prefix: {command_prefix}")
+
+            returncode = None
+            error_msg = ""
+
+            # Script output goes to the capture files; the driver's own
+            # progress lines only matter while the batch runs
+            with open(driver_log, "wb") as log_file:
+                try:
+                    returncode = await _run_logged_command(cmd, env, config["test_dir"], log_file,
+                                                           timeout=300 * len(batch))
+
+                except subprocess.TimeoutExpired:
+                    error_msg = "Batch exceeded its timeout"
+
+                except Exception as e:
+                    error_msg = f"Error: {e}"
+
+            try:
+                with open(results_file) as f:
+                    script_results = json.load(f)
+            except (OSError, ValueError):
+                script_results = []
+
+            # Only scripts the driver finished have results; the rest are run
+            # below in their own processes
+            finished = batch[:len(script_results)]
+
+            results = []
+            for i, (test_number, (_, test_info), script_result) in enumerate(
+                    zip(test_numbers, finished, script_results)):
+                # As in run_single_test, the log is written through one file handle
+                with open(output_files[i], "wb") as log_file:
+                    log_file.write((
+                        f"Test Number: {test_number}\n"
+                        f"Test: {test_info['test_name']}\n"
+                        f"Environment: {env_config_key}\n"
+                        f"Command: {' '.join(cmd)}\n"
+                        f"Start Time: {datetime.fromtimestamp(script_result['start_time']).isoformat()}\n"
+                        + "=" * 80 + "\n"
+                    ).encode())
+                    try:
+                        with open(capture_files[i], "rb") as capture:
+                            shutil.copyfileobj(capture, log_file)
+                    except FileNotFoundError:
+                        pass
+
+                    end_wall = script_result["start_time"] + script_result["elapsed_time"]
+                    footer = (
+                        "\n" + "=" * 80 + "\n"
+                        f"End Time: {datetime.fromtimestamp(end_wall).isoformat()}\n"
+                        f"Elapsed Time: {script_result['elapsed_time']:.4f} seconds\n"
+                        f"Status: {script_result['status']}\n"
+                    )
+                    if script_result["error_message"]:
+                        footer += f"Error: {script_result['error_message']}\n"
+                    log_file.write(footer.encode())
+
+                results.append({
+                    "test_number": test_number,
+                    "status": script_result["status"],
+                    "elapsed_time": script_result["elapsed_time"],
+                    "error_message": script_result["error_message"],
+                    "output_file": str(output_files[i])
+                })
+
+            for (_, test_info), result_row in zip(finished, results):
+                print(f"    {test_info['test_file'].name}: {result_row['status']} ({result_row['elapsed_time']:.2f}s)")
+                if result_row["error_message"]:
+                    print(f"    Error: {result_row['error_message']}")
+
+        if len(finished) < len(batch):
+            # The driver died, hung or exited early (e.g. a script called
+            # os._exit). Nothing is recorded for scripts it did not finish:
+            # each is run again on its own, as without --batch-tritonbench
+            reason = error_msg or f"return code: {returncode}"
+            print(f"    Batch stopped after {len(finished)} of {len(batch)} tests ({reason}); "
+                  f"running the rest one by one")
+            for test_index, test_info in batch[len(finished):]:
+                results.append(await self.run_single_test(test_info, env_config_key, test_index, env_config, config))
+
+        return results
+
+    def _plan_batches(self, env_config):
+        """Split test_list into batches of (test_index, test_info) that share one process.
+
+        Without --group-pytest or --batch-tritonbench every test is its own
+        batch. --group-pytest batches the whitelisted or discovered functions
+        of a pytest file together, and --batch-tritonbench batches all
+        TritonBench scripts. Neither applies to configurations with a command
+        prefix (/usr/bin/time -v, a sanitizer): it would wrap the whole batch,
+        so per-test logs would lose its report, e.g. the maximum resident set
+        size, sanitizer state would carry over from one test to the next, and
+        under compute-sanitizer one test's fault would take down the others.
+        """
+        indexed = list(enumerate(self.test_list, 1))
+        if not (self.group_pytest or self.batch_tritonbench) or env_config["command_prefix_argv"]:
+            return [[entry] for entry in indexed]
+
+        batches = {}
+        for test_index, test_info in indexed:
+            if test_info["repository"] == "tritonbench":
+                key = "tritonbench" if self.batch_tritonbench else test_index
+            elif self.group_pytest and test_info["test_function"]:
+                key = (test_info["repository"], test_info["test_file"])
+            else:
+                key = test_index
+            batches.setdefault(key, []).append((test_index, test_info))
+        return list(batches.values())
+
+    async def _run_batch(self, batch, env_config_key, env_config):
+        """Run one batch from _plan_batches and return its results in batch order."""
+        test_index, test_info = batch[0]
+        repo_name = test_info["repository"]
+        # A batch never spans repositories, so its config is looked up once
+        config = REPO_CONFIGS[repo_name]
+        if repo_name == "tritonbench":
+            if len(batch) == 1:
+                return [await self.run_single_test(test_info, env_config_key, test_index, env_config, config)]
+            return await self.run_tritonbench_batch(batch, env_config_key, env_config, config)
+        if self.group_pytest and test_info["test_function"]:
+            # Single functions (a file with one selected function, or any test
+            # of a configuration with a command prefix) also go through pytest's
+            # report, so every configuration records the same kind of time
+            return await self.run_grouped_pytest(batch, env_config_key, env_config, config)
+        return [await self.run_single_test(test_info, env_config_key, test_index, env_config, config)]
+
+    async def _run_batches(self, batches, env_config_key, env_config, jobs):
+        """Run batches with at most jobs of them in flight, recording each as it finishes."""
+        # The semaphore admits waiting batches in order, so jobs=1 runs the
+        # tests one after another exactly as listed
+        semaphore = asyncio.Semaphore(jobs)
+
+        async def run(batch):
+            async with semaphore:
+                results = await self._run_batch(batch, env_config_key, env_config)
+            # Everything runs on the event loop thread, so recording needs no lock
+            for (_, test_info), result in zip(batch, results):
+                self._record_result(test_info, env_config_key, result)
+
+        await asyncio.gather(*(run(batch) for batch in batches))
+
+    def run_all_tests(self, repositories, config_groups, whitelists=None, jobs=1):
+        """Run all tests with selected environment configurations.
+
+        Args:
+            repositories: List of repository names to test
+            config_groups: Configuration groups to run
+            whitelists: Optional dict of whitelists per repository
+            jobs: Number of tests to run concurrently (1 keeps the GPU exclusive)
+        """
         self.prepare_test_list(repositories, whitelists)
 
         if not self.test_list:
@@ -313,60 +1098,78 @@ class TestRunner:
                 "test_function": test_info["test_function"] or ""
             }
 
-        selected_configs = OrderedDict()
+        selected_configs = {}
         for group in config_groups:
             if group == "all":
                 selected_configs = ENV_CONFIGS
                 break
             else:
-                for key, config in ENV_CONFIGS.items():
-                    if config["group"] == group:
-                        selected_configs[key] = config
+                selected_configs.update(get_configs_by_group(group))
 
         print(f"\nRunning tests with {len(selected_configs)} configurations")
         print("=" * 60)
 
-        for env_key, env_config in selected_configs.items():
-            print(f"\nConfiguration: [{env_key}] {env_config['description']}")
-            print("-" * 50)
-
-            self.global_test_counter = 0
-
-            for test_info in self.test_list:
-                result = self.run_single_test(test_info, env_key)
-
-                test_name = test_info["test_name"]
-                if self.test_results[test_name]["test_number"] is None:
-                    self.test_results[test_name]["test_number"] = result["test_number"]
+        # Every finished test is also appended to a long-form progress CSV
+        # (one row per test and configuration) and flushed, so completed
+        # results survive a crash or Ctrl-C before save_results_csv runs
+        progress_file = self.output_base_dir / f"results_{self.timestamp}_progress.csv"
+        with open(progress_file, "w", newline="") as f:
+            self._progress_file = f
+            self._progress_writer = csv.writer(f)
+            self._progress_writer.writerow(["Test_Number", "Test_Name", "Environment", "Result"])
+            f.flush()
+
+            try:
+                # Tests of a configuration run as subprocesses driven by one
+                # event loop, at most jobs at a time
+                for env_key, env_config in selected_configs.items():
+                    print(f"\nConfiguration: [{env_key}] {env_config['description']}")
+                    print("-" * 50)
+
+                    batches = self._plan_batches(env_config)
+                    asyncio.run(self._run_batches(batches, env_key, env_config, jobs))
+            finally:
+                self._progress_file = self._progress_writer = None
+
+    def _record_result(self, test_info, env_key, result):
+        """Store the outcome of one test run in test_results and the progress CSV."""
+        test_name = test_info["test_name"]
+        if self.test_results[test_name]["test_number"] is None:
+            self.test_results[test_name]["test_number"] = result["test_number"]
+
+        if result["status"] == "PASSED":
+            value = self.test_results[test_name][env_key] = result["elapsed_time"]
+        else:
+            value = self.test_results[test_name][env_key] = result["status"]
 
-                if result["status"] == "PASSED":
-                    self.test_results[test_name][env_key] = result["elapsed_time"]
-                else:
-                    self.test_results[test_name][env_key] = result["status"]
+        if self._progress_writer is not None:
+            self._progress_writer.writerow([
+                result["test_number"], test_name, env_key,
+                f"{value:.4f}" if type(value) is float else value
+            ])
+            self._progress_file.flush()
 
     def save_results_csv(self):
         """Save test results to CSV file."""
         csv_file = self.output_base_dir / f"results_{self.timestamp}.csv"
 
-        with open(csv_file, "w", newline="") as f:
-            header = ["Test_Number", "Test_Name"]
-            for env_key in ENV_CONFIGS.keys():
-                header.append(env_key)
+        env_keys = list(ENV_CONFIGS.keys())
+        header = ["Test_Number", "Test_Name", *env_keys]
+
+        # Timings are floats; anything else (status strings, "N/A") is
+        # written as-is
+        fmt = "{:.4f}".format
+        rows = [
+            [data.get("test_number", ""), test_name,
+             *(fmt(value) if type(value) is float else value
+               for value in (data.get(env_key, "N/A") for env_key in env_keys))]
+            for test_name, data in self.test_results.items()
+        ]
 
+        with open(csv_file, "w", newline="") as f:
             writer = csv.writer(f)
             writer.writerow(header)
-
-            for test_name, data in self.test_results.items():
-                row = [data.get("test_number", ""), test_name]
-
-                for env_key in ENV_CONFIGS.keys():
-                    value = data.get(env_key, "N/A")
-                    if isinstance(value, float):
-                        row.append(f"{value:.4f}")
-                    else:
-                        row.append(value)
-
-                writer.writerow(row)
+            writer.writerows(rows)
 
         print(f"\nResults saved to: {csv_file}")
         return csv_file
@@ -409,6 +1212,16 @@ class TestRunner:
                     print(f"  Error: {error}")
                 print(f"  Total Time: {total_time:.2f}s")
 
+def _positive_int(value):
+    """argparse type for counts that must be at least 1, such as --jobs."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description="Run tests for Triton repositories")
     parser.add_argument(
@@ -438,6 +1251,31 @@ def main():
         "--whitelist-repo",
         help="Repository to apply whitelist to (e.g., flag_gems)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Number of tests to run in parallel (default: 1, which keeps the GPU exclusive to one test)"
+    )
+    parser.add_argument(
+        "--group-pytest",
+        action="store_true",
+        help="Run the selected functions of each pytest file in one pytest process "
+             "(one process per function under a command prefix); in every configuration, "
+             "test function times then come from pytest's JUnit report"
+    )
+    parser.add_argument(
+        "--batch-tritonbench",
+        action="store_true",
+        help="Run the TritonBench scripts of each configuration in one Python process "
+             "(only for configurations without a command prefix)"
+    )
+    parser.add_argument(
+        "--fast-discovery",
+        action="store_true",
+        help="Find pytest test functions with a regex scan of each file instead of parsing its AST "
+             "(misses tests in classes nested under a class or block)"
+    )
     parser.add_argument(
         "--clean",
         action="store_true",
@@ -454,7 +1292,6 @@ def main():
     # Handle cleanup first
     if args.clean:
         import glob
-        import shutil
 
         print("Cleaning generated files...")
         print("=" * 60)
@@ -474,14 +1311,38 @@ def main():
 
             if response == 'y':
                 removed_count = 0
-                for dir_path in dirs_to_remove:
-                    try:
-                        if Path(dir_path).is_dir():
-                            shutil.rmtree(dir_path)
+                # Directory path -> whether it is a symlink; other matches are left alone
+                existing_dirs = _find_directories(dirs_to_remove)
+
+                if existing_dirs and os.name == "posix" and shutil.which("rm"):
+                    # One native rm removes every tree without a Python call per
+                    # file; whatever still exists afterwards was not removed.
+                    # Symlinked directories are refused, as shutil.rmtree does.
+                    real_dirs = [dir_path for dir_path, is_link in existing_dirs.items() if not is_link]
+                    result = subprocess.run(["rm", "-rf", "--", *real_dirs],
+                                            check=False, stdout=subprocess.DEVNULL)
+                    for dir_path, is_link in existing_dirs.items():
+                        if is_link:
+                            print(f"  ✗ Error removing {dir_path}: Cannot call rmtree on a symbolic link")
+                        elif os.path.lexists(dir_path):
+                            print(f"  ✗ Error removing {dir_path}: rm exited with code {result.returncode}")
+                        else:
                             print(f"  ✓ Removed: {dir_path}")
                             removed_count += 1
-                    except Exception as e:
-                        print(f"  ✗ Error removing {dir_path}: {e}")
+                elif existing_dirs:
+                    # rmtree mostly waits in unlink/rmdir with the GIL released,
+                    # so removing the directories on threads overlaps those calls
+                    with ThreadPoolExecutor(max_workers=min(32, len(existing_dirs))) as executor:
+                        futures = {executor.submit(shutil.rmtree, dir_path): dir_path
+                                   for dir_path in existing_dirs}
+                        for future in as_completed(futures):
+                            dir_path = futures[future]
+                            error = future.exception()
+                            if error is None:
+                                print(f"  ✓ Removed: {dir_path}")
+                                removed_count += 1
+                            else:
+                                print(f"  ✗ Error removing {dir_path}: {error}")
 
                 print(f"\n✓ Cleanup complete! Removed {removed_count} directories.")
             else:
@@ -510,26 +1371,22 @@ def main():
             whitelists[args.whitelist_repo] = whitelist
             print(f"Loaded whitelist for {args.whitelist_repo} from {args.whitelist}")
 
-    # Auto-load whitelists if they exist
-    if Path("utils/liger_kernel_whitelist.txt").exists() and "liger_kernel" in repos:
-        whitelist = runner_temp.load_whitelist("utils/liger_kernel_whitelist.txt", "liger_kernel")
-        if whitelist and "liger_kernel" not in whitelists:
-            whitelists["liger_kernel"] = whitelist
-            print(f"Auto-loaded whitelist for liger_kernel (27 tests)")
-
-    if Path("utils/flag_gems_whitelist.txt").exists() and "flag_gems" in repos:
-        whitelist = runner_temp.load_whitelist("utils/flag_gems_whitelist.txt", "flag_gems")
-        if whitelist and "flag_gems" not in whitelists:
-            whitelists["flag_gems"] = whitelist
-            print(f"Auto-loaded whitelist for flag_gems (20 tests)")
-
-    if Path("utils/tritonbench_whitelist.txt").exists() and "tritonbench" in repos:
-        whitelist = runner_temp.load_whitelist("utils/tritonbench_whitelist.txt", "tritonbench")
-        if whitelist and "tritonbench" not in whitelists:
-            whitelists["tritonbench"] = whitelist
-            print(f"Auto-loaded whitelist for tritonbench (64 files)")
+    # Auto-load each repository's whitelist_file if it exists; load_whitelist
+    # returns None for a missing file, so there is no separate existence check
+    for repo in repos:
+        whitelist_file = REPO_CONFIGS[repo].get("whitelist_file")
+        if not whitelist_file or repo in whitelists:
+            continue
+        whitelist = runner_temp.load_whitelist(whitelist_file, repo)
+        if whitelist:
+            whitelists[repo] = whitelist
+            if repo == "tritonbench":
+                print(f"Auto-loaded whitelist for {repo} ({len(whitelist)} files)")
+            else:
+                print(f"Auto-loaded whitelist for {repo} ({sum(map(len, whitelist.values()))} tests)")
 
-    runner = TestRunner(output_base_dir=args.output_dir)
+    runner = TestRunner(output_base_dir=args.output_dir, group_pytest=args.group_pytest,
+                        fast_discovery=args.fast_discovery, batch_tritonbench=args.batch_tritonbench)
 
     print(f"Starting test run")
     print(f"Output directory: {args.output_dir}")
@@ -538,7 +1395,7 @@ def main():
     if whitelists:
         print(f"Using whitelist for: {', '.join(whitelists.keys())}")
 
-    runner.run_all_tests(repos, config_groups, whitelists)
+    runner.run_all_tests(repos, config_groups, whitelists, jobs=args.jobs)
     runner.save_results_csv()
     runner.print_summary()
 
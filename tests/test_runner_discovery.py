@@ -0,0 +1,141 @@
+"""
+Tests for runner.py test discovery: the --fast-discovery regex scan must
+report the same test functions, in the same order, as the default AST parser.
+
+Usage:
+    python -m pytest tests/test_runner_discovery.py
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from runner import _discover
+
+# Module-level statements between a class and later functions, tests under
+# module-level if/elif/else, try/except/else and loop blocks, and column-0
+# text inside triple-quoted strings
+FIXTURE = '''"""
+Fixture module docstring
+"""
+import sys
+
+import pytest
+
+
+def test_first():
+    pass
+
+
+class TestA:
+    """Class docstring"""
+    value = 1
+
+    def test_method(self):
+        expected = """
+col-0 text in a string
+def test_in_string():
+"""
+        assert expected
+
+    def helper(self):
+        def test_nested_in_method():
+            pass
+
+
+CONSTANT = 3
+
+if sys.version_info >= (3, 8):
+    def test_guarded():
+        pass
+elif sys.platform == "win32":
+    def test_elif():
+        pass
+else:
+    def test_else():
+        pass
+
+try:
+    import numpy
+except ImportError:
+    def test_fallback():
+        pass
+else:
+    def test_with_numpy():
+        pass
+
+for _ in range(1):
+    def test_in_loop():
+        pass
+
+
+@pytest.mark.skip
+def test_decorated():
+    def test_nested_in_function():
+        pass
+
+
+class TestB(
+    object,
+):
+    def test_other(self):
+        pass
+
+
+async def test_async():
+    pass
+
+
+def test_last():
+    pass
+'''
+
+# ast.walk order: module-level functions, then class methods and functions in
+# block bodies, then elif/else and except bodies, which sit one level deeper
+EXPECTED = [
+    "test_first",
+    "test_decorated",
+    "test_last",
+    "test_method",
+    "test_guarded",
+    "test_with_numpy",
+    "test_in_loop",
+    "test_other",
+    "test_elif",
+    "test_else",
+    "test_fallback",
+]
+
+
+@pytest.fixture
+def fixture_file(tmp_path):
+    path = tmp_path / "test_fixture.py"
+    path.write_text(FIXTURE)
+    return path
+
+
+def test_ast_discovery(fixture_file):
+    assert _discover(fixture_file) == EXPECTED
+
+
+def test_fast_discovery_matches_ast(fixture_file):
+    assert _discover(fixture_file, fast=True) == _discover(fixture_file)
+
+
+def test_class_state_ends_at_column_0_statement(tmp_path):
+    # A module-level if after a class must not be read as a method of the class
+    path = tmp_path / "test_after_class.py"
+    path.write_text(
+        "class TestA:\n"
+        "    def test_method(self):\n"
+        "        pass\n"
+        "\n"
+        "FLAG = True\n"
+        "\n"
+        "if FLAG:\n"
+        "    def test_guarded():\n"
+        "        pass\n"
+    )
+    assert _discover(path, fast=True) == _discover(path) == ["test_method", "test_guarded"]
@@ -3,7 +3,18 @@
 Miscellaneous utilities for the ASPLOS-26-AE project.
 """
 
+from functools import cache
 from zoneinfo import ZoneInfo
 
-# US Eastern timezone (automatically handles DST)
-EASTERN_TZ = ZoneInfo("America/New_York")
+
+@cache
+def eastern_tz():
+    """US Eastern timezone (automatically handles DST), loaded on first use."""
+    return ZoneInfo("America/New_York")
+
+
+def __getattr__(name):
+    # EASTERN_TZ is still importable, but only reads tzdata when accessed
+    if name == "EASTERN_TZ":
+        return eastern_tz()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Pytest plugin that marks where each test function's output starts.
+
+runner.py loads it for --group-pytest, where several test functions of one
+file share a pytest process, and splits the process output at these markers
+into one log per test function.
+
+Usage:
+    pytest -s -p utils.pytest_test_sections test_file.py::test_a test_file.py::test_b
+"""
+import sys
+import pytest
+
+# Printed on a line of its own before each test item, followed by the test
+# function name (parametrized items share their function's name)
+SECTION_MARKER = "[runner-test-section] "
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Called before the setup of each test item, ahead of other plugins, so
+    fixture output already belongs to the new section.
+    """
+    sys.stdout.write(f"\n{SECTION_MARKER}{item.name.partition('[')[0]}\n")
+    sys.stdout.flush()
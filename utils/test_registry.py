@@ -3,13 +3,14 @@
 Test registry module containing environment configurations and repository settings.
 """
 
-from collections import OrderedDict
+import shlex
 from pathlib import Path
+from types import MappingProxyType
 
 # Define the environment variable combinations with meaningful names
-ENV_CONFIGS = OrderedDict([
+ENV_CONFIGS = {
     # Baseline configurations (without sanitizers)
-    ("baseline_compile_no_cache", {
+    "baseline_compile_no_cache": {
         "group": "baseline",
         "name": "compile_no_cache",
         "description": "Always compile Triton kernels, disable CUDA memory caching",
@@ -18,8 +19,8 @@ ENV_CONFIGS = OrderedDict([
             "PYTORCH_NO_CUDA_MEMORY_CACHING": "1"
         },
         "command_prefix": "/usr/bin/time -v"
-    }),
-    ("baseline_no_compile_with_cache", {
+    },
+    "baseline_no_compile_with_cache": {
         "group": "baseline",
         "name": "no_compile_with_cache",
         "description": "Use cached Triton kernels, enable CUDA memory caching",
@@ -28,8 +29,8 @@ ENV_CONFIGS = OrderedDict([
             "PYTORCH_NO_CUDA_MEMORY_CACHING": "0"
         },
         "command_prefix": "/usr/bin/time -v"
-    }),
-    ("baseline_compile_with_cache", {
+    },
+    "baseline_compile_with_cache": {
         "group": "baseline",
         "name": "compile_with_cache",
         "description": "Always compile Triton kernels, enable CUDA memory caching",
@@ -38,8 +39,8 @@ ENV_CONFIGS = OrderedDict([
             "PYTORCH_NO_CUDA_MEMORY_CACHING": "0"
         },
         "command_prefix": "/usr/bin/time -v"
-    }),
-    ("baseline_no_compile_no_cache", {
+    },
+    "baseline_no_compile_no_cache": {
         "group": "baseline",
         "name": "no_compile_no_cache",
         "description": "Use cached Triton kernels, disable CUDA memory caching",
@@ -48,9 +49,9 @@ ENV_CONFIGS = OrderedDict([
             "PYTORCH_NO_CUDA_MEMORY_CACHING": "1"
         },
         "command_prefix": "/usr/bin/time -v"
-    }),
+    },
     # Compute-sanitizer configurations
-    ("compute_sanitizer_compile_no_cache", {
+    "compute_sanitizer_compile_no_cache": {
         "group": "compute_sanitizer",
         "name": "compile_no_cache",
         "description": "Compute-sanitizer with always compile, disable CUDA caching",
@@ -59,8 +60,8 @@ ENV_CONFIGS = OrderedDict([
             "PYTORCH_NO_CUDA_MEMORY_CACHING": "1"
         },
         "command_prefix": "compute-sanitizer"
-    }),
-    ("compute_sanitizer_no_compile_with_cache", {
+    },
+    "compute_sanitizer_no_compile_with_cache": {
         "group": "compute_sanitizer",
         "name": "no_compile_with_cache",
         "description": "Compute-sanitizer with cached kernels, enable CUDA caching",
@@ -69,8 +70,8 @@ ENV_CONFIGS = OrderedDict([
             "PYTORCH_NO_CUDA_MEMORY_CACHING": "0"
         },
         "command_prefix": "compute-sanitizer"
-    }),
-    ("compute_sanitizer_compile_with_cache", {
+    },
+    "compute_sanitizer_compile_with_cache": {
         "group": "compute_sanitizer",
         "name": "compile_with_cache",
         "description": "Compute-sanitizer with always compile, enable CUDA caching",
@@ -79,8 +80,8 @@ ENV_CONFIGS = OrderedDict([
             "PYTORCH_NO_CUDA_MEMORY_CACHING": "0"
         },
         "command_prefix": "compute-sanitizer"
-    }),
-    ("compute_sanitizer_no_compile_no_cache", {
+    },
+    "compute_sanitizer_no_compile_no_cache": {
         "group": "compute_sanitizer",
         "name": "no_compile_no_cache",
         "description": "Compute-sanitizer with cached kernels, disable CUDA caching",
@@ -89,9 +90,9 @@ ENV_CONFIGS = OrderedDict([
             "PYTORCH_NO_CUDA_MEMORY_CACHING": "1"
         },
         "command_prefix": "compute-sanitizer"
-    }),
+    },
     # Triton-sanitizer configurations
-    ("triton_sanitizer_compile_no_cache", {
+    "triton_sanitizer_compile_no_cache": {
         "group": "triton_sanitizer",
         "name": "compile_no_cache",
         "description": "Triton-sanitizer with always compile, disable CUDA caching",
@@ -100,8 +101,8 @@ ENV_CONFIGS = OrderedDict([
             "PYTORCH_NO_CUDA_MEMORY_CACHING": "1"
         },
         "command_prefix": "/usr/bin/time -v triton-sanitizer"
-    }),
-    ("triton_sanitizer_no_compile_with_cache", {
+    },
+    "triton_sanitizer_no_compile_with_cache": {
         "group": "triton_sanitizer",
         "name": "no_compile_with_cache",
         "description": "Triton-sanitizer with cached kernels, enable CUDA caching",
@@ -110,8 +111,8 @@ ENV_CONFIGS = OrderedDict([
             "PYTORCH_NO_CUDA_MEMORY_CACHING": "0"
         },
         "command_prefix": "/usr/bin/time -v triton-sanitizer"
-    }),
-    ("triton_sanitizer_compile_with_cache", {
+    },
+    "triton_sanitizer_compile_with_cache": {
         "group": "triton_sanitizer",
         "name": "compile_with_cache",
         "description": "Triton-sanitizer with always compile, enable CUDA caching",
@@ -120,8 +121,8 @@ ENV_CONFIGS = OrderedDict([
             "PYTORCH_NO_CUDA_MEMORY_CACHING": "0"
         },
         "command_prefix": "/usr/bin/time -v triton-sanitizer"
-    }),
-    ("triton_sanitizer_no_compile_no_cache", {
+    },
+    "triton_sanitizer_no_compile_no_cache": {
         "group": "triton_sanitizer",
         "name": "no_compile_no_cache",
         "description": "Triton-sanitizer with cached kernels, disable CUDA caching",
@@ -130,9 +131,9 @@ ENV_CONFIGS = OrderedDict([
             "PYTORCH_NO_CUDA_MEMORY_CACHING": "1"
         },
         "command_prefix": "/usr/bin/time -v triton-sanitizer"
-    }),
+    },
     # Kernel timing configurations for pytest-based repos (Liger-Kernel, FlagGems)
-    ("kernel_time_baseline", {
+    "kernel_time_baseline": {
         "group": "kernel_time_liger_kernel",
         "name": "baseline",
         "description": "Kernel timing: Baseline (no compile, with cache)",
@@ -142,8 +143,8 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TRITON_PROFILER": "1"
         },
         "command_prefix": ""
-    }),
-    ("kernel_time_compute_sanitizer", {
+    },
+    "kernel_time_compute_sanitizer": {
         "group": "kernel_time_liger_kernel",
         "name": "compute-sanitizer",
         "description": "Kernel timing: Compute-sanitizer (no compile, with cache)",
@@ -153,8 +154,8 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TRITON_PROFILER": "1"
         },
         "command_prefix": "compute-sanitizer"
-    }),
-    ("kernel_time_triton_sanitizer", {
+    },
+    "kernel_time_triton_sanitizer": {
         "group": "kernel_time_liger_kernel",
         "name": "triton-sanitizer",
         "description": "Kernel timing: Triton-sanitizer (no compile, with cache)",
@@ -164,9 +165,9 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TIMING": "1"
         },
         "command_prefix": "triton-sanitizer"
-    }),
+    },
     # Generic kernel timing configurations for pytest-based repos
-    ("pytest_kernel_time_baseline", {
+    "pytest_kernel_time_baseline": {
         "group": "kernel_time",
         "name": "baseline",
         "description": "Kernel timing: Baseline (pytest, profiling enabled)",
@@ -176,8 +177,8 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TRITON_PROFILER": "1"
         },
         "command_prefix": ""
-    }),
-    ("pytest_kernel_time_compute_sanitizer", {
+    },
+    "pytest_kernel_time_compute_sanitizer": {
         "group": "kernel_time",
         "name": "compute-sanitizer",
         "description": "Kernel timing: Compute-sanitizer (pytest, profiling enabled)",
@@ -187,8 +188,8 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TRITON_PROFILER": "1"
         },
         "command_prefix": "compute-sanitizer"
-    }),
-    ("pytest_kernel_time_triton_sanitizer", {
+    },
+    "pytest_kernel_time_triton_sanitizer": {
         "group": "kernel_time",
         "name": "triton-sanitizer",
         "description": "Kernel timing: Triton-sanitizer (pytest, ENABLE_TIMING)",
@@ -198,9 +199,9 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TIMING": "1"
         },
         "command_prefix": "triton-sanitizer"
-    }),
+    },
     # Kernel timing configurations for TritonBench
-    ("kernel_time_tritonbench_baseline", {
+    "kernel_time_tritonbench_baseline": {
         "group": "kernel_time_tritonbench",
         "name": "baseline",
         "description": "TritonBench kernel timing: Baseline (no compile, with cache, profiling enabled)",
@@ -210,8 +211,8 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TRITON_PROFILER": "1"
         },
         "command_prefix": ""
-    }),
-    ("kernel_time_tritonbench_compute_sanitizer", {
+    },
+    "kernel_time_tritonbench_compute_sanitizer": {
         "group": "kernel_time_tritonbench",
         "name": "compute-sanitizer",
         "description": "TritonBench kernel timing: Compute-sanitizer (no compile, with cache, profiling enabled)",
@@ -221,8 +222,8 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TRITON_PROFILER": "1"
         },
         "command_prefix": "compute-sanitizer"
-    }),
-    ("kernel_time_tritonbench_triton_sanitizer", {
+    },
+    "kernel_time_tritonbench_triton_sanitizer": {
         "group": "kernel_time_tritonbench",
         "name": "triton-sanitizer",
         "description": "TritonBench kernel timing: Triton-sanitizer (no compile, with cache, profiling disabled)",
@@ -233,9 +234,9 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TIMING": "1"
         },
         "command_prefix": "triton-sanitizer"
-    }),
+    },
     # Ablation study configurations
-    ("ablation_no_cache", {
+    "ablation_no_cache": {
         "group": "ablation_studies",
         "name": "no_cache",
         "description": "Ablation study: No cache enabled (0,0,0,0)",
@@ -247,8 +248,8 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TIMING": "1"
         },
         "command_prefix": "triton-sanitizer"
-    }),
-    ("ablation_symbol_only", {
+    },
+    "ablation_symbol_only": {
         "group": "ablation_studies",
         "name": "symbol_only",
         "description": "Ablation study: Symbol cache only (1,0,0,0)",
@@ -260,8 +261,8 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TIMING": "1"
         },
         "command_prefix": "triton-sanitizer"
-    }),
-    ("ablation_symbol_loop", {
+    },
+    "ablation_symbol_loop": {
         "group": "ablation_studies",
         "name": "symbol_loop",
         "description": "Ablation study: Symbol and loop cache (1,1,0,0)",
@@ -273,8 +274,8 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TIMING": "1"
         },
         "command_prefix": "triton-sanitizer"
-    }),
-    ("ablation_symbol_loop_grid", {
+    },
+    "ablation_symbol_loop_grid": {
         "group": "ablation_studies",
         "name": "symbol_loop_grid",
         "description": "Ablation study: Symbol, loop and grid cache (1,1,1,0)",
@@ -286,8 +287,8 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TIMING": "1"
         },
         "command_prefix": "triton-sanitizer"
-    }),
-    ("ablation_all_cache", {
+    },
+    "ablation_all_cache": {
         "group": "ablation_studies",
         "name": "all_cache",
         "description": "Ablation study: All cache enabled (1,1,1,1)",
@@ -299,8 +300,14 @@ ENV_CONFIGS = OrderedDict([
             "ENABLE_TIMING": "1"
         },
         "command_prefix": "triton-sanitizer"
-    })
-])
+    }
+}
+
+# Tokenize each command prefix once so runners do not re-split it for every test,
+# and make each env read-only: runners only merge it into their subprocess env
+for _env_config in ENV_CONFIGS.values():
+    _env_config["command_prefix_argv"] = tuple(shlex.split(_env_config["command_prefix"]))
+    _env_config["env"] = MappingProxyType(_env_config["env"])
 
 # Repository configurations
 REPO_CONFIGS = {
@@ -328,6 +335,14 @@ REPO_CONFIGS = {
     }
 }
 
+for _repo_config in REPO_CONFIGS.values():
+    _repo_config["test_command_argv"] = tuple(shlex.split(_repo_config["test_command"]))
+
+# Configurations of each group, in ENV_CONFIGS order, for get_configs_by_group
+_GROUP_INDEX = {}
+for _key, _env_config in ENV_CONFIGS.items():
+    _GROUP_INDEX.setdefault(_env_config["group"], {})[_key] = _env_config
+
 # Available configuration groups
 CONFIG_GROUPS = [
     "baseline",
@@ -347,13 +362,10 @@ def get_configs_by_group(group_name):
         group_name: Name of the configuration group
 
     Returns:
-        OrderedDict of configurations belonging to the group
+        Dict of configurations belonging to the group, in ENV_CONFIGS order
     """
-    result = OrderedDict()
-    for key, config in ENV_CONFIGS.items():
-        if config["group"] == group_name:
-            result[key] = config
-    return result
+    # A copy, so callers may modify the result without touching the index
+    return dict(_GROUP_INDEX.get(group_name, ()))
 
 
 def get_whitelist_path(repo_name, project_root=None):
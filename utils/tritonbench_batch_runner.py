@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Run several TritonBench test scripts in one Python process.
+
+Usage:
+    python tritonbench_batch_runner.py <manifest.json>
+
+The manifest is a JSON object:
+    {"results": <results.json>, "timeout": <seconds per script>,
+     "tests": [{"script": <test_script.py>, "output": <output file>}, ...]}
+
+Each script runs as __main__ with its stdout and stderr (at the file
+descriptor level, so output from native code is captured too) sent to its
+output file. After every script the results file is rewritten with one
+{"status", "start_time", "elapsed_time", "error_message"} entry per finished
+script, so a crash part-way through leaves the earlier results behind.
+
+Environment Variables:
+    ENABLE_TRITON_PROFILER=1  - Enable Triton kernel timing profiler
+"""
+import sys
+import os
+import json
+import runpy
+import signal
+import time
+import traceback
+
+
+class ScriptTimeout(BaseException):
+    """Raised in a script that exceeds its timeout; not caught by its `except Exception`."""
+
+
+def _on_alarm(signum, frame):
+    raise ScriptTimeout()
+
+
+def run_script(test_script, output_file, timeout):
+    """Run one test script as __main__ and return its result entry."""
+    saved_argv = sys.argv
+    saved_path0 = sys.path[0]
+    saved_cwd = os.getcwd()
+    saved_fds = (os.dup(1), os.dup(2))
+
+    sys.argv = [test_script]
+    # As for `python <test_script>`, the script's directory comes first on sys.path
+    sys.path[0] = os.path.dirname(os.path.abspath(test_script))
+
+    start_time = time.time()
+    start = time.monotonic()
+    status, error_msg = "PASSED", ""
+
+    with open(output_file, "wb") as out:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(out.fileno(), 1)
+        os.dup2(out.fileno(), 2)
+        signal.alarm(timeout)
+        try:
+            runpy.run_path(test_script, run_name="__main__")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                status, error_msg = "FAILED", f"Return code: {e.code}"
+        except ScriptTimeout:
+            status, error_msg = "TIMEOUT", f"Test exceeded {timeout / 60:g} minute timeout"
+        except Exception as e:
+            print(f"Error running test script: {e}", file=sys.stderr)
+            traceback.print_exc()
+            status, error_msg = "FAILED", f"Error running test script: {e}"
+        finally:
+            signal.alarm(0)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+            for fd in saved_fds:
+                os.close(fd)
+            sys.argv = saved_argv
+            sys.path[0] = saved_path0
+            os.chdir(saved_cwd)
+
+    return {
+        "status": status,
+        "start_time": start_time,
+        "elapsed_time": time.monotonic() - start,
+        "error_message": error_msg
+    }
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python tritonbench_batch_runner.py <manifest.json>", file=sys.stderr)
+        sys.exit(1)
+
+    with open(sys.argv[1]) as f:
+        manifest = json.load(f)
+
+    # Check if profiling should be enabled, as in tritonbench_profiler_wrapper.py
+    if os.getenv("ENABLE_TRITON_PROFILER", "0") == "1":
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        if base_dir not in sys.path:
+            sys.path.insert(1, base_dir)
+        from utils.triton_profiler import enable_triton_kernel_timing
+        enable_triton_kernel_timing()
+
+    signal.signal(signal.SIGALRM, _on_alarm)
+
+    results_file = manifest["results"]
+    results = []
+    for test in manifest["tests"]:
+        print(f"Running: {test['script']}", flush=True)
+        results.append(run_script(test["script"], test["output"], manifest["timeout"]))
+        print(f"  {results[-1]['status']} ({results[-1]['elapsed_time']:.2f}s)", flush=True)
+
+        tmp_file = results_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(results, f)
+        os.replace(tmp_file, results_file)
+
+
+if __name__ == "__main__":
+    main()